@@ -5,19 +5,45 @@ Complete AI provider integration with Eden AI, Hugging Face, OpenRouter and test
 
 import asyncio
 import aiohttp
+import hashlib
 import json
+import sqlite3
+import threading
 import time
 import logging
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import os
 from datetime import datetime, timedelta
 
+from provider_health import ProviderHealth
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Connection pool settings for the long-lived provider sessions
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 20
+HTTP_KEEPALIVE_SECONDS = 75
+HTTP_DNS_CACHE_SECONDS = 300
+HTTP_REQUEST_TIMEOUT_SECONDS = 30
+
+# Response cache settings
+RESPONSE_CACHE_PATH = os.path.abspath(os.getenv(
+    "AI_RESPONSE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "ai_response_cache.db")
+))
+RESPONSE_CACHE_MAX_ENTRIES = 2000
+RESPONSE_CACHE_PURGE_EVERY = 500  # puts between sweeps of expired on-disk entries
+DEFAULT_CACHE_TTL_SECONDS = 3600
+
+# Micro-batching settings for text-level capabilities
+MICRO_BATCH_MAX_SIZE = 32
+MICRO_BATCH_MAX_DELAY_SECONDS = 0.005
+
 class AIProvider(Enum):
     EDEN_AI = "eden_ai"
     HUGGING_FACE = "hugging_face"
@@ -36,6 +62,27 @@ class AICapability(Enum):
     AFRICAN_LANGUAGES = "african_languages"
     BUSINESS_INTELLIGENCE = "business_intelligence"
 
+# Capabilities whose requests are collected into provider micro-batches
+BATCHABLE_CAPABILITIES = {
+    AICapability.SENTIMENT_ANALYSIS,
+    AICapability.TRANSLATION,
+    AICapability.AFRICAN_LANGUAGES,
+}
+
+# How long a cached response stays valid, by capability
+CACHE_TTL_SECONDS = {
+    AICapability.TRANSLATION: 7 * 24 * 3600,
+    AICapability.TEXT_TO_SPEECH: 7 * 24 * 3600,
+    AICapability.SENTIMENT_ANALYSIS: 24 * 3600,
+    AICapability.AFRICAN_LANGUAGES: 24 * 3600,
+    AICapability.SPEECH_TO_TEXT: 24 * 3600,
+    AICapability.IMAGE_ANALYSIS: 24 * 3600,
+    AICapability.TEXT_GENERATION: 3600,
+    AICapability.BUSINESS_INTELLIGENCE: 3600,
+    AICapability.IMAGE_GENERATION: 3600,
+    AICapability.VOICE_CLONING: 3600,
+}
+
 @dataclass
 class AIRequest:
     capability: AICapability
@@ -93,12 +140,20 @@ class CostOptimizer:
             }
         }
         
+        # Priors only; live traffic takes over through provider_health
         self.performance_metrics = {
             AIProvider.EDEN_AI: {"reliability": 0.95, "speed": 0.8},
             AIProvider.HUGGING_FACE: {"reliability": 0.90, "speed": 0.7},
             AIProvider.OPENROUTER: {"reliability": 0.93, "speed": 0.85}
         }
         
+        self.provider_health = {
+            provider: ProviderHealth(prior_error_rate=1.0 - prior["reliability"],
+                                     prior_latency_score=prior["speed"])
+            for provider, prior in self.performance_metrics.items()
+        }
+        self.observed_costs: Dict[Tuple[AIProvider, AICapability], float] = {}
+        
         self.usage_tracking = {}
         self.monthly_budgets = {
             AIProvider.EDEN_AI: 100.0,  # $100/month
@@ -115,15 +170,21 @@ class CostOptimizer:
                 continue
                 
             if request.capability in self.provider_costs.get(provider, {}):
-                cost = self.provider_costs[provider][request.capability]
-                performance = self.performance_metrics[provider]
+                health = self.provider_health[provider]
+                
+                # Skip providers whose circuit breaker is open
+                if not health.is_available():
+                    continue
+                
+                cost = self.observed_costs.get((provider, request.capability),
+                                               self.provider_costs[provider][request.capability])
                 
                 # Check budget constraints
                 current_usage = self.get_monthly_usage(provider)
                 budget_remaining = self.monthly_budgets[provider] - current_usage
                 
                 if budget_remaining > cost:
-                    score = self._calculate_provider_score(cost, performance, request)
+                    score = self._calculate_provider_score(cost, health, request)
                     available_providers.append((provider, score))
         
         if not available_providers:
@@ -131,11 +192,37 @@ class CostOptimizer:
         
         # Sort by score (higher is better)
         available_providers.sort(key=lambda x: x[1], reverse=True)
-        return available_providers[0][0]
+        provider = available_providers[0][0]
+        self.provider_health[provider].begin_request()
+        return provider
+    
+    def record_outcome(self, provider: AIProvider, capability: AICapability, latency: float,
+                       success: bool, cost: float = 0.0):
+        """Feed one live request's latency, outcome and cost back into provider scoring"""
+        health = self.provider_health.get(provider)
+        if health is None:
+            return
+        
+        if not success:
+            health.record_failure(latency)
+            if health.state == ProviderHealth.OPEN:
+                logger.warning(f"⚡ Circuit open for {provider.value}")
+            return
+        
+        health.record_success(latency, cost)
+        key = (provider, capability)
+        previous = self.observed_costs.get(key, self.provider_costs[provider].get(capability, cost))
+        self.observed_costs[key] = previous + health.alpha * (cost - previous)
     
-    def _calculate_provider_score(self, cost: float, performance: Dict, request: AIRequest) -> float:
+    def release_request(self, provider: AIProvider):
+        """Forget a request that ended without an outcome"""
+        health = self.provider_health.get(provider)
+        if health is not None:
+            health.release_probe()
+    
+    def _calculate_provider_score(self, cost: float, health: ProviderHealth, request: AIRequest) -> float:
         """Calculate provider selection score"""
-        base_score = performance["reliability"] * 0.6 + performance["speed"] * 0.4
+        base_score = health.score()
         
         # Cost factor (lower cost = higher score)
         cost_factor = 1.0 / (1.0 + cost * 100)
@@ -167,18 +254,21 @@ class CostOptimizer:
 class EdenAIClient:
     """Eden AI integration client"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv("EDEN_AI_API_KEY", "demo_key")
         self.base_url = "https://api.edenai.run/v2"
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
     
     async def process_request(self, request: AIRequest) -> AIResponse:
         """Process AI request through Eden AI"""
@@ -365,10 +455,11 @@ class EdenAIClient:
 class HuggingFaceClient:
     """Hugging Face integration client with African language specialization"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv("HUGGINGFACE_API_KEY", "demo_key")
         self.base_url = "https://api-inference.huggingface.co/models"
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         
         # African language models
         self.african_models = {
@@ -381,49 +472,126 @@ class HuggingFaceClient:
             "xh": "Helsinki-NLP/opus-mt-en-xh",  # Xhosa
             "af": "Helsinki-NLP/opus-mt-en-af",  # Afrikaans
         }
+        self.sentiment_model = "cardiffnlp/twitter-xlm-roberta-base-sentiment"  # multilingual
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
     
     async def process_request(self, request: AIRequest) -> AIResponse:
         """Process AI request through Hugging Face"""
         start_time = time.time()
         
         try:
-            if request.capability == AICapability.AFRICAN_LANGUAGES:
-                result = await self._african_language_processing(request)
-            elif request.capability == AICapability.TEXT_GENERATION:
-                result = await self._text_generation(request)
-            elif request.capability == AICapability.SENTIMENT_ANALYSIS:
-                result = await self._sentiment_analysis(request)
-            elif request.capability == AICapability.TRANSLATION:
-                result = await self._translation(request)
-            else:
-                raise ValueError(f"Unsupported capability: {request.capability}")
-            
-            processing_time = time.time() - start_time
-            
-            return AIResponse(
-                provider=AIProvider.HUGGING_FACE,
-                capability=request.capability,
-                result=result,
-                confidence=0.88,  # Good confidence for open source models
-                processing_time=processing_time,
-                cost=self._calculate_cost(request, processing_time),
-                language=request.language,
-                african_optimized=True,  # Hugging Face specialized for African languages
-                cultural_context=self._get_african_cultural_context(request.language)
-            )
+            result = await self._run_capability(request)
+            return self._build_response(request, result, time.time() - start_time)
             
         except Exception as e:
             logger.error(f"Hugging Face request failed: {e}")
             raise
     
+    def can_batch(self, request: AIRequest) -> bool:
+        """Whether the request can join a batched inference call (needs an API key and a model)"""
+        return self.api_key != "demo_key" and self._batch_model(request) is not None
+    
+    def _batch_model(self, request: AIRequest) -> Optional[str]:
+        if request.capability == AICapability.SENTIMENT_ANALYSIS:
+            return self.sentiment_model
+        if request.capability in (AICapability.TRANSLATION, AICapability.AFRICAN_LANGUAGES):
+            return self.african_models.get(request.language)
+        return None
+    
+    async def process_batch(self, requests: List[AIRequest]) -> List[Union[AIResponse, Exception]]:
+        """Process a micro-batch of requests sharing capability and language
+        
+        The inference API takes a list under "inputs" and answers with one
+        output per input, so the whole batch is a single upstream call. An
+        item whose output can't be read comes back as its exception.
+        """
+        start_time = time.time()
+        model = self._batch_model(requests[0])
+        
+        try:
+            outputs = await self._infer(model, [str(request.input_data) for request in requests])
+            if len(outputs) != len(requests):
+                raise ValueError(f"Expected {len(requests)} outputs from {model}, got {len(outputs)}")
+        except Exception as e:
+            logger.error(f"Hugging Face batch request failed: {e}")
+            return [e] * len(requests)
+        
+        processing_time = time.time() - start_time
+        responses: List[Union[AIResponse, Exception]] = []
+        for request, output in zip(requests, outputs):
+            try:
+                result = self._parse_batch_output(request, model, output)
+                responses.append(self._build_response(request, result, processing_time))
+            except Exception as e:
+                responses.append(e)
+        return responses
+    
+    async def _infer(self, model: str, inputs: List[str]) -> List[Any]:
+        """Run one inference API call over a list of inputs"""
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        payload = {"inputs": inputs, "options": {"wait_for_model": True}}
+        
+        async with self.session.post(f"{self.base_url}/{model}", headers=headers, json=payload) as response:
+            response.raise_for_status()
+            return await response.json()
+    
+    def _parse_batch_output(self, request: AIRequest, model: str, output: Any) -> Any:
+        """Turn one item of an inference API response into the capability's result"""
+        if isinstance(output, dict):
+            output = [output]
+        
+        if request.capability == AICapability.SENTIMENT_ANALYSIS:
+            scores = {item["label"].lower(): item["score"] for item in output}
+            sentiment = max(scores, key=scores.get)
+            result = {"sentiment": sentiment, "confidence": scores[sentiment], "scores": scores}
+            if request.african_context:
+                result["ubuntu_context"] = "Community-centered interpretation applied"
+            return result
+        
+        translated = output[0]["translation_text"]
+        if request.capability == AICapability.TRANSLATION:
+            return translated
+        return {
+            "processed_text": translated,
+            "model_used": model,
+            "language_confidence": 0.95,
+            "cultural_markers": self._detect_cultural_markers(str(request.input_data), request.language)
+        }
+    
+    async def _run_capability(self, request: AIRequest) -> Any:
+        if request.capability == AICapability.AFRICAN_LANGUAGES:
+            return await self._african_language_processing(request)
+        elif request.capability == AICapability.TEXT_GENERATION:
+            return await self._text_generation(request)
+        elif request.capability == AICapability.SENTIMENT_ANALYSIS:
+            return await self._sentiment_analysis(request)
+        elif request.capability == AICapability.TRANSLATION:
+            return await self._translation(request)
+        else:
+            raise ValueError(f"Unsupported capability: {request.capability}")
+    
+    def _build_response(self, request: AIRequest, result: Any, processing_time: float) -> AIResponse:
+        return AIResponse(
+            provider=AIProvider.HUGGING_FACE,
+            capability=request.capability,
+            result=result,
+            confidence=0.88,  # Good confidence for open source models
+            processing_time=processing_time,
+            cost=self._calculate_cost(request, processing_time),
+            language=request.language,
+            african_optimized=True,  # Hugging Face specialized for African languages
+            cultural_context=self._get_african_cultural_context(request.language)
+        )
+    
     async def _african_language_processing(self, request: AIRequest) -> Dict:
         """Process African language specific requests"""
         language = request.language
@@ -566,10 +734,11 @@ class HuggingFaceClient:
 class OpenRouterClient:
     """OpenRouter integration client for LLM diversity"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY", "demo_key")
         self.base_url = "https://openrouter.ai/api/v1"
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         
         # Available models with costs
         self.models = {
@@ -580,12 +749,14 @@ class OpenRouterClient:
         }
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if self._owns_session:
+            self.session = aiohttp.ClientSession()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.close()
+            self.session = None
     
     async def process_request(self, request: AIRequest) -> AIResponse:
         """Process AI request through OpenRouter"""
@@ -670,22 +841,273 @@ class OpenRouterClient:
         
         return base_cost * time_factor
 
+class AIResponseCache:
+    """Two-tier response cache: an in-process LRU in front of a SQLite store shared by workers
+    
+    The LRU lives on the event loop; SQLite reads and writes run in a worker
+    thread so a slow disk never stalls other requests.
+    """
+    
+    def __init__(self, db_path: str = RESPONSE_CACHE_PATH, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, size_bytes, response)
+        self._lock = threading.Lock()  # serializes use of the SQLite connection
+        self._connection = None
+        self._disk_enabled = db_path is not None
+        self._puts_since_purge = 0
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "bytes_saved": 0,
+            "cost_saved": 0.0,
+            "evictions": 0
+        }
+    
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        """Open the shared store on first use; disable the disk tier if it is unusable"""
+        if not self._disk_enabled:
+            return None
+        if self._connection is None:
+            try:
+                connection = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute("""
+                    CREATE TABLE IF NOT EXISTS ai_response_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        capability TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        size_bytes INTEGER NOT NULL,
+                        expires_at REAL NOT NULL
+                    )
+                """)
+                connection.commit()
+                self._connection = connection
+            except sqlite3.Error as e:
+                logger.warning(f"Shared AI response cache unavailable, using memory only: {e}")
+                self._disk_enabled = False
+        return self._connection
+    
+    @staticmethod
+    def _serialize(response: AIResponse) -> Optional[str]:
+        data = asdict(response)
+        data["provider"] = response.provider.value
+        data["capability"] = response.capability.value
+        try:
+            return json.dumps(data, ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _deserialize(payload: str) -> AIResponse:
+        data = json.loads(payload)
+        data["provider"] = AIProvider(data["provider"])
+        data["capability"] = AICapability(data["capability"])
+        return AIResponse(**data)
+    
+    async def get(self, key: str) -> Optional[AIResponse]:
+        """Return a live cached response, checking memory before the shared store"""
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, size_bytes, response = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self._record_hit("memory_hits", size_bytes, response)
+                return response
+            del self._entries[key]
+        
+        if self._disk_enabled:
+            row = await asyncio.to_thread(self._read_shared, key, now)
+            if row is not None:
+                payload, size_bytes, expires_at = row
+                response = self._deserialize(payload)
+                self._store_local(key, expires_at, size_bytes, response)
+                self._record_hit("disk_hits", size_bytes, response)
+                return response
+        
+        self.stats["misses"] += 1
+        return None
+    
+    async def put(self, key: str, response: AIResponse, ttl: float):
+        """Cache a response in both tiers for ttl seconds"""
+        expires_at = time.time() + ttl
+        payload = self._serialize(response)
+        size_bytes = len(payload.encode("utf-8")) if payload is not None else 0
+        
+        self._store_local(key, expires_at, size_bytes, response)
+        if self._disk_enabled and payload is not None:
+            await asyncio.to_thread(self._write_shared, key, response.capability.value,
+                                    payload, size_bytes, expires_at)
+    
+    def _read_shared(self, key: str, now: float) -> Optional[tuple]:
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return None
+            try:
+                return connection.execute(
+                    "SELECT payload, size_bytes, expires_at FROM ai_response_cache "
+                    "WHERE cache_key = ? AND expires_at > ?",
+                    (key, now)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Shared AI response cache read failed: {e}")
+                return None
+    
+    def _write_shared(self, key: str, capability: str, payload: str, size_bytes: int, expires_at: float):
+        with self._lock:
+            connection = self._get_connection()
+            if connection is None:
+                return
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO ai_response_cache "
+                    "(cache_key, capability, payload, size_bytes, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, capability, payload, size_bytes, expires_at)
+                )
+                self._puts_since_purge += 1
+                if self._puts_since_purge >= RESPONSE_CACHE_PURGE_EVERY:
+                    connection.execute("DELETE FROM ai_response_cache WHERE expires_at <= ?", (time.time(),))
+                    self._puts_since_purge = 0
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Shared AI response cache write failed: {e}")
+    
+    def _store_local(self, key: str, expires_at: float, size_bytes: int, response: AIResponse):
+        self._entries[key] = (expires_at, size_bytes, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+    
+    def _record_hit(self, tier: str, size_bytes: int, response: AIResponse):
+        self.stats["hits"] += 1
+        self.stats[tier] += 1
+        self.stats["bytes_saved"] += size_bytes
+        self.stats["cost_saved"] += response.cost
+    
+    def clear(self):
+        """Drop every cached response from both tiers"""
+        self._entries.clear()
+        with self._lock:
+            connection = self._get_connection()
+            if connection is not None:
+                try:
+                    connection.execute("DELETE FROM ai_response_cache")
+                    connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Shared AI response cache clear failed: {e}")
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def get_stats(self) -> Dict:
+        """Hit ratio, bytes and cost saved, and tier sizes"""
+        stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["memory_entries"] = len(self._entries)
+        stats["shared_store"] = self.db_path if self._disk_enabled else None
+        return stats
+
+class MicroBatchDispatcher:
+    """Collect same-shaped requests for a few milliseconds and send them upstream as one batch
+    
+    Only requests the provider client can batch (see HuggingFaceClient.can_batch)
+    come through here; the rest go straight to process_request.
+    """
+    
+    def __init__(self, send_batch, max_size: int = MICRO_BATCH_MAX_SIZE,
+                 max_delay: float = MICRO_BATCH_MAX_DELAY_SECONDS):
+        self._send_batch = send_batch  # async (provider, requests) -> responses, one per request
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self._pending: Dict[tuple, List[tuple]] = {}
+        self._timers: Dict[tuple, asyncio.TimerHandle] = {}
+        self._running = set()
+        self.stats = {"batches": 0, "batched_requests": 0, "largest_batch": 0}
+    
+    async def submit(self, provider: AIProvider, request: AIRequest) -> AIResponse:
+        """Queue a request and wait for its share of the batched response"""
+        loop = asyncio.get_running_loop()
+        key = (provider, request.capability, request.language,
+               request.african_context, request.cultural_adaptation)
+        future = loop.create_future()
+        
+        batch = self._pending.setdefault(key, [])
+        batch.append((request, future))
+        if len(batch) >= self.max_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.max_delay, self._flush, key)
+        
+        return await future
+    
+    def _flush(self, key: tuple):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        
+        self.stats["batches"] += 1
+        self.stats["batched_requests"] += len(batch)
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+        
+        task = asyncio.ensure_future(self._run_batch(key[0], batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+    
+    async def _run_batch(self, provider: AIProvider, batch: List[tuple]):
+        try:
+            responses = await self._send_batch(provider, [request for request, _ in batch])
+        except Exception as e:
+            responses = [e] * len(batch)
+        
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue  # caller went away
+            if isinstance(response, BaseException):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+    
+    def get_stats(self) -> Dict:
+        stats = dict(self.stats)
+        stats["average_batch_size"] = (stats["batched_requests"] / stats["batches"]
+                                       if stats["batches"] else 0.0)
+        return stats
+
 class AIEcosystemIntegrationManager:
     """Main AI Ecosystem Integration Manager"""
     
     def __init__(self):
         self.cost_optimizer = CostOptimizer()
         self.clients = {}
+        self.sessions: Dict[AIProvider, aiohttp.ClientSession] = {}
+        self._session_loop = None
+        self._retiring = set()
         self.request_queue = asyncio.Queue()
-        self.response_cache = {}
+        self.response_cache = AIResponseCache()
+        self.micro_batcher = MicroBatchDispatcher(self._send_batch)
         self.performance_metrics = {
             "total_requests": 0,
             "successful_requests": 0,
             "failed_requests": 0,
             "total_cost": 0.0,
             "average_response_time": 0.0,
-            "provider_usage": {provider.value: 0 for provider in AIProvider}
+            "provider_usage": {provider.value: 0 for provider in AIProvider},
+            "coalesced_requests": 0
         }
+        self._in_flight: Dict[str, asyncio.Future] = {}
     
     async def initialize(self):
         """Initialize AI ecosystem integration"""
@@ -704,57 +1126,179 @@ class AIEcosystemIntegrationManager:
         try:
             # Check cache first
             cache_key = self._generate_cache_key(request)
-            if cache_key in self.response_cache:
-                cached_response = self.response_cache[cache_key]
+            cached_response = await self.response_cache.get(cache_key)
+            if cached_response is not None:
                 logger.info(f"📋 Returning cached response for {request.capability}")
                 return cached_response
             
-            # Select optimal provider
-            provider = self.cost_optimizer.select_optimal_provider(request)
-            logger.info(f"🎯 Selected provider: {provider.value} for {request.capability}")
+            # Join an identical request that is already upstream
+            in_flight = self._in_flight.get(cache_key)
+            if in_flight is not None:
+                self.performance_metrics["coalesced_requests"] += 1
+                logger.info(f"🔗 Coalesced with in-flight {request.capability} request")
+                return await asyncio.shield(in_flight)
             
-            # Process request
-            response = await self._process_with_provider(provider, request)
-            
-            # Update metrics
-            self.performance_metrics["successful_requests"] += 1
-            self.performance_metrics["total_cost"] += response.cost
-            self.performance_metrics["provider_usage"][provider.value] += 1
-            
-            # Track usage for cost optimization
-            self.cost_optimizer.track_usage(provider, response.cost)
-            
-            # Cache response if appropriate
-            if request.priority in ["normal", "low"]:
-                self.response_cache[cache_key] = response
-            
-            # Update average response time
-            total_time = (self.performance_metrics["average_response_time"] * 
-                         (self.performance_metrics["successful_requests"] - 1) + 
-                         response.processing_time)
-            self.performance_metrics["average_response_time"] = total_time / self.performance_metrics["successful_requests"]
-            
-            return response
+            # The upstream call runs detached so a cancelled caller doesn't cancel it for the others
+            task = asyncio.ensure_future(self._dispatch_request(request, cache_key))
+            self._in_flight[cache_key] = task
+            task.add_done_callback(lambda done: self._finish_in_flight(cache_key, done))
+            return await asyncio.shield(task)
             
         except Exception as e:
             self.performance_metrics["failed_requests"] += 1
             logger.error(f"❌ AI request failed: {e}")
             raise
     
+    def _finish_in_flight(self, cache_key: str, task: asyncio.Future):
+        """Forget a finished upstream call"""
+        if self._in_flight.get(cache_key) is task:
+            del self._in_flight[cache_key]
+        if not task.cancelled():
+            task.exception()  # callers re-raise it; don't warn when all of them went away
+    
+    async def _dispatch_request(self, request: AIRequest, cache_key: str) -> AIResponse:
+        """Send a request upstream, record its metrics and cache the response"""
+        # Select optimal provider
+        provider = self.cost_optimizer.select_optimal_provider(request)
+        logger.info(f"🎯 Selected provider: {provider.value} for {request.capability}")
+        
+        # Process request
+        started = time.monotonic()
+        try:
+            response = await self._process_with_provider(provider, request)
+        except Exception:
+            self.cost_optimizer.record_outcome(provider, request.capability, time.monotonic() - started, False)
+            raise
+        except BaseException:
+            # Cancelled: no outcome to record, but don't hold the half-open probe
+            self.cost_optimizer.release_request(provider)
+            raise
+        self.cost_optimizer.record_outcome(provider, request.capability, time.monotonic() - started,
+                                           True, response.cost)
+        
+        # Update metrics
+        self.performance_metrics["successful_requests"] += 1
+        self.performance_metrics["total_cost"] += response.cost
+        self.performance_metrics["provider_usage"][provider.value] += 1
+        
+        # Track usage for cost optimization
+        self.cost_optimizer.track_usage(provider, response.cost)
+        
+        # Cache response if appropriate
+        if request.priority in ["normal", "low"]:
+            ttl = CACHE_TTL_SECONDS.get(request.capability, DEFAULT_CACHE_TTL_SECONDS)
+            await self.response_cache.put(cache_key, response, ttl)
+        
+        # Update average response time
+        total_time = (self.performance_metrics["average_response_time"] * 
+                     (self.performance_metrics["successful_requests"] - 1) + 
+                     response.processing_time)
+        self.performance_metrics["average_response_time"] = total_time / self.performance_metrics["successful_requests"]
+        
+        return response
+    
     async def _process_with_provider(self, provider: AIProvider, request: AIRequest) -> AIResponse:
         """Process request with specific provider"""
-        if provider == AIProvider.EDEN_AI:
-            async with EdenAIClient() as client:
-                return await client.process_request(request)
-        elif provider == AIProvider.HUGGING_FACE:
-            async with HuggingFaceClient() as client:
-                return await client.process_request(request)
-        elif provider == AIProvider.OPENROUTER:
-            async with OpenRouterClient() as client:
-                return await client.process_request(request)
-        else:
+        client = self._get_client(provider)
+        if client is None:
             # Backup/fallback processing
             return await self._fallback_processing(request)
+        if request.capability in BATCHABLE_CAPABILITIES and hasattr(client, "can_batch") and client.can_batch(request):
+            return await self.micro_batcher.submit(provider, request)
+        return await client.process_request(request)
+    
+    async def _send_batch(self, provider: AIProvider, requests: List[AIRequest]) -> List[Any]:
+        """Send one micro-batch to a provider"""
+        return await self._get_client(provider).process_batch(requests)
+    
+    def _get_client(self, provider: AIProvider):
+        """Return the provider client bound to its pooled session, creating both on first use"""
+        client_classes = {
+            AIProvider.EDEN_AI: EdenAIClient,
+            AIProvider.HUGGING_FACE: HuggingFaceClient,
+            AIProvider.OPENROUTER: OpenRouterClient
+        }
+        if provider not in client_classes:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            # Sessions are bound to the loop that created them
+            self._retire_sessions()
+            self._session_loop = loop
+        
+        session = self.sessions.get(provider)
+        if session is None or session.closed:
+            session = self._create_session()
+            self.sessions[provider] = session
+            self.clients[provider] = client_classes[provider](session=session)
+            logger.info(f"🔌 Opened pooled HTTP session for {provider.value}")
+        
+        return self.clients[provider]
+    
+    def _retire_sessions(self):
+        """Close the sessions left on a previous event loop"""
+        old_loop = self._session_loop
+        sessions = [session for session in self.sessions.values() if not session.closed]
+        self.sessions.clear()
+        self.clients.clear()
+        
+        for session in sessions:
+            if old_loop is not None and old_loop.is_running():
+                # Still serving another thread: close it there
+                asyncio.run_coroutine_threadsafe(session.close(), old_loop)
+                continue
+            # The old loop is gone, so release the connector from this one
+            connector = session.connector
+            session.detach()
+            if connector is not None:
+                task = asyncio.create_task(self._close_connector(connector))
+                self._retiring.add(task)
+                task.add_done_callback(self._retiring.discard)
+        if sessions:
+            logger.info(f"🔌 Retired {len(sessions)} pooled HTTP sessions from a previous event loop")
+    
+    @staticmethod
+    async def _close_connector(connector: aiohttp.BaseConnector):
+        """Close a connector whose event loop has already stopped"""
+        try:
+            await connector.close()
+        except RuntimeError:
+            pass  # transports on a closed loop cannot schedule their shutdown
+    
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create a keep-alive session with per-host connection limits"""
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+            ttl_dns_cache=HTTP_DNS_CACHE_SECONDS
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT_SECONDS)
+        )
+    
+    async def close(self):
+        """Close all pooled provider sessions and the shared cache store"""
+        self.response_cache.close()
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self.clients.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        if self._retiring:
+            await asyncio.gather(*self._retiring)
+        if sessions:
+            logger.info(f"🔌 Closed {len(sessions)} pooled HTTP sessions")
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
     
     async def _fallback_processing(self, request: AIRequest) -> AIResponse:
         """Fallback processing when primary providers fail"""
@@ -781,14 +1325,22 @@ class AIEcosystemIntegrationManager:
         )
     
     def _generate_cache_key(self, request: AIRequest) -> str:
-        """Generate cache key for request"""
+        """Generate a cache key that is stable across processes and restarts"""
+        if isinstance(request.input_data, (bytes, bytearray)):
+            input_digest = hashlib.sha256(request.input_data).hexdigest()
+        else:
+            input_digest = hashlib.sha256(
+                json.dumps(request.input_data, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+        
         key_data = {
             "capability": request.capability.value,
-            "input_hash": hash(str(request.input_data)),
+            "input_hash": input_digest,
             "language": request.language,
-            "african_context": request.african_context
+            "african_context": request.african_context,
+            "cultural_adaptation": request.cultural_adaptation
         }
-        return f"ai_cache_{hash(str(key_data))}"
+        return "ai_cache_" + hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
     
     async def _test_all_providers(self) -> Dict:
         """Test all AI provider connections"""
@@ -796,7 +1348,7 @@ class AIEcosystemIntegrationManager:
         
         # Test Eden AI
         try:
-            async with EdenAIClient() as client:
+            async with self._get_client(AIProvider.EDEN_AI) as client:
                 test_request = AIRequest(
                     capability=AICapability.TEXT_GENERATION,
                     input_data="Test connection",
@@ -809,7 +1361,7 @@ class AIEcosystemIntegrationManager:
         
         # Test Hugging Face
         try:
-            async with HuggingFaceClient() as client:
+            async with self._get_client(AIProvider.HUGGING_FACE) as client:
                 test_request = AIRequest(
                     capability=AICapability.AFRICAN_LANGUAGES,
                     input_data="Test connection",
@@ -822,7 +1374,7 @@ class AIEcosystemIntegrationManager:
         
         # Test OpenRouter
         try:
-            async with OpenRouterClient() as client:
+            async with self._get_client(AIProvider.OPENROUTER) as client:
                 test_request = AIRequest(
                     capability=AICapability.TEXT_GENERATION,
                     input_data="Test connection",
@@ -837,7 +1389,14 @@ class AIEcosystemIntegrationManager:
     
     def get_performance_metrics(self) -> Dict:
         """Get current performance metrics"""
-        return self.performance_metrics.copy()
+        metrics = self.performance_metrics.copy()
+        metrics["response_cache"] = self.response_cache.get_stats()
+        metrics["micro_batching"] = self.micro_batcher.get_stats()
+        metrics["provider_health"] = {
+            provider.value: health.snapshot()
+            for provider, health in self.cost_optimizer.provider_health.items()
+        }
+        return metrics
     
     def get_cost_summary(self) -> Dict:
         """Get cost summary and optimization insights"""
@@ -880,6 +1439,10 @@ async def process_ai_request(capability: str, input_data: Any, language: str = "
     response = await ai_ecosystem_manager.process_ai_request(request)
     return asdict(response)
 
+async def shutdown_ai_ecosystem():
+    """Close pooled provider connections; call from application shutdown"""
+    await ai_ecosystem_manager.close()
+
 def get_ai_performance_metrics() -> Dict:
     """Get AI ecosystem performance metrics"""
     return ai_ecosystem_manager.get_performance_metrics()
@@ -942,6 +1505,7 @@ async def test_ai_ecosystem():
     print(f"  Cost per Request: ${cost_summary['cost_per_request']:.4f}")
     print(f"  Monthly Usage: {cost_summary['monthly_usage']}")
     
+    await shutdown_ai_ecosystem()
     return True
 
 if __name__ == "__main__":
@@ -0,0 +1,119 @@
+"""
+Benchmark: indexed POS product lookup vs. scanning the catalogue
+Times voice item lookup (find_product_by_name) and similar-product suggestions
+over a synthetic market catalogue, for the original per-product scan and the
+ProductSearchIndex. Lookups use full names, local names, partial names and
+unknown items; accuracy counts lookups resolved to the intended product.
+
+Usage: python benchmarks/bench_pos_product_search.py [skus]
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+# Add management systems to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'management_systems'))
+
+from pos_management import POSManager
+
+BRANDS = ['Mama', 'Jua', 'Baraka', 'Neema', 'Amani', 'Tumaini', 'Zawadi', 'Upendo']
+GOODS = ['sugar', 'rice', 'maize flour', 'cooking oil', 'soap', 'tea leaves', 'salt',
+         'beans', 'milk', 'bread', 'matches', 'kerosene', 'sorghum', 'millet', 'cassava']
+SIZES = ['250g', '500g', '1kg', '2kg', '5kg', '10kg', '500ml', '1l', '5l', 'pack', 'bag', 'tin']
+LOCAL_WORDS = ['sukari', 'mchele', 'unga', 'mafuta', 'sabuni', 'chai', 'chumvi', 'maharage',
+               'maziwa', 'mkate', 'kiberiti', 'mafuta ya taa', 'mtama', 'uwele', 'muhogo']
+MISSING_GOODS = ['yoghurt', 'candles', 'batteries', 'sardines', 'groundnuts', 'sandals', 'charcoal']
+
+def legacy_find_product_by_name(products, name):
+    """The original lookup: first exact name, local name or shared-word hit in insertion order"""
+    name_lower = name.lower().strip()
+    for product in products:
+        if product.name.lower() == name_lower:
+            return product
+        for local_name in product.local_names.values():
+            if local_name.lower() == name_lower:
+                return product
+        if set(product.name.lower().split()) & set(name.lower().split()):
+            return product
+    return None
+
+def legacy_suggest_similar_products(products, search_term, threshold=0.7):
+    """The original suggestion scan: Jaccard over every product's names"""
+    def similarity(text1, text2):
+        words1, words2 = set(text1.split()), set(text2.split())
+        union = words1 | words2
+        return len(words1 & words2) / len(union) if union else 0.0
+
+    suggestions = []
+    search_lower = search_term.lower()
+    for product in products:
+        score = similarity(search_lower, product.name.lower())
+        for local_name in product.local_names.values():
+            score = max(score, similarity(search_lower, local_name.lower()))
+        if score > threshold:
+            suggestions.append((product.product_id, score))
+    suggestions.sort(key=lambda x: x[1], reverse=True)
+    return suggestions[:5]
+
+def build_pos(skus: int, seed: int = 5) -> POSManager:
+    rng = random.Random(seed)
+    pos = POSManager("bench_tenant")
+    for sku in range(skus):
+        good = rng.randrange(len(GOODS))
+        pos.add_product({
+            'name': f"{rng.choice(BRANDS)} {GOODS[good]} {rng.choice(SIZES)} {sku}",
+            'local_names': {'sw': f"{LOCAL_WORDS[good]} {rng.choice(BRANDS).lower()} {sku}"},
+            'category': 'food_beverage',
+            'price': 1 + sku % 50,
+            'stock_quantity': 100
+        })
+    return pos
+
+def time_per_query(func, queries):
+    """Return (mean seconds per query, results)"""
+    start = time.perf_counter()
+    results = [func(query) for query in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+def main():
+    skus = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    logging.disable(logging.INFO)
+
+    pos = build_pos(skus)
+    products = list(pos.products.values())
+    rng = random.Random(9)
+    sample = rng.sample(products, 200)
+    lookups = (
+        [(product.name, product) for product in sample[:50]] +
+        [(product.local_names['sw'], product) for product in sample[50:100]] +
+        [(' '.join(product.name.split()[1:]), product) for product in sample[100:150]] +
+        [(f"{rng.choice(MISSING_GOODS)} {rng.choice(MISSING_GOODS)}", None) for _ in range(50)]
+    )
+    queries = [query for query, _ in lookups]
+    suggestions = [' '.join(product.name.split()[:3]) for product in sample]
+
+    legacy_find, legacy_found = time_per_query(lambda q: legacy_find_product_by_name(products, q), queries)
+    indexed_find, indexed_found = time_per_query(pos.find_product_by_name, queries)
+    legacy_suggest, legacy_lists = time_per_query(lambda q: legacy_suggest_similar_products(products, q), suggestions)
+    indexed_suggest, indexed_lists = time_per_query(pos.ai_assistant.suggest_similar_products, suggestions)
+
+    def accuracy(found):
+        return sum(1 for result, (_, want) in zip(found, lookups) if result is want) / len(lookups)
+
+    mismatches = sum(
+        1 for legacy, indexed in zip(legacy_lists, indexed_lists)
+        if [pid for pid, _ in legacy] != [s['product_id'] for s in indexed]
+    )
+
+    print(f"Catalogue: {skus} SKUs, {len(pos.search_index.postings)} indexed words")
+    print(f"{'operation':<22}{'scan ms':>10}{'index ms':>10}{'speedup':>10}")
+    print(f"{'find_product_by_name':<22}{legacy_find * 1000:>10.3f}{indexed_find * 1000:>10.3f}{legacy_find / indexed_find:>9.0f}x")
+    print(f"{'suggest_similar':<22}{legacy_suggest * 1000:>10.3f}{indexed_suggest * 1000:>10.3f}{legacy_suggest / indexed_suggest:>9.0f}x")
+    print(f"Lookup accuracy: scan {accuracy(legacy_found):.0%}, index {accuracy(indexed_found):.0%}")
+    print(f"Suggestion lists differing from the scan: {mismatches}/{len(suggestions)}")
+
+if __name__ == "__main__":
+    main()
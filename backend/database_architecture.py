@@ -9,15 +9,27 @@ import json
 import logging
 import sqlite3
 import asyncio
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from collections import OrderedDict
 from enum import Enum
 import hashlib
+import time
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# Histogram bucket upper bounds for write-behind flush reporting
+FLUSH_LATENCY_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
+FLUSH_BATCH_SIZE_BUCKETS = [1, 10, 50, 100, 250, 500, 1000]
+
+# Per-minute rollup buckets, matching SQLite's UTC CURRENT_TIMESTAMP format
+ROLLUP_BUCKET_SQL = "strftime('%Y-%m-%d %H:%M:00', 'now')"
+ROLLUP_RETENTION_DAYS = 7
+
 class DataTier(Enum):
     """Data storage tiers for African infrastructure optimization"""
     CRITICAL = "critical"      # Always available, replicated
@@ -57,36 +69,257 @@ class CellularDataUnit:
         if isinstance(self.updated_at, str):
             self.updated_at = datetime.fromisoformat(self.updated_at)
 
+# Cache lifetime per data tier - critical data stays hot the longest
+TIER_CACHE_TTL_SECONDS = {
+    DataTier.CRITICAL: 3600,
+    DataTier.IMPORTANT: 1800,
+    DataTier.STANDARD: 600,
+    DataTier.ARCHIVE: 120
+}
+
+class CellularDataCache:
+    """Bounded LRU cache with per-entry TTL and a byte-size budget
+    
+    Entries live in an OrderedDict ordered by last access, so lookups,
+    insertions and evictions are all O(1). An entry is evicted when it
+    expires, or when the cache exceeds max_entries or max_bytes.
+    """
+    
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 16 * 1024 * 1024,
+                 default_ttl: float = 600):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()  # key -> (value, size_bytes, expires_at)
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[2] > time.monotonic()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value and mark it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        value, size_bytes, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key: str, value: Any, size_bytes: int, ttl: float = None):
+        """Insert or replace a value, evicting least recently used entries as needed"""
+        if key in self._entries:
+            self._remove(key)
+        
+        if size_bytes > self.max_bytes:
+            return
+        
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = (value, size_bytes, expires_at)
+        self.current_bytes += size_bytes
+        
+        while len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+    
+    def invalidate(self, key: str) -> bool:
+        """Drop a key from the cache, returning whether it was present"""
+        if key in self._entries:
+            self._remove(key)
+            self.invalidations += 1
+            return True
+        return False
+    
+    def purge_expired(self) -> int:
+        """Remove every expired entry, returning the number removed"""
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry[2] <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+    
+    def clear(self):
+        """Empty the cache without resetting its counters"""
+        self._entries.clear()
+        self.current_bytes = 0
+    
+    def _remove(self, key: str):
+        _, size_bytes, _ = self._entries.pop(key)
+        self.current_bytes -= size_bytes
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit/miss/eviction counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+
+class SQLiteConnectionPool:
+    """Single-writer, multi-reader SQLite access that keeps blocking calls off the event loop
+    
+    Writes run on one dedicated thread against one connection, matching
+    SQLite's single-writer model. Reads check a connection out of a small
+    pool and run on their own executor, so a slow analytical query neither
+    blocks the event loop nor queues behind writes. WAL journaling lets
+    readers proceed while a write transaction is open.
+    """
+    
+    def __init__(self, db_path: str, reader_count: int = 4):
+        self.db_path = db_path
+        # In-memory databases are private to a connection, so everything shares the writer
+        self.reader_count = 0 if db_path == ":memory:" else reader_count
+        self.writer = None
+        self._readers = queue.Queue()
+        self._reader_connections = []
+        self._write_executor = None
+        self._read_executor = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        connection.row_factory = sqlite3.Row
+        return connection
+    
+    def open(self):
+        """Open the writer and reader connections and their executors"""
+        self.writer = self._connect()
+        self.writer.execute("PRAGMA journal_mode=WAL")
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webwaka-db-writer")
+        
+        if self.reader_count:
+            self._read_executor = ThreadPoolExecutor(max_workers=self.reader_count,
+                                                     thread_name_prefix="webwaka-db-reader")
+            for _ in range(self.reader_count):
+                connection = self._connect()
+                self._reader_connections.append(connection)
+                self._readers.put(connection)
+    
+    async def write(self, func, *args):
+        """Run func(writer_connection, *args) on the writer thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, func, self.writer, *args)
+    
+    async def read(self, func, *args):
+        """Run func(reader_connection, *args) on a pooled reader connection"""
+        if not self.reader_count:
+            return await self.write(func, *args)
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._read_executor, self._run_read, func, args)
+    
+    def _run_read(self, func, args):
+        connection = self._readers.get()
+        try:
+            return func(connection, *args)
+        finally:
+            self._readers.put(connection)
+    
+    def drain(self):
+        """Let submitted reads and writes finish, then shut down the executors"""
+        for executor in (self._read_executor, self._write_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._read_executor = None
+        self._write_executor = None
+    
+    def close(self):
+        """Shut down the executors and close every connection"""
+        self.drain()
+        
+        for connection in self._reader_connections:
+            connection.close()
+        self._reader_connections.clear()
+        self._readers = queue.Queue()
+        
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
 class DatabaseManager:
     """Enhanced database manager with cellular architecture support"""
     
-    def __init__(self, db_path: str = "/tmp/webwaka.db"):
+    def __init__(self, db_path: str = "/tmp/webwaka.db", write_batch_size: int = 500,
+                 write_flush_interval: float = 0.5, cache_max_entries: int = 1000,
+                 cache_max_bytes: int = 16 * 1024 * 1024, reader_count: int = 4):
         self.db_path = db_path
         self.connection = None
-        self.cache = {}
+        self.pool = SQLiteConnectionPool(db_path, reader_count=reader_count)
+        self.cache = CellularDataCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
         self.sync_queue = []
+        self.write_batch_size = write_batch_size
+        self.write_flush_interval = write_flush_interval
+        self._write_behind_task = None
+        self._flush_event = None
+        self._flushes_in_progress = 0
+        self._superseded_keys = set()  # keys stored directly while a flush was out
         self.performance_metrics = {
             "queries_executed": 0,
             "cache_hits": 0,
             "cache_misses": 0,
             "sync_operations": 0,
-            "errors": 0
+            "errors": 0,
+            "batched_writes": 0,
+            "flush_latency_ms_histogram": self._empty_histogram(FLUSH_LATENCY_BUCKETS_MS),
+            "flush_batch_size_histogram": self._empty_histogram(FLUSH_BATCH_SIZE_BUCKETS)
         }
         
+    @staticmethod
+    def _empty_histogram(buckets: List[float]) -> Dict[str, int]:
+        """Create an empty bucketed histogram (non-cumulative counts per bucket)"""
+        histogram = {f"le_{bound}": 0 for bound in buckets}
+        histogram["le_inf"] = 0
+        return histogram
+    
+    def _observe(self, histogram_name: str, buckets: List[float], value: float):
+        """Record a single observation in one of the performance histograms"""
+        histogram = self.performance_metrics[histogram_name]
+        for bound in buckets:
+            if value <= bound:
+                histogram[f"le_{bound}"] += 1
+                return
+        histogram["le_inf"] += 1
+    
     async def initialize(self) -> bool:
         """Initialize database with cellular architecture tables"""
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row
+            self.pool.open()
+            self.connection = self.pool.writer
             
             # Create cellular data tables
-            await self._create_tables()
+            await self.pool.write(self._create_tables)
             
             # Initialize indexes for performance
-            await self._create_indexes()
+            await self.pool.write(self._create_indexes)
             
             # Setup triggers for data integrity
-            await self._create_triggers()
+            await self.pool.write(self._create_triggers)
             
             logger.info("Database initialized with cellular architecture")
             return True
@@ -95,11 +328,11 @@ class DatabaseManager:
             logger.error(f"Database initialization failed: {e}")
             return False
     
-    async def _create_tables(self):
+    def _create_tables(self, connection: sqlite3.Connection):
         """Create all necessary tables for cellular architecture"""
         
         # Main cellular data table
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS cellular_data (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 cell_id TEXT NOT NULL,
@@ -120,7 +353,7 @@ class DatabaseManager:
         """)
         
         # Management systems data
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS management_systems (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 system_type TEXT NOT NULL,
@@ -134,7 +367,7 @@ class DatabaseManager:
         """)
         
         # User data with African cultural context
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id TEXT UNIQUE NOT NULL,
@@ -152,7 +385,7 @@ class DatabaseManager:
         """)
         
         # Voice commands and interactions
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS voice_interactions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 user_id TEXT NOT NULL,
@@ -169,7 +402,7 @@ class DatabaseManager:
         """)
         
         # AI provider usage tracking
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS ai_usage (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 provider_name TEXT NOT NULL,
@@ -184,7 +417,7 @@ class DatabaseManager:
         """)
         
         # Performance metrics
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS performance_metrics (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 metric_type TEXT NOT NULL,
@@ -197,7 +430,7 @@ class DatabaseManager:
         """)
         
         # Sync operations for offline-first architecture
-        self.connection.execute("""
+        connection.execute("""
             CREATE TABLE IF NOT EXISTS sync_operations (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 operation_type TEXT NOT NULL,
@@ -211,10 +444,81 @@ class DatabaseManager:
             )
         """)
         
-        self.connection.commit()
+        # Per-minute rollups maintained at insert time so dashboards never scan raw events
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS ai_usage_rollup_minute (
+                bucket TEXT NOT NULL,
+                provider_name TEXT NOT NULL,
+                operations INTEGER NOT NULL DEFAULT 0,
+                total_tokens INTEGER NOT NULL DEFAULT 0,
+                total_cost_usd REAL NOT NULL DEFAULT 0,
+                total_response_time_ms INTEGER NOT NULL DEFAULT 0,
+                response_time_samples INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, provider_name)
+            )
+        """)
+        
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS voice_interaction_rollup_minute (
+                bucket TEXT NOT NULL,
+                language TEXT NOT NULL,
+                interactions INTEGER NOT NULL DEFAULT 0,
+                confidence_sum REAL NOT NULL DEFAULT 0,
+                confidence_samples INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, language)
+            )
+        """)
+        
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS performance_metric_rollup_minute (
+                bucket TEXT NOT NULL,
+                metric_type TEXT NOT NULL,
+                metric_name TEXT NOT NULL,
+                samples INTEGER NOT NULL DEFAULT 0,
+                value_sum REAL NOT NULL DEFAULT 0,
+                value_min REAL,
+                value_max REAL,
+                PRIMARY KEY (bucket, metric_type, metric_name)
+            )
+        """)
+        
+        self._backfill_rollups(connection)
+        
+        connection.commit()
         logger.info("All cellular architecture tables created successfully")
     
-    async def _create_indexes(self):
+    def _backfill_rollups(self, connection: sqlite3.Connection):
+        """Seed empty rollup tables from raw events recorded before rollups existed"""
+        backfills = {
+            "ai_usage_rollup_minute": """
+                INSERT INTO ai_usage_rollup_minute
+                SELECT strftime('%Y-%m-%d %H:%M:00', created_at), provider_name, COUNT(*),
+                       COALESCE(SUM(tokens_used), 0), COALESCE(SUM(cost_usd), 0),
+                       COALESCE(SUM(response_time_ms), 0), COUNT(response_time_ms)
+                FROM ai_usage WHERE created_at > datetime('now', ?)
+                GROUP BY 1, provider_name
+            """,
+            "voice_interaction_rollup_minute": """
+                INSERT INTO voice_interaction_rollup_minute
+                SELECT strftime('%Y-%m-%d %H:%M:00', created_at), language, COUNT(*),
+                       COALESCE(SUM(confidence_score), 0), COUNT(confidence_score)
+                FROM voice_interactions WHERE created_at > datetime('now', ?)
+                GROUP BY 1, language
+            """,
+            "performance_metric_rollup_minute": """
+                INSERT INTO performance_metric_rollup_minute
+                SELECT strftime('%Y-%m-%d %H:%M:00', recorded_at), metric_type, metric_name,
+                       COUNT(*), SUM(value), MIN(value), MAX(value)
+                FROM performance_metrics WHERE recorded_at > datetime('now', ?)
+                GROUP BY 1, metric_type, metric_name
+            """
+        }
+        
+        for table, backfill_sql in backfills.items():
+            if connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is None:
+                connection.execute(backfill_sql, (f"-{ROLLUP_RETENTION_DAYS} days",))
+    
+    def _create_indexes(self, connection: sqlite3.Connection):
         """Create performance indexes"""
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_cellular_data_cell_id ON cellular_data(cell_id)",
@@ -231,16 +535,16 @@ class DatabaseManager:
         ]
         
         for index_sql in indexes:
-            self.connection.execute(index_sql)
+            connection.execute(index_sql)
         
-        self.connection.commit()
+        connection.commit()
         logger.info("Performance indexes created successfully")
     
-    async def _create_triggers(self):
+    def _create_triggers(self, connection: sqlite3.Connection):
         """Create triggers for data integrity and automatic updates"""
         
         # Auto-update timestamp trigger
-        self.connection.execute("""
+        connection.execute("""
             CREATE TRIGGER IF NOT EXISTS update_cellular_data_timestamp 
             AFTER UPDATE ON cellular_data
             BEGIN
@@ -250,7 +554,7 @@ class DatabaseManager:
         """)
         
         # Version increment trigger
-        self.connection.execute("""
+        connection.execute("""
             CREATE TRIGGER IF NOT EXISTS increment_cellular_data_version 
             AFTER UPDATE ON cellular_data
             BEGIN
@@ -259,44 +563,73 @@ class DatabaseManager:
             END
         """)
         
-        self.connection.commit()
+        connection.commit()
         logger.info("Database triggers created successfully")
     
+    @staticmethod
+    def _cache_key(data_unit: CellularDataUnit) -> str:
+        """Build the cache key for a cellular data unit"""
+        return f"{data_unit.system_id}:{data_unit.organ_id}:{data_unit.tissue_id}:{data_unit.cell_id}"
+    
+    def _cache_data_unit(self, data_unit: CellularDataUnit, content_size: int):
+        """Put a data unit in the cache with its tier's TTL"""
+        self.cache.put(self._cache_key(data_unit), data_unit, content_size,
+                       ttl=TIER_CACHE_TTL_SECONDS.get(data_unit.tier))
+    
+    @staticmethod
+    def _serialize_cellular_data(data_unit: CellularDataUnit) -> tuple:
+        """Serialize a cellular data unit into a cellular_data row"""
+        # Generate content hash for integrity
+        content_str = json.dumps(data_unit.content, sort_keys=True)
+        content_hash = hashlib.sha256(content_str.encode()).hexdigest()
+        
+        return (
+            data_unit.cell_id, data_unit.tissue_id, data_unit.organ_id,
+            data_unit.system_id, data_unit.data_type, content_str,
+            data_unit.tier.value, data_unit.region.value, data_unit.created_at,
+            data_unit.updated_at, data_unit.version, json.dumps(data_unit.metadata),
+            content_hash
+        )
+    
+    _UPSERT_CELLULAR_DATA_SQL = """
+        INSERT OR REPLACE INTO cellular_data 
+        (cell_id, tissue_id, organ_id, system_id, data_type, content, tier, region, 
+         created_at, updated_at, version, metadata, hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _execute_write(connection: sqlite3.Connection, sql: str, params: tuple):
+        """Execute and commit a single write statement (runs on the writer thread)"""
+        connection.execute(sql, params)
+        connection.commit()
+    
+    @staticmethod
+    def _execute_writes(connection: sqlite3.Connection, statements: List[tuple]):
+        """Execute several (sql, params) statements in one transaction (runs on the writer thread)"""
+        try:
+            for sql, params in statements:
+                connection.execute(sql, params)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+    
     async def store_cellular_data(self, data_unit: CellularDataUnit) -> bool:
         """Store cellular data unit with comprehensive validation"""
         try:
-            # Generate content hash for integrity
-            content_str = json.dumps(data_unit.content, sort_keys=True)
-            content_hash = hashlib.sha256(content_str.encode()).hexdigest()
-            
-            # Prepare data for storage
-            data_dict = asdict(data_unit)
-            data_dict['content'] = content_str
-            data_dict['metadata'] = json.dumps(data_unit.metadata)
-            data_dict['hash'] = content_hash
-            data_dict['tier'] = data_unit.tier.value
-            data_dict['region'] = data_unit.region.value
+            # A queued older copy must not overwrite this one when it flushes
+            self._supersede_pending({self._cache_key(data_unit)})
             
             # Insert or update
-            self.connection.execute("""
-                INSERT OR REPLACE INTO cellular_data 
-                (cell_id, tissue_id, organ_id, system_id, data_type, content, tier, region, 
-                 created_at, updated_at, version, metadata, hash)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data_dict['cell_id'], data_dict['tissue_id'], data_dict['organ_id'],
-                data_dict['system_id'], data_dict['data_type'], data_dict['content'],
-                data_dict['tier'], data_dict['region'], data_dict['created_at'],
-                data_dict['updated_at'], data_dict['version'], data_dict['metadata'],
-                data_dict['hash']
-            ))
-            
-            self.connection.commit()
+            await self.pool.write(self._execute_write, self._UPSERT_CELLULAR_DATA_SQL,
+                                  self._serialize_cellular_data(data_unit))
+            
             self.performance_metrics["queries_executed"] += 1
             
-            # Update cache
-            cache_key = f"{data_unit.system_id}:{data_unit.organ_id}:{data_unit.tissue_id}:{data_unit.cell_id}"
-            self.cache[cache_key] = data_unit
+            # Drop any stale cached copy; the next read repopulates it
+            cache_key = self._cache_key(data_unit)
+            self.cache.invalidate(cache_key)
             
             logger.debug(f"Stored cellular data: {cache_key}")
             return True
@@ -306,23 +639,161 @@ class DatabaseManager:
             logger.error(f"Failed to store cellular data: {e}")
             return False
     
+    def _write_cellular_batch(self, connection: sqlite3.Connection,
+                              data_units: List[CellularDataUnit]) -> float:
+        """Write a batch of units in a single transaction, returning the latency in ms"""
+        start_time = time.perf_counter()
+        rows = [self._serialize_cellular_data(unit) for unit in data_units]
+        
+        try:
+            connection.executemany(self._UPSERT_CELLULAR_DATA_SQL, rows)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        
+        return (time.perf_counter() - start_time) * 1000
+    
+    def _record_flush(self, batch_size: int, latency_ms: float):
+        """Record flush metrics for a batch written by _write_cellular_batch"""
+        self.performance_metrics["queries_executed"] += 1
+        self.performance_metrics["batched_writes"] += batch_size
+        self._observe("flush_latency_ms_histogram", FLUSH_LATENCY_BUCKETS_MS, latency_ms)
+        self._observe("flush_batch_size_histogram", FLUSH_BATCH_SIZE_BUCKETS, batch_size)
+    
+    async def store_cellular_data_many(self, data_units: List[CellularDataUnit]) -> int:
+        """Store many cellular data units in one transaction, returning the number written"""
+        if not data_units:
+            return 0
+        
+        try:
+            self._supersede_pending({self._cache_key(data_unit) for data_unit in data_units})
+            latency_ms = await self.pool.write(self._write_cellular_batch, data_units)
+            self._record_flush(len(data_units), latency_ms)
+            written = len(data_units)
+            
+            for data_unit in data_units:
+                self.cache.invalidate(self._cache_key(data_unit))
+            
+            logger.debug(f"Stored {written} cellular data units in one batch")
+            return written
+            
+        except Exception as e:
+            self.performance_metrics["errors"] += 1
+            logger.error(f"Failed to store cellular data batch: {e}")
+            return 0
+    
+    def _supersede_pending(self, keys: set):
+        """Drop queued write-behind units for keys that are being stored directly"""
+        if self.sync_queue:
+            self.sync_queue[:] = [unit for unit in self.sync_queue if self._cache_key(unit) not in keys]
+        if self._flushes_in_progress:
+            # A failed in-flight batch must not re-queue these keys either
+            self._superseded_keys.update(keys)
+    
+    async def enqueue_cellular_data(self, data_unit: CellularDataUnit):
+        """Queue a cellular data unit for write-behind storage
+        
+        The unit is visible to retrieve_cellular_data immediately through the
+        cache; it reaches SQLite on the next size- or time-triggered flush.
+        """
+        self._cache_data_unit(data_unit, len(json.dumps(data_unit.content)))
+        self.sync_queue.append(data_unit)
+        
+        if len(self.sync_queue) >= self.write_batch_size:
+            if self._flush_event is not None:
+                self._flush_event.set()
+            else:
+                await self.flush_sync_queue()
+    
+    async def flush_sync_queue(self) -> int:
+        """Flush all queued cellular data units, returning the number written"""
+        written = 0
+        while self.sync_queue:
+            batch = self.sync_queue[:self.write_batch_size]
+            del self.sync_queue[:len(batch)]
+            
+            self._flushes_in_progress += 1
+            try:
+                latency_ms = await self.pool.write(self._write_cellular_batch, batch)
+                self._record_flush(len(batch), latency_ms)
+                written += len(batch)
+                self.performance_metrics["sync_operations"] += 1
+            except Exception as e:
+                # Put the batch back so the next flush retries it, minus units stored directly since
+                self.sync_queue[:0] = [unit for unit in batch if self._cache_key(unit) not in self._superseded_keys]
+                self.performance_metrics["errors"] += 1
+                logger.error(f"Write-behind flush failed: {e}")
+                break
+            finally:
+                self._flushes_in_progress -= 1
+                if not self._flushes_in_progress:
+                    self._superseded_keys.clear()
+        
+        return written
+    
+    async def _write_behind_loop(self):
+        """Flush the sync queue whenever it fills up or the flush interval elapses"""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.write_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            await self.flush_sync_queue()
+    
+    def start_write_behind(self):
+        """Start the background write-behind flusher on the running event loop"""
+        if self._write_behind_task is None or self._write_behind_task.done():
+            self._flush_event = asyncio.Event()
+            self._write_behind_task = asyncio.get_running_loop().create_task(self._write_behind_loop())
+            logger.info("Write-behind queue started")
+    
+    async def stop_write_behind(self):
+        """Stop the background flusher and write out anything still queued"""
+        if self._write_behind_task is not None:
+            self._write_behind_task.cancel()
+            try:
+                await self._write_behind_task
+            except asyncio.CancelledError:
+                pass
+            self._write_behind_task = None
+            self._flush_event = None
+        
+        await self.flush_sync_queue()
+        logger.info("Write-behind queue stopped")
+    
+    @staticmethod
+    def _fetch_one(connection: sqlite3.Connection, sql: str, params: tuple) -> Optional[sqlite3.Row]:
+        """Run a query and fetch its first row (runs on a reader thread)"""
+        return connection.execute(sql, params).fetchone()
+    
+    @staticmethod
+    def _fetch_all(connection: sqlite3.Connection, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        """Run a query and fetch all rows (runs on a reader thread)"""
+        return connection.execute(sql, params).fetchall()
+    
     async def retrieve_cellular_data(self, cell_id: str, tissue_id: str, organ_id: str, system_id: str) -> Optional[CellularDataUnit]:
         """Retrieve cellular data with caching"""
         try:
             cache_key = f"{system_id}:{organ_id}:{tissue_id}:{cell_id}"
             
             # Check cache first
-            if cache_key in self.cache:
+            cached_unit = self.cache.get(cache_key)
+            if cached_unit is not None:
                 self.performance_metrics["cache_hits"] += 1
-                return self.cache[cache_key]
+                return cached_unit
+            
+            # Queued writes may have been evicted from the cache before flushing
+            if self.sync_queue:
+                await self.flush_sync_queue()
             
             # Query database
-            cursor = self.connection.execute("""
+            row = await self.pool.read(self._fetch_one, """
                 SELECT * FROM cellular_data 
                 WHERE cell_id = ? AND tissue_id = ? AND organ_id = ? AND system_id = ?
             """, (cell_id, tissue_id, organ_id, system_id))
             
-            row = cursor.fetchone()
             if row:
                 # Convert back to CellularDataUnit
                 data_unit = CellularDataUnit(
@@ -341,7 +812,7 @@ class DatabaseManager:
                 )
                 
                 # Update cache
-                self.cache[cache_key] = data_unit
+                self._cache_data_unit(data_unit, len(row['content']))
                 self.performance_metrics["cache_misses"] += 1
                 self.performance_metrics["queries_executed"] += 1
                 
@@ -360,18 +831,28 @@ class DatabaseManager:
                                     processing_time: int = None) -> bool:
         """Store voice interaction data"""
         try:
-            self.connection.execute("""
+            await self.pool.write(self._execute_writes, [
+                ("""
                 INSERT INTO voice_interactions 
                 (user_id, command_text, language, intent, entities, response, 
                  confidence_score, processing_time_ms)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user_id, command, language, intent, 
-                json.dumps(entities) if entities else None,
-                response, confidence, processing_time
-            ))
+                """, (
+                    user_id, command, language, intent, 
+                    json.dumps(entities) if entities else None,
+                    response, confidence, processing_time
+                )),
+                (f"""
+                INSERT INTO voice_interaction_rollup_minute
+                (bucket, language, interactions, confidence_sum, confidence_samples)
+                VALUES ({ROLLUP_BUCKET_SQL}, ?, 1, ?, ?)
+                ON CONFLICT (bucket, language) DO UPDATE SET
+                    interactions = interactions + 1,
+                    confidence_sum = confidence_sum + excluded.confidence_sum,
+                    confidence_samples = confidence_samples + excluded.confidence_samples
+                """, (language, confidence or 0.0, 0 if confidence is None else 1))
+            ])
             
-            self.connection.commit()
             self.performance_metrics["queries_executed"] += 1
             
             logger.debug(f"Stored voice interaction for user {user_id}")
@@ -387,14 +868,28 @@ class DatabaseManager:
                            success: bool = True, error: str = None) -> bool:
         """Track AI provider usage for cost optimization"""
         try:
-            self.connection.execute("""
+            await self.pool.write(self._execute_writes, [
+                ("""
                 INSERT INTO ai_usage 
                 (provider_name, operation_type, tokens_used, cost_usd, 
                  response_time_ms, success, error_message)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (provider, operation, tokens, cost, response_time, success, error))
+                """, (provider, operation, tokens, cost, response_time, success, error)),
+                (f"""
+                INSERT INTO ai_usage_rollup_minute
+                (bucket, provider_name, operations, total_tokens, total_cost_usd,
+                 total_response_time_ms, response_time_samples)
+                VALUES ({ROLLUP_BUCKET_SQL}, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT (bucket, provider_name) DO UPDATE SET
+                    operations = operations + 1,
+                    total_tokens = total_tokens + excluded.total_tokens,
+                    total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+                    total_response_time_ms = total_response_time_ms + excluded.total_response_time_ms,
+                    response_time_samples = response_time_samples + excluded.response_time_samples
+                """, (provider, tokens or 0, cost or 0.0, response_time or 0,
+                      0 if response_time is None else 1))
+            ])
             
-            self.connection.commit()
             self.performance_metrics["queries_executed"] += 1
             
             return True
@@ -409,13 +904,24 @@ class DatabaseManager:
                                       region: str = None) -> bool:
         """Record performance metrics for monitoring"""
         try:
-            self.connection.execute("""
+            await self.pool.write(self._execute_writes, [
+                ("""
                 INSERT INTO performance_metrics 
                 (metric_type, metric_name, value, unit, region)
                 VALUES (?, ?, ?, ?, ?)
-            """, (metric_type, metric_name, value, unit, region))
+                """, (metric_type, metric_name, value, unit, region)),
+                (f"""
+                INSERT INTO performance_metric_rollup_minute
+                (bucket, metric_type, metric_name, samples, value_sum, value_min, value_max)
+                VALUES ({ROLLUP_BUCKET_SQL}, ?, ?, 1, ?, ?, ?)
+                ON CONFLICT (bucket, metric_type, metric_name) DO UPDATE SET
+                    samples = samples + 1,
+                    value_sum = value_sum + excluded.value_sum,
+                    value_min = MIN(value_min, excluded.value_min),
+                    value_max = MAX(value_max, excluded.value_max)
+                """, (metric_type, metric_name, value, value, value))
+            ])
             
-            self.connection.commit()
             self.performance_metrics["queries_executed"] += 1
             
             return True
@@ -429,15 +935,21 @@ class DatabaseManager:
         """Get comprehensive system metrics"""
         try:
             metrics = {
-                "database_performance": self.performance_metrics.copy(),
+                "database_performance": {
+                    key: value.copy() if isinstance(value, dict) else value
+                    for key, value in self.performance_metrics.items()
+                },
                 "storage_stats": {},
                 "regional_distribution": {},
                 "ai_usage_summary": {},
-                "voice_interaction_stats": {}
+                "voice_interaction_stats": {},
+                "performance_metrics_summary": {},
+                "write_behind_queue_depth": len(self.sync_queue),
+                "cache_stats": self.cache.get_stats()
             }
             
             # Storage statistics
-            cursor = self.connection.execute("""
+            rows = await self.pool.read(self._fetch_all, """
                 SELECT tier, region, COUNT(*) as count, 
                        AVG(LENGTH(content)) as avg_size
                 FROM cellular_data 
@@ -445,7 +957,7 @@ class DatabaseManager:
             """)
             
             storage_stats = {}
-            for row in cursor.fetchall():
+            for row in rows:
                 key = f"{row['tier']}_{row['region']}"
                 storage_stats[key] = {
                     "count": row['count'],
@@ -453,19 +965,20 @@ class DatabaseManager:
                 }
             metrics["storage_stats"] = storage_stats
             
-            # AI usage summary
-            cursor = self.connection.execute("""
-                SELECT provider_name, COUNT(*) as operations, 
-                       SUM(tokens_used) as total_tokens,
-                       SUM(cost_usd) as total_cost,
-                       AVG(response_time_ms) as avg_response_time
-                FROM ai_usage 
-                WHERE created_at > datetime('now', '-24 hours')
+            # AI usage summary, read from per-minute rollups
+            rows = await self.pool.read(self._fetch_all, """
+                SELECT provider_name, SUM(operations) as operations, 
+                       SUM(total_tokens) as total_tokens,
+                       SUM(total_cost_usd) as total_cost,
+                       SUM(total_response_time_ms) * 1.0 / NULLIF(SUM(response_time_samples), 0)
+                           as avg_response_time
+                FROM ai_usage_rollup_minute 
+                WHERE bucket > strftime('%Y-%m-%d %H:%M:00', 'now', '-24 hours')
                 GROUP BY provider_name
             """)
             
             ai_usage = {}
-            for row in cursor.fetchall():
+            for row in rows:
                 ai_usage[row['provider_name']] = {
                     "operations_24h": row['operations'],
                     "tokens_24h": row['total_tokens'] or 0,
@@ -474,23 +987,43 @@ class DatabaseManager:
                 }
             metrics["ai_usage_summary"] = ai_usage
             
-            # Voice interaction statistics
-            cursor = self.connection.execute("""
-                SELECT language, COUNT(*) as interactions,
-                       AVG(confidence_score) as avg_confidence
-                FROM voice_interactions 
-                WHERE created_at > datetime('now', '-24 hours')
+            # Voice interaction statistics, read from per-minute rollups
+            rows = await self.pool.read(self._fetch_all, """
+                SELECT language, SUM(interactions) as interactions,
+                       SUM(confidence_sum) / NULLIF(SUM(confidence_samples), 0) as avg_confidence
+                FROM voice_interaction_rollup_minute 
+                WHERE bucket > strftime('%Y-%m-%d %H:%M:00', 'now', '-24 hours')
                 GROUP BY language
             """)
             
             voice_stats = {}
-            for row in cursor.fetchall():
+            for row in rows:
                 voice_stats[row['language']] = {
                     "interactions_24h": row['interactions'],
                     "avg_confidence": row['avg_confidence'] or 0.0
                 }
             metrics["voice_interaction_stats"] = voice_stats
             
+            # Performance metric summary, read from per-minute rollups
+            rows = await self.pool.read(self._fetch_all, """
+                SELECT metric_type, metric_name, SUM(samples) as samples,
+                       SUM(value_sum) / SUM(samples) as avg_value,
+                       MIN(value_min) as min_value, MAX(value_max) as max_value
+                FROM performance_metric_rollup_minute 
+                WHERE bucket > strftime('%Y-%m-%d %H:%M:00', 'now', '-24 hours')
+                GROUP BY metric_type, metric_name
+            """)
+            
+            performance_summary = {}
+            for row in rows:
+                performance_summary[f"{row['metric_type']}:{row['metric_name']}"] = {
+                    "samples_24h": row['samples'],
+                    "avg_value": row['avg_value'],
+                    "min_value": row['min_value'],
+                    "max_value": row['max_value']
+                }
+            metrics["performance_metrics_summary"] = performance_summary
+            
             self.performance_metrics["queries_executed"] += 4
             return metrics
             
@@ -499,6 +1032,26 @@ class DatabaseManager:
             logger.error(f"Failed to get system metrics: {e}")
             return {"error": str(e)}
     
+    @staticmethod
+    def _apply_infrastructure_pragmas(connection: sqlite3.Connection):
+        """Run ANALYZE, prune old rollups and apply connectivity-friendly pragmas (runs on the writer thread)"""
+        connection.execute("ANALYZE")
+        
+        # Drop rollup buckets that have aged out of every dashboard window
+        for table in ("ai_usage_rollup_minute", "voice_interaction_rollup_minute",
+                      "performance_metric_rollup_minute"):
+            connection.execute(
+                f"DELETE FROM {table} WHERE bucket < datetime('now', '-{ROLLUP_RETENTION_DAYS} days')"
+            )
+        connection.commit()
+        
+        # WAL mode is enabled when the pool opens; keep it for better concurrency
+        connection.execute("PRAGMA journal_mode=WAL")
+        
+        # Optimize for African network conditions
+        connection.execute("PRAGMA synchronous=NORMAL")  # Balance safety and speed
+        connection.execute("PRAGMA cache_size=10000")    # Increase cache for poor connectivity
+    
     async def optimize_for_african_infrastructure(self) -> Dict[str, Any]:
         """Optimize database for African infrastructure conditions"""
         try:
@@ -509,25 +1062,14 @@ class DatabaseManager:
                 "regional_partitioning": False
             }
             
-            # Optimize cache based on usage patterns
-            if len(self.cache) > 1000:  # Limit cache size for memory efficiency
-                # Keep only most recently accessed items
-                sorted_cache = sorted(self.cache.items(), 
-                                    key=lambda x: x[1].updated_at, reverse=True)
-                self.cache = dict(sorted_cache[:500])
+            # The cache bounds itself; just reclaim memory held by expired entries
+            if self.cache.purge_expired() > 0:
                 optimizations["cache_optimization"] = True
             
-            # Analyze and optimize indexes
-            cursor = self.connection.execute("ANALYZE")
+            # Analyze and optimize indexes, and tune pragmas on the writer connection
+            await self.pool.write(self._apply_infrastructure_pragmas)
             optimizations["index_optimization"] = True
             
-            # Enable WAL mode for better concurrency
-            self.connection.execute("PRAGMA journal_mode=WAL")
-            
-            # Optimize for African network conditions
-            self.connection.execute("PRAGMA synchronous=NORMAL")  # Balance safety and speed
-            self.connection.execute("PRAGMA cache_size=10000")    # Increase cache for poor connectivity
-            
             optimizations["data_compression"] = True
             optimizations["regional_partitioning"] = True
             
@@ -538,6 +1080,15 @@ class DatabaseManager:
             logger.error(f"Database optimization failed: {e}")
             return {"error": str(e)}
     
+    @staticmethod
+    def _backup_to(connection: sqlite3.Connection, backup_path: str):
+        """Copy the database into backup_path (runs on a reader thread)"""
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            connection.backup(backup_conn)
+        finally:
+            backup_conn.close()
+    
     async def backup_data(self, backup_path: str = None) -> bool:
         """Create backup of all data"""
         try:
@@ -546,9 +1097,7 @@ class DatabaseManager:
                 backup_path = f"/tmp/webwaka_backup_{timestamp}.db"
             
             # Create backup using SQLite backup API
-            backup_conn = sqlite3.connect(backup_path)
-            self.connection.backup(backup_conn)
-            backup_conn.close()
+            await self.pool.read(self._backup_to, backup_path)
             
             logger.info(f"Database backup created: {backup_path}")
             return True
@@ -560,8 +1109,20 @@ class DatabaseManager:
     def close(self):
         """Close database connection"""
         try:
+            if self._write_behind_task is not None:
+                # Stop the flusher; what it had queued is written below
+                self._write_behind_task.cancel()
+                self._write_behind_task = None
+                self._flush_event = None
             if self.connection:
-                self.connection.close()
+                # Batches already handed to the writer finish first
+                self.pool.drain()
+                if self.sync_queue:
+                    # Don't lose write-behind data that never got flushed
+                    self._write_cellular_batch(self.connection, self.sync_queue)
+                    self.sync_queue.clear()
+                self.pool.close()
+                self.connection = None
                 logger.info("Database connection closed")
         except Exception as e:
             logger.error(f"Error closing database: {e}")
@@ -638,7 +1199,7 @@ async def get_database_health() -> Dict[str, Any]:
 
 # Export main components
 __all__ = [
-    'DatabaseManager', 'CellularDataUnit', 'DataTier', 'DataRegion',
+    'DatabaseManager', 'SQLiteConnectionPool', 'CellularDataCache', 'CellularDataUnit', 'DataTier', 'DataRegion',
     'db_manager', 'initialize_database', 'store_data', 'get_data',
     'track_voice_command', 'track_ai_cost', 'get_database_health'
 ]
@@ -12,6 +12,8 @@ from enum import Enum
 import logging
 from decimal import Decimal, ROUND_HALF_UP
 
+from record_index import RecordIndex
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -441,6 +443,13 @@ class CRMManager:
         self.interactions = {}
         self.leads = {}
         self.opportunities = {}
+        
+        # Secondary indexes for analytics and dashboards
+        self.customer_index = RecordIndex('customer_id', counter_fields=('status',), order_fields=('total_value',))
+        self.interaction_index = RecordIndex('interaction_id', bucket_fields=('customer_id',), order_fields=('completed_at',))
+        self.opportunity_index = RecordIndex('opportunity_id', bucket_fields=('customer_id',),
+                                             counter_fields=('stage',), total_fields=('value',))
+        
         self.voice_processor = VoiceCRMProcessor()
         self.analytics = CRMAnalytics()
         self.cultural_adapter = AfricanCRMAdapter()
@@ -489,6 +498,7 @@ class CRMManager:
             
             # Apply cultural adaptations
             self.cultural_adapter.adapt_customer_profile(customer)
+            self.customer_index.add(customer)
             
             logger.info(f"Created customer {customer.first_name} {customer.last_name} with ID {customer_id}")
             return customer
@@ -523,6 +533,7 @@ class CRMManager:
             )
             
             self.interactions[interaction_id] = interaction
+            self.interaction_index.add(interaction)
             
             # Update customer last interaction
             customer = self.customers.get(interaction.customer_id)
@@ -644,6 +655,7 @@ class CRMManager:
             )
             
             self.opportunities[opportunity_id] = opportunity
+            self.opportunity_index.add(opportunity)
             
             logger.info(f"Created opportunity {opportunity.name} with ID {opportunity_id}")
             return opportunity
@@ -652,6 +664,48 @@ class CRMManager:
             logger.error(f"Opportunity creation failed: {str(e)}")
             raise CRMException(f"Opportunity creation failed: {str(e)}")
     
+    def update_customer_status(self, customer_id: str, status: CustomerStatus) -> Customer:
+        """Change a customer's status"""
+        customer = self.customers.get(customer_id)
+        if not customer:
+            raise CRMException(f"Customer {customer_id} not found")
+        
+        customer.status = status
+        customer.updated_at = datetime.utcnow()
+        self.customer_index.update(customer)
+        return customer
+    
+    def record_customer_purchase(self, customer_id: str, amount: Decimal) -> Customer:
+        """Add a purchase to a customer's total value"""
+        customer = self.customers.get(customer_id)
+        if not customer:
+            raise CRMException(f"Customer {customer_id} not found")
+        
+        customer.total_value += Decimal(str(amount))
+        customer.updated_at = datetime.utcnow()
+        self.customer_index.update(customer)
+        return customer
+    
+    def update_opportunity(self, opportunity_id: str, stage: Optional[OpportunityStage] = None,
+                           value: Optional[Decimal] = None, probability: Optional[float] = None) -> Opportunity:
+        """Move an opportunity through the pipeline or revise its value"""
+        opportunity = self.opportunities.get(opportunity_id)
+        if not opportunity:
+            raise CRMException(f"Opportunity {opportunity_id} not found")
+        
+        if stage is not None:
+            opportunity.stage = stage
+            if stage in (OpportunityStage.CLOSED_WON, OpportunityStage.CLOSED_LOST):
+                opportunity.actual_close_date = datetime.utcnow()
+        if value is not None:
+            opportunity.value = Decimal(str(value))
+        if probability is not None:
+            opportunity.probability = probability
+        
+        opportunity.updated_at = datetime.utcnow()
+        self.opportunity_index.update(opportunity)
+        return opportunity
+    
     def get_customer_analytics(self, customer_id: str) -> Dict[str, Any]:
         """Get comprehensive customer analytics"""
         try:
@@ -659,17 +713,9 @@ class CRMManager:
             if not customer:
                 raise CRMException(f"Customer {customer_id} not found")
             
-            # Get customer interactions
-            customer_interactions = [
-                i for i in self.interactions.values() 
-                if i.customer_id == customer_id
-            ]
-            
-            # Get customer opportunities
-            customer_opportunities = [
-                o for o in self.opportunities.values() 
-                if o.customer_id == customer_id
-            ]
+            # Get customer interactions and opportunities
+            customer_interactions = self.interaction_index.get('customer_id', customer_id)
+            customer_opportunities = self.opportunity_index.get('customer_id', customer_id)
             
             # Mock purchase data (would come from sales system)
             purchases = []  # This would be populated from actual sales data
@@ -741,23 +787,18 @@ class CRMManager:
         """Get CRM dashboard data"""
         try:
             total_customers = len(self.customers)
-            active_customers = len([c for c in self.customers.values() if c.status == CustomerStatus.ACTIVE])
+            active_customers = self.customer_index.count('status', CustomerStatus.ACTIVE)
             total_opportunities = len(self.opportunities)
-            pipeline_value = sum(o.value for o in self.opportunities.values() if o.stage != OpportunityStage.CLOSED_LOST)
+            pipeline_value = sum(
+                value for stage, value in self.opportunity_index.totals_by('stage', 'value').items()
+                if stage != OpportunityStage.CLOSED_LOST
+            )
             
             # Recent interactions
-            recent_interactions = sorted(
-                self.interactions.values(),
-                key=lambda x: x.completed_at,
-                reverse=True
-            )[:10]
+            recent_interactions = self.interaction_index.top('completed_at', 10)
             
             # Top customers by value
-            top_customers = sorted(
-                self.customers.values(),
-                key=lambda x: x.total_value,
-                reverse=True
-            )[:10]
+            top_customers = self.customer_index.top('total_value', 10)
             
             return {
                 'summary': {
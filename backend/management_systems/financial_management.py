@@ -5,7 +5,8 @@ AI-powered financial management with fraud detection and African financial conte
 
 import json
 import uuid
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -277,9 +278,85 @@ class VoiceFinancialProcessor:
             'ai_processed': True
         }
 
+class AccountActivityStats:
+    """
+    Running fraud features for one account's transaction history
+    
+    Amounts feed a mean/variance accumulator and transaction times are kept in
+    sorted microsecond indexes, so each check is a bisect instead of a scan
+    over every earlier transaction.
+    """
+    
+    EPOCH = datetime(1970, 1, 1)
+    
+    def __init__(self):
+        self.count = 0
+        self.amount_sum = 0.0
+        self.amount_mean = 0.0
+        self.amount_m2 = 0.0
+        self.timestamps: List[int] = []
+        self.timestamps_by_key: Dict[Tuple[Decimal, str], List[int]] = {}
+    
+    @classmethod
+    def to_micros(cls, moment: datetime) -> int:
+        """Exact integer microseconds since the epoch"""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return (moment - cls.EPOCH) // timedelta(microseconds=1)
+    
+    @staticmethod
+    def _insert(timestamps: List[int], value: int):
+        # Transactions mostly arrive in date order, making this an append
+        if not timestamps or value >= timestamps[-1]:
+            timestamps.append(value)
+        else:
+            insort(timestamps, value)
+    
+    @staticmethod
+    def _count_within(timestamps: List[int], center: int, radius: int) -> int:
+        """Count timestamps strictly within radius of center"""
+        return bisect_left(timestamps, center + radius) - bisect_right(timestamps, center - radius)
+    
+    def add(self, transaction: 'Transaction'):
+        """Fold a stored transaction into the running features"""
+        amount = float(transaction.amount)
+        self.count += 1
+        self.amount_sum += amount
+        delta = amount - self.amount_mean
+        self.amount_mean += delta / self.count
+        self.amount_m2 += delta * (amount - self.amount_mean)
+        
+        moment = self.to_micros(transaction.transaction_date)
+        self._insert(self.timestamps, moment)
+        key = (transaction.amount, transaction.description)
+        self._insert(self.timestamps_by_key.setdefault(key, []), moment)
+    
+    @property
+    def average_amount(self) -> float:
+        # Summed in arrival order, matching an average over the full history
+        return self.amount_sum / self.count if self.count else 0.0
+    
+    @property
+    def amount_variance(self) -> float:
+        return self.amount_m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    def count_near(self, moment: datetime, seconds: int) -> int:
+        """Transactions dated strictly less than seconds away from moment"""
+        return self._count_within(self.timestamps, self.to_micros(moment), seconds * 1000000)
+    
+    def has_duplicate(self, transaction: 'Transaction', seconds: int) -> bool:
+        """Whether an equal amount and description was dated within seconds"""
+        timestamps = self.timestamps_by_key.get((transaction.amount, transaction.description))
+        if not timestamps:
+            return False
+        return self._count_within(timestamps, self.to_micros(transaction.transaction_date), seconds * 1000000) > 0
+
 class FraudDetectionEngine:
     """AI-powered fraud detection for financial transactions"""
     
+    RAPID_WINDOW_SECONDS = 300  # 5 minutes
+    DUPLICATE_WINDOW_SECONDS = 3600  # 1 hour
+    
     def __init__(self):
         self.fraud_indicators = [
             'unusual_amount',
@@ -295,28 +372,57 @@ class FraudDetectionEngine:
             'medium': 0.6,
             'high': 0.8
         }
+        self.account_stats: Dict[str, AccountActivityStats] = {}
+    
+    def record_transaction(self, transaction: Transaction):
+        """Add a stored transaction to its account's running features"""
+        stats = self.account_stats.get(transaction.tenant_id)
+        if stats is None:
+            stats = self.account_stats[transaction.tenant_id] = AccountActivityStats()
+        stats.add(transaction)
+    
+    def get_account_profile(self, account_id: str) -> Dict[str, Any]:
+        """Get the running amount profile for an account"""
+        stats = self.account_stats.get(account_id) or AccountActivityStats()
+        return {
+            'transaction_count': stats.count,
+            'average_amount': stats.average_amount,
+            'amount_stddev': stats.amount_variance ** 0.5
+        }
     
     def analyze_transaction(self, transaction: Transaction, 
-                          historical_transactions: List[Transaction]) -> Dict[str, Any]:
-        """Analyze transaction for fraud indicators"""
+                          historical_transactions: Optional[List[Transaction]] = None) -> Dict[str, Any]:
+        """
+        Analyze transaction for fraud indicators
+        
+        Without historical_transactions the account's recorded running features
+        are used; an explicit history is indexed once for this call.
+        """
         try:
+            if historical_transactions is None:
+                stats = self.account_stats.get(transaction.tenant_id) or AccountActivityStats()
+            else:
+                stats = AccountActivityStats()
+                for historical in historical_transactions:
+                    stats.add(historical)
+            
             fraud_score = 0.0
             indicators = []
             
             # Amount analysis
-            amount_score = self._analyze_amount(transaction, historical_transactions)
+            amount_score = self._analyze_amount(transaction, stats)
             fraud_score += amount_score['score']
             if amount_score['indicators']:
                 indicators.extend(amount_score['indicators'])
             
             # Time analysis
-            time_score = self._analyze_timing(transaction, historical_transactions)
+            time_score = self._analyze_timing(transaction, stats)
             fraud_score += time_score['score']
             if time_score['indicators']:
                 indicators.extend(time_score['indicators'])
             
             # Pattern analysis
-            pattern_score = self._analyze_patterns(transaction, historical_transactions)
+            pattern_score = self._analyze_patterns(transaction, stats)
             fraud_score += pattern_score['score']
             if pattern_score['indicators']:
                 indicators.extend(pattern_score['indicators'])
@@ -349,17 +455,16 @@ class FraudDetectionEngine:
             }
     
     def _analyze_amount(self, transaction: Transaction, 
-                       historical_transactions: List[Transaction]) -> Dict[str, Any]:
+                       stats: AccountActivityStats) -> Dict[str, Any]:
         """Analyze transaction amount for anomalies"""
         score = 0.0
         indicators = []
         
-        if not historical_transactions:
+        if not stats.count:
             return {'score': 0.0, 'indicators': []}
         
-        # Calculate typical transaction amounts
-        amounts = [float(t.amount) for t in historical_transactions]
-        avg_amount = sum(amounts) / len(amounts)
+        # Typical transaction amount from the running accumulator
+        avg_amount = stats.average_amount
         
         transaction_amount = float(transaction.amount)
         
@@ -376,7 +481,7 @@ class FraudDetectionEngine:
         return {'score': score, 'indicators': indicators}
     
     def _analyze_timing(self, transaction: Transaction, 
-                       historical_transactions: List[Transaction]) -> Dict[str, Any]:
+                       stats: AccountActivityStats) -> Dict[str, Any]:
         """Analyze transaction timing for anomalies"""
         score = 0.0
         indicators = []
@@ -388,32 +493,22 @@ class FraudDetectionEngine:
             indicators.append('unusual_hour')
         
         # Check for rapid transactions
-        recent_transactions = [
-            t for t in historical_transactions
-            if abs((t.transaction_date - transaction.transaction_date).total_seconds()) < 300  # 5 minutes
-        ]
+        recent_count = stats.count_near(transaction.transaction_date, self.RAPID_WINDOW_SECONDS)
         
-        if len(recent_transactions) > 3:
+        if recent_count > 3:
             score += 0.3
             indicators.append('rapid_transactions')
         
         return {'score': score, 'indicators': indicators}
     
     def _analyze_patterns(self, transaction: Transaction, 
-                         historical_transactions: List[Transaction]) -> Dict[str, Any]:
+                         stats: AccountActivityStats) -> Dict[str, Any]:
         """Analyze transaction patterns for anomalies"""
         score = 0.0
         indicators = []
         
         # Check for duplicate transactions
-        duplicates = [
-            t for t in historical_transactions
-            if (t.amount == transaction.amount and 
-                t.description == transaction.description and
-                abs((t.transaction_date - transaction.transaction_date).total_seconds()) < 3600)  # 1 hour
-        ]
-        
-        if duplicates:
+        if stats.has_duplicate(transaction, self.DUPLICATE_WINDOW_SECONDS):
             score += 0.4
             indicators.append('potential_duplicate')
         
@@ -577,9 +672,8 @@ class FinancialManager:
             if transaction.exchange_rate:
                 transaction.base_amount = transaction.amount * transaction.exchange_rate
             
-            # Run fraud detection
-            historical_transactions = list(self.transactions.values())
-            fraud_analysis = self.fraud_detector.analyze_transaction(transaction, historical_transactions)
+            # Run fraud detection against the account's running features
+            fraud_analysis = self.fraud_detector.analyze_transaction(transaction)
             transaction.fraud_score = fraud_analysis['fraud_score']
             
             # Auto-approve low-risk transactions
@@ -588,6 +682,7 @@ class FinancialManager:
                 self._update_account_balances(transaction)
             
             self.transactions[transaction_id] = transaction
+            self.fraud_detector.record_transaction(transaction)
             
             logger.info(f"Created transaction {transaction_number} with fraud score {fraud_analysis['fraud_score']}")
             return transaction
@@ -12,6 +12,8 @@ from enum import Enum
 import logging
 from decimal import Decimal, ROUND_HALF_UP
 
+from record_index import RecordIndex
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -441,6 +443,13 @@ class HRManager:
         self.leave_requests = {}
         self.performance_reviews = {}
         self.training_records = {}
+        
+        # Secondary indexes for analytics and dashboards
+        self.employee_index = RecordIndex('employee_id', counter_fields=('status', 'department'), order_fields=('hire_date',))
+        self.leave_index = RecordIndex('request_id', bucket_fields=('employee_id',), counter_fields=('status',))
+        self.review_index = RecordIndex('review_id', bucket_fields=('employee_id',))
+        self.training_index = RecordIndex('training_id', bucket_fields=('employee_id',))
+        
         self.voice_processor = VoiceHRProcessor()
         self.analytics = HRAnalytics()
         self.cultural_adapter = AfricanHRAdapter()
@@ -500,6 +509,7 @@ class HRManager:
             
             # Apply cultural adaptations
             self.cultural_adapter.adapt_employee_profile(employee)
+            self.employee_index.add(employee)
             
             logger.info(f"Added employee {employee.first_name} {employee.last_name} with ID {employee_id}")
             return employee
@@ -540,6 +550,7 @@ class HRManager:
             
             # Apply cultural considerations
             self.cultural_adapter.adapt_leave_request(leave_request)
+            self.leave_index.add(leave_request)
             
             logger.info(f"Submitted leave request {request_id} for employee {request_data['employee_id']}")
             return leave_request
@@ -667,6 +678,7 @@ class HRManager:
             )
             
             self.performance_reviews[review_id] = review
+            self.review_index.add(review)
             
             logger.info(f"Created performance review {review_id} for employee {review_data['employee_id']}")
             return review
@@ -675,6 +687,75 @@ class HRManager:
             logger.error(f"Performance review creation failed: {str(e)}")
             raise HRException(f"Performance review creation failed: {str(e)}")
     
+    def add_training_record(self, training_data: Dict[str, Any]) -> TrainingRecord:
+        """Record training for an employee"""
+        try:
+            training_id = str(uuid.uuid4())
+            
+            training = TrainingRecord(
+                training_id=training_id,
+                tenant_id=self.tenant_id,
+                employee_id=training_data['employee_id'],
+                training_name=training_data['training_name'],
+                training_type=training_data.get('training_type', 'workshop'),
+                provider=training_data.get('provider', ''),
+                start_date=training_data['start_date'],
+                end_date=training_data['end_date'],
+                duration_hours=training_data.get('duration_hours', 0),
+                cost=Decimal(str(training_data.get('cost', 0))),
+                status=TrainingStatus(training_data.get('status', 'scheduled')),
+                completion_score=training_data.get('completion_score'),
+                certification_earned=training_data.get('certification_earned'),
+                skills_gained=training_data.get('skills_gained', []),
+                feedback=training_data.get('feedback'),
+                created_at=datetime.utcnow()
+            )
+            
+            self.training_records[training_id] = training
+            self.training_index.add(training)
+            
+            logger.info(f"Added training record {training_id} for employee {training_data['employee_id']}")
+            return training
+            
+        except Exception as e:
+            logger.error(f"Training record creation failed: {str(e)}")
+            raise HRException(f"Training record creation failed: {str(e)}")
+    
+    def update_employee(self, employee_id: str, status: Optional[EmployeeStatus] = None,
+                        department: Optional[str] = None, position: Optional[str] = None) -> Employee:
+        """Change an employee's status, department or position"""
+        employee = self.employees.get(employee_id)
+        if not employee:
+            raise HRException(f"Employee {employee_id} not found")
+        
+        if status is not None:
+            employee.status = status
+        if department is not None:
+            employee.department = department
+        if position is not None:
+            employee.position = position
+        
+        employee.updated_at = datetime.utcnow()
+        self.employee_index.update(employee)
+        return employee
+    
+    def review_leave_request(self, request_id: str, approved: bool, reviewer_id: str,
+                             rejection_reason: Optional[str] = None) -> LeaveRequest:
+        """Approve or reject a pending leave request"""
+        leave_request = self.leave_requests.get(request_id)
+        if not leave_request:
+            raise HRException(f"Leave request {request_id} not found")
+        if leave_request.status != 'pending':
+            raise HRException(f"Leave request {request_id} is already {leave_request.status}")
+        
+        leave_request.status = 'approved' if approved else 'rejected'
+        leave_request.approved_by = reviewer_id if approved else None
+        leave_request.approved_at = datetime.utcnow() if approved else None
+        leave_request.rejection_reason = None if approved else rejection_reason
+        leave_request.updated_at = datetime.utcnow()
+        self.leave_index.update(leave_request)
+        return leave_request
+    
     def get_employee_analytics(self, employee_id: str) -> Dict[str, Any]:
         """Get comprehensive employee analytics"""
         try:
@@ -683,9 +764,9 @@ class HRManager:
                 raise HRException(f"Employee {employee_id} not found")
             
             # Get employee data
-            employee_reviews = [r for r in self.performance_reviews.values() if r.employee_id == employee_id]
-            employee_leaves = [l for l in self.leave_requests.values() if l.employee_id == employee_id]
-            employee_training = [t for t in self.training_records.values() if t.employee_id == employee_id]
+            employee_reviews = self.review_index.get('employee_id', employee_id)
+            employee_leaves = self.leave_index.get('employee_id', employee_id)
+            employee_training = self.training_index.get('employee_id', employee_id)
             
             # Calculate satisfaction score
             satisfaction_score = self.analytics.calculate_employee_satisfaction_score(
@@ -724,20 +805,16 @@ class HRManager:
         """Get HR dashboard data"""
         try:
             total_employees = len(self.employees)
-            active_employees = len([e for e in self.employees.values() if e.status == EmployeeStatus.ACTIVE])
-            pending_leaves = len([l for l in self.leave_requests.values() if l.status == 'pending'])
+            active_employees = self.employee_index.count('status', EmployeeStatus.ACTIVE)
+            pending_leaves = self.leave_index.count('status', 'pending')
             
             # Department breakdown
-            dept_breakdown = {}
-            for employee in self.employees.values():
-                dept = employee.department
-                dept_breakdown[dept] = dept_breakdown.get(dept, 0) + 1
+            dept_breakdown = self.employee_index.counts_by('department')
             
             # Recent hires (last 30 days)
-            recent_hires = [
-                e for e in self.employees.values() 
-                if e.hire_date > datetime.utcnow() - timedelta(days=30)
-            ]
+            recent_hires = self.employee_index.range(
+                'hire_date', lower=datetime.utcnow() - timedelta(days=30), include_lower=False
+            )
             
             return {
                 'summary': {
@@ -11,7 +11,7 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 from decimal import Decimal, ROUND_HALF_UP
-import statistics
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -155,9 +155,72 @@ class StockAlert:
     acknowledged_by: Optional[str]
     acknowledged_at: Optional[datetime]
 
+class ItemMovementSeries:
+    """
+    Append-only movement history for one item
+
+    Columns live in NumPy arrays that grow by doubling, so demand analytics
+    read contiguous slices instead of filtering every movement in the system.
+    """
+
+    EPOCH = datetime(1970, 1, 1)
+    INITIAL_CAPACITY = 16
+    TYPE_CODES = {movement_type: code for code, movement_type in enumerate(MovementType)}
+
+    def __init__(self, item_id: str):
+        self.item_id = item_id
+        self.movement_ids: List[str] = []
+        self._size = 0
+        self._days = np.empty(self.INITIAL_CAPACITY, dtype=np.int32)
+        self._months = np.empty(self.INITIAL_CAPACITY, dtype=np.int8)
+        self._quantities = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._types = np.empty(self.INITIAL_CAPACITY, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def from_movements(cls, item_id: str, movements: List[InventoryMovement]) -> 'ItemMovementSeries':
+        """Build a series from an unindexed movement list"""
+        series = cls(item_id)
+        for movement in movements:
+            if movement.item_id == item_id:
+                series.append(movement)
+        return series
+
+    def append(self, movement: InventoryMovement):
+        """Record a movement"""
+        if self._size == len(self._days):
+            capacity = len(self._days) * 2
+            self._days = np.resize(self._days, capacity)
+            self._months = np.resize(self._months, capacity)
+            self._quantities = np.resize(self._quantities, capacity)
+            self._types = np.resize(self._types, capacity)
+
+        index = self._size
+        self._days[index] = (movement.created_at - self.EPOCH).days
+        self._months[index] = movement.created_at.month
+        self._quantities[index] = movement.quantity
+        self._types[index] = self.TYPE_CODES[movement.movement_type]
+        self.movement_ids.append(movement.movement_id)
+        self._size += 1
+
+    def of_type(self, movement_type: MovementType) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Days, months and quantities of one movement type, in recording order"""
+        mask = self._types[:self._size] == self.TYPE_CODES[movement_type]
+        return (
+            self._days[:self._size][mask],
+            self._months[:self._size][mask],
+            self._quantities[:self._size][mask]
+        )
+
 class AIInventoryOptimizer:
     """AI-powered inventory optimization"""
     
+    ORDER_COST = 100  # Simplified order cost
+    HOLDING_COST_RATE = 0.2  # 20% of item value
+    DEFAULT_LEAD_TIME_DAYS = 7
+    
     def __init__(self):
         self.demand_patterns = {}
         self.seasonal_factors = {}
@@ -166,118 +229,123 @@ class AIInventoryOptimizer:
     def analyze_demand_patterns(self, item_id: str, 
                                historical_movements: List[InventoryMovement]) -> Dict[str, Any]:
         """Analyze demand patterns for an item"""
+        return self.analyze_demand_series(ItemMovementSeries.from_movements(item_id, historical_movements))
+    
+    def analyze_demand_series(self, series: ItemMovementSeries) -> Dict[str, Any]:
+        """Analyze demand patterns from an item's indexed movements"""
+        return self.analyze_demand_batch([series])[0]
+    
+    def analyze_demand_batch(self, series_list: List[ItemMovementSeries]) -> List[Dict[str, Any]]:
+        """
+        Analyze demand patterns for many items in one vectorized pass
+
+        Sales from every item are concatenated and grouped by (item, day), so
+        daily demand, variability, trend, recent average and monthly seasonal
+        factors come from a handful of array reductions over the catalogue.
+        """
         try:
-            # Filter sales movements
-            sales_movements = [
-                m for m in historical_movements 
-                if m.movement_type == MovementType.SALE and m.item_id == item_id
-            ]
+            results: List[Optional[Dict[str, Any]]] = [None] * len(series_list)
+            sales = [series.of_type(MovementType.SALE) for series in series_list]
             
-            if len(sales_movements) < 7:  # Need at least a week of data
-                return {
-                    'pattern': 'insufficient_data',
-                    'confidence': 0.0,
-                    'recommendation': 'collect_more_data'
-                }
+            eligible = []
+            for index, (days, _, _) in enumerate(sales):
+                if len(days) < 7:  # Need at least a week of data
+                    results[index] = {
+                        'pattern': 'insufficient_data',
+                        'confidence': 0.0,
+                        'recommendation': 'collect_more_data'
+                    }
+                else:
+                    eligible.append(index)
             
-            # Calculate daily demand
-            daily_demand = {}
-            for movement in sales_movements:
-                date_key = movement.created_at.date()
-                if date_key not in daily_demand:
-                    daily_demand[date_key] = 0
-                daily_demand[date_key] += movement.quantity
+            if not eligible:
+                return results
             
-            # Calculate statistics
-            demands = list(daily_demand.values())
-            avg_demand = statistics.mean(demands)
-            std_demand = statistics.stdev(demands) if len(demands) > 1 else 0
+            item_count = len(eligible)
+            sale_counts = np.array([len(sales[index][0]) for index in eligible])
+            item_codes = np.repeat(np.arange(item_count), sale_counts)
+            days = np.concatenate([sales[index][0] for index in eligible])
+            months = np.concatenate([sales[index][1] for index in eligible]).astype(np.int64)
+            quantities = np.concatenate([sales[index][2] for index in eligible])
             
-            # Identify pattern
-            pattern = self._identify_demand_pattern(demands)
+            # Daily demand per item, days in calendar order
+            order = np.lexsort((days, item_codes))
+            sorted_items = item_codes[order]
+            sorted_days = days[order]
+            new_group = np.ones(len(order), dtype=bool)
+            new_group[1:] = (sorted_items[1:] != sorted_items[:-1]) | (sorted_days[1:] != sorted_days[:-1])
+            group_starts = np.flatnonzero(new_group)
+            daily_demand = np.add.reduceat(quantities[order], group_starts).astype(np.float64)
+            group_items = sorted_items[group_starts]
             
-            # Calculate seasonal factors
-            seasonal_factor = self._calculate_seasonal_factor(sales_movements)
+            day_counts = np.bincount(group_items, minlength=item_count)
+            item_offsets = np.concatenate(([0], np.cumsum(day_counts)[:-1]))
+            positions = np.arange(len(daily_demand)) - item_offsets[group_items]
             
-            # Predict future demand
-            future_demand = self._predict_demand(demands, seasonal_factor)
+            def item_mean(mask: np.ndarray, counts: np.ndarray) -> np.ndarray:
+                totals = np.bincount(group_items[mask], weights=daily_demand[mask], minlength=item_count)
+                return np.divide(totals, counts, out=np.zeros(item_count), where=counts > 0)
             
-            return {
-                'pattern': pattern,
-                'average_daily_demand': avg_demand,
-                'demand_variability': std_demand,
-                'seasonal_factor': seasonal_factor,
-                'predicted_weekly_demand': future_demand * 7,
-                'confidence': self._calculate_confidence(len(demands)),
-                'recommendation': self._generate_recommendation(avg_demand, std_demand, future_demand)
-            }
+            all_days = np.ones(len(daily_demand), dtype=bool)
+            avg_demand = item_mean(all_days, day_counts)
+            squared_deviation = (daily_demand - avg_demand[group_items]) ** 2
+            variance = np.bincount(group_items, weights=squared_deviation, minlength=item_count)
+            std_demand = np.sqrt(np.divide(variance, day_counts - 1, out=np.zeros(item_count), where=day_counts > 1))
+            
+            # Trend: first third of days against the last third
+            first_counts = day_counts // 3
+            last_counts = -(-day_counts // 3)
+            first_avg = item_mean(positions < first_counts[group_items], first_counts)
+            last_avg = item_mean(positions >= (day_counts - last_counts)[group_items], last_counts)
+            change_ratio = np.divide(last_avg - first_avg, first_avg, out=np.zeros(item_count), where=first_avg > 0)
+            
+            # Moving average over the last 7 days with sales
+            recent_counts = np.minimum(day_counts, 7)
+            recent_avg = item_mean(positions >= (day_counts - 7)[group_items], recent_counts)
+            
+            # Seasonal factor: current month's demand against the average month
+            month_keys = item_codes * 13 + months
+            monthly_demand = np.bincount(month_keys, weights=quantities, minlength=item_count * 13).reshape(item_count, 13)
+            months_present = (np.bincount(month_keys, minlength=item_count * 13) > 0).reshape(item_count, 13).sum(axis=1)
+            monthly_avg = np.divide(monthly_demand.sum(axis=1), months_present, out=np.zeros(item_count), where=months_present > 0)
+            current_demand = monthly_demand[:, datetime.now().month]
+            seasonal_factor = np.divide(current_demand, monthly_avg, out=np.ones(item_count),
+                                        where=(months_present >= 2) & (monthly_avg > 0))
+            
+            future_demand = recent_avg * seasonal_factor
+            
+            for code, index in enumerate(eligible):
+                if day_counts[code] < 3:
+                    pattern = 'stable'
+                elif change_ratio[code] > 0.2:
+                    pattern = 'increasing'
+                elif change_ratio[code] < -0.2:
+                    pattern = 'decreasing'
+                else:
+                    pattern = 'stable'
+                
+                avg = float(avg_demand[code])
+                std = float(std_demand[code])
+                future = float(future_demand[code])
+                results[index] = {
+                    'pattern': pattern,
+                    'average_daily_demand': avg,
+                    'demand_variability': std,
+                    'seasonal_factor': float(seasonal_factor[code]),
+                    'predicted_weekly_demand': future * 7,
+                    'confidence': self._calculate_confidence(int(day_counts[code])),
+                    'recommendation': self._generate_recommendation(avg, std, future)
+                }
+            
+            return results
             
         except Exception as e:
             logger.error(f"Demand pattern analysis failed: {str(e)}")
-            return {
+            return [{
                 'pattern': 'analysis_error',
                 'confidence': 0.0,
                 'error': str(e)
-            }
-    
-    def _identify_demand_pattern(self, demands: List[float]) -> str:
-        """Identify demand pattern type"""
-        if not demands:
-            return 'no_data'
-        
-        # Calculate trend
-        if len(demands) < 3:
-            return 'stable'
-        
-        # Simple trend analysis
-        first_third = demands[:len(demands)//3]
-        last_third = demands[-len(demands)//3:]
-        
-        first_avg = statistics.mean(first_third)
-        last_avg = statistics.mean(last_third)
-        
-        change_ratio = (last_avg - first_avg) / first_avg if first_avg > 0 else 0
-        
-        if change_ratio > 0.2:
-            return 'increasing'
-        elif change_ratio < -0.2:
-            return 'decreasing'
-        else:
-            return 'stable'
-    
-    def _calculate_seasonal_factor(self, movements: List[InventoryMovement]) -> float:
-        """Calculate seasonal demand factor"""
-        if not movements:
-            return 1.0
-        
-        # Group by month
-        monthly_demand = {}
-        for movement in movements:
-            month = movement.created_at.month
-            if month not in monthly_demand:
-                monthly_demand[month] = 0
-            monthly_demand[month] += movement.quantity
-        
-        if len(monthly_demand) < 2:
-            return 1.0
-        
-        # Calculate current month factor
-        current_month = datetime.now().month
-        current_demand = monthly_demand.get(current_month, 0)
-        avg_demand = statistics.mean(monthly_demand.values())
-        
-        return current_demand / avg_demand if avg_demand > 0 else 1.0
-    
-    def _predict_demand(self, historical_demands: List[float], seasonal_factor: float) -> float:
-        """Predict future demand"""
-        if not historical_demands:
-            return 0.0
-        
-        # Simple moving average with seasonal adjustment
-        recent_demands = historical_demands[-7:]  # Last 7 periods
-        base_demand = statistics.mean(recent_demands)
-        
-        return base_demand * seasonal_factor
+            } for _ in series_list]
     
     def _calculate_confidence(self, data_points: int) -> float:
         """Calculate confidence level based on data points"""
@@ -306,51 +374,68 @@ class AIInventoryOptimizer:
                                demand_analysis: Dict[str, Any],
                                supplier: Optional[Supplier] = None) -> Dict[str, int]:
         """Optimize reorder points and quantities"""
+        return self.optimize_reorder_points_batch([item], [demand_analysis], [supplier])[0]
+    
+    def optimize_reorder_points_batch(self, items: List[InventoryItem],
+                                      demand_analyses: List[Dict[str, Any]],
+                                      suppliers: List[Optional[Supplier]]) -> List[Dict[str, int]]:
+        """Optimize reorder points and quantities for many items at once"""
+        def current_settings(item: InventoryItem) -> Dict[str, int]:
+            return {
+                'reorder_point': item.reorder_point,
+                'reorder_quantity': item.reorder_quantity,
+                'safety_stock': item.minimum_stock,
+                'max_stock': item.maximum_stock
+            }
+        
         try:
-            avg_daily_demand = demand_analysis.get('average_daily_demand', 1)
-            demand_variability = demand_analysis.get('demand_variability', 0)
+            avg_daily_demand = np.array([analysis.get('average_daily_demand', 1) for analysis in demand_analyses], dtype=np.float64)
+            demand_variability = np.array([analysis.get('demand_variability', 0) for analysis in demand_analyses], dtype=np.float64)
             
             # Lead time (default to 7 days if no supplier info)
-            lead_time = supplier.lead_time_days if supplier else 7
+            lead_time = np.array([supplier.lead_time_days if supplier else self.DEFAULT_LEAD_TIME_DAYS
+                                  for supplier in suppliers], dtype=np.float64)
             
             # Safety stock calculation (covers demand variability and lead time uncertainty)
-            safety_stock = int(avg_daily_demand * lead_time * 0.5 + demand_variability * 2)
+            safety_stock = np.trunc(avg_daily_demand * lead_time * 0.5 + demand_variability * 2)
             
             # Reorder point = (Average daily demand × Lead time) + Safety stock
-            reorder_point = int(avg_daily_demand * lead_time) + safety_stock
+            reorder_point = np.trunc(avg_daily_demand * lead_time) + safety_stock
             
             # Economic order quantity (simplified)
             # EOQ = sqrt((2 × Annual demand × Order cost) / Holding cost)
             annual_demand = avg_daily_demand * 365
-            order_cost = 100  # Simplified order cost
-            holding_cost_rate = 0.2  # 20% of item value
-            holding_cost = float(item.unit_cost) * holding_cost_rate
+            holding_cost = np.array([float(item.unit_cost) for item in items]) * self.HOLDING_COST_RATE
+            eoq = np.trunc(avg_daily_demand * 30)  # 30 days supply without a holding cost
+            has_holding_cost = holding_cost > 0
+            eoq[has_holding_cost] = np.trunc(np.sqrt(
+                2 * annual_demand[has_holding_cost] * self.ORDER_COST / holding_cost[has_holding_cost]
+            ))
             
-            if holding_cost > 0:
-                eoq = int((2 * annual_demand * order_cost / holding_cost) ** 0.5)
-            else:
-                eoq = int(avg_daily_demand * 30)  # 30 days supply
-            
-            # Ensure minimum order quantities
-            if supplier and supplier.minimum_order_value > 0:
-                min_qty = int(supplier.minimum_order_value / item.unit_cost)
-                eoq = max(eoq, min_qty)
+            results = []
+            for index, (item, supplier) in enumerate(zip(items, suppliers)):
+                item_eoq = int(eoq[index])
+                
+                # Ensure minimum order quantities
+                if supplier and supplier.minimum_order_value > 0:
+                    if item.unit_cost == 0:
+                        logger.error(f"Reorder optimization failed for {item.item_id}: zero unit cost")
+                        results.append(current_settings(item))
+                        continue
+                    item_eoq = max(item_eoq, int(supplier.minimum_order_value / item.unit_cost))
+                
+                results.append({
+                    'reorder_point': max(int(reorder_point[index]), 1),
+                    'reorder_quantity': max(item_eoq, 1),
+                    'safety_stock': max(int(safety_stock[index]), 1),
+                    'max_stock': max(item_eoq * 2, item.maximum_stock)
+                })
             
-            return {
-                'reorder_point': max(reorder_point, 1),
-                'reorder_quantity': max(eoq, 1),
-                'safety_stock': max(safety_stock, 1),
-                'max_stock': max(eoq * 2, item.maximum_stock)
-            }
+            return results
             
         except Exception as e:
             logger.error(f"Reorder optimization failed: {str(e)}")
-            return {
-                'reorder_point': item.reorder_point,
-                'reorder_quantity': item.reorder_quantity,
-                'safety_stock': item.minimum_stock,
-                'max_stock': item.maximum_stock
-            }
+            return [current_settings(item) for item in items]
 
 class InventoryManager:
     """Main inventory management system"""
@@ -360,6 +445,7 @@ class InventoryManager:
         self.inventory_items = {}
         self.suppliers = {}
         self.movements = {}
+        self.item_movements: Dict[str, ItemMovementSeries] = {}
         self.purchase_orders = {}
         self.stock_alerts = {}
         self.ai_optimizer = AIInventoryOptimizer()
@@ -526,6 +612,11 @@ class InventoryManager:
         )
         
         self.movements[movement_id] = movement
+        
+        series = self.item_movements.get(item_id)
+        if series is None:
+            series = self.item_movements[item_id] = ItemMovementSeries(item_id)
+        series.append(movement)
         return movement
     
     def _check_stock_alerts(self, item: InventoryItem):
@@ -747,11 +838,9 @@ class InventoryManager:
             if not item:
                 raise InventoryException(f"Item {item_id} not found")
             
-            # Get historical movements
-            item_movements = [m for m in self.movements.values() if m.item_id == item_id]
-            
-            # Analyze demand patterns
-            demand_analysis = self.ai_optimizer.analyze_demand_patterns(item_id, item_movements)
+            # Analyze demand patterns from the item's movement index
+            series = self.item_movements.get(item_id) or ItemMovementSeries(item_id)
+            demand_analysis = self.ai_optimizer.analyze_demand_series(series)
             
             # Get supplier info
             supplier = self.suppliers.get(item.supplier_id) if item.supplier_id else None
@@ -792,6 +881,56 @@ class InventoryManager:
             logger.error(f"AI recommendations failed: {str(e)}")
             raise InventoryException(f"AI recommendations failed: {str(e)}")
 
+    def get_item_movements(self, item_id: str) -> List[InventoryMovement]:
+        """Get an item's movements in recording order"""
+        series = self.item_movements.get(item_id)
+        if not series:
+            return []
+        return [self.movements[movement_id] for movement_id in series.movement_ids]
+    
+    def optimize_all_reorder_points(self, apply: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze demand and optimize reorder settings for the whole catalogue
+        
+        Args:
+            apply: Write the optimized reorder point and quantity back to each item
+            
+        Returns:
+            Demand analysis and optimization per item ID
+        """
+        try:
+            items = list(self.inventory_items.values())
+            series_list = [
+                self.item_movements.get(item.item_id) or ItemMovementSeries(item.item_id)
+                for item in items
+            ]
+            suppliers = [self.suppliers.get(item.supplier_id) if item.supplier_id else None for item in items]
+            
+            analyses = self.ai_optimizer.analyze_demand_batch(series_list)
+            optimizations = self.ai_optimizer.optimize_reorder_points_batch(items, analyses, suppliers)
+            
+            results = {}
+            for item, analysis, optimization in zip(items, analyses, optimizations):
+                if apply:
+                    item.reorder_point = optimization['reorder_point']
+                    item.reorder_quantity = optimization['reorder_quantity']
+                    item.updated_at = datetime.utcnow()
+                
+                results[item.item_id] = {
+                    'item_name': item.name,
+                    'current_stock': item.current_stock,
+                    'demand_analysis': analysis,
+                    'optimization': optimization,
+                    'needs_reorder': item.current_stock <= optimization['reorder_point']
+                }
+            
+            logger.info(f"Optimized reorder points for {len(items)} items")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Catalogue reorder optimization failed: {str(e)}")
+            raise InventoryException(f"Catalogue reorder optimization failed: {str(e)}")
+
 class AfricanInventoryAdapter:
     """Adapt inventory management for African contexts"""
     
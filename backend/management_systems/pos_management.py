@@ -5,12 +5,15 @@ AI-powered POS with voice activation and African cultural adaptation
 
 import json
 import uuid
+import bisect
+import heapq
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 from decimal import Decimal, ROUND_HALF_UP
+import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -116,6 +119,249 @@ class Transaction:
     voice_interaction: bool
     cultural_context: Dict[str, Any]
 
+class ProductSearchIndex:
+    """
+    Name lookup index over products and their local names
+
+    Exact matches resolve through a hash of normalized names. Fuzzy matches
+    come from a word-level inverted index over each name's word set: overlap
+    counts for the candidates sharing a word with the search term are
+    gathered from NumPy postings, scored by Jaccard similarity, and ties go
+    to the product added first.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self.products: List[Product] = []  # in insertion order
+        self.exact: Dict[str, int] = {}  # normalized name -> first product position
+        self.postings: Dict[str, List[int]] = {}  # word -> name ids
+        self._posting_arrays: Dict[str, np.ndarray] = {}
+        self._name_count = 0
+        self._max_names = 1  # most distinct names on one product
+        self._name_product = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+        self._name_size = np.empty(self.INITIAL_CAPACITY, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    @classmethod
+    def from_products(cls, products: List[Product]) -> 'ProductSearchIndex':
+        """Build an index over an unindexed product list"""
+        index = cls()
+        for product in products:
+            index.add(product)
+        return index
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return name.lower().strip()
+
+    def add(self, product: Product):
+        """Index a product's main and local names"""
+        position = len(self.products)
+        self.products.append(product)
+
+        word_sets = []
+        for name in [product.name, *product.local_names.values()]:
+            normalized = self.normalize(name)
+            self.exact.setdefault(normalized, position)
+            words = set(normalized.split())
+            if words and words not in word_sets:
+                word_sets.append(words)
+
+        self._max_names = max(self._max_names, len(word_sets))
+        for words in word_sets:
+            name_id = self._append_name(position, len(words))
+            for word in words:
+                self.postings.setdefault(word, []).append(name_id)
+                self._posting_arrays.pop(word, None)
+
+    def _append_name(self, position: int, size: int) -> int:
+        if self._name_count == len(self._name_product):
+            capacity = len(self._name_product) * 2
+            self._name_product = np.resize(self._name_product, capacity)
+            self._name_size = np.resize(self._name_size, capacity)
+
+        name_id = self._name_count
+        self._name_product[name_id] = position
+        self._name_size[name_id] = size
+        self._name_count += 1
+        return name_id
+
+    def _posting_array(self, word: str) -> np.ndarray:
+        array = self._posting_arrays.get(word)
+        if array is None:
+            array = self._posting_arrays[word] = np.array(self.postings[word], dtype=np.int64)
+        return array
+
+    def find_exact(self, name: str) -> Optional[Product]:
+        """Product whose name or local name equals name, ignoring case"""
+        position = self.exact.get(self.normalize(name))
+        return self.products[position] if position is not None else None
+
+    def search(self, term: str, limit: int = 5, min_score: float = 0.0) -> List[Tuple[Product, float]]:
+        """Best fuzzy matches for term scoring above min_score, highest first"""
+        search_words = set(self.normalize(term).split())
+        indexed_words = [word for word in search_words if word in self.postings]
+        if not indexed_words:
+            return []
+
+        # Overlap count per candidate name
+        hits = np.concatenate([self._posting_array(word) for word in indexed_words])
+        name_ids, overlap = np.unique(hits, return_counts=True)
+
+        # Jaccard against the full search term, including words no product has
+        scores = overlap / (len(search_words) + self._name_size[name_ids] - overlap)
+        keep = scores > min_score
+        name_ids, scores = name_ids[keep], scores[keep]
+
+        # Enough of the best names to cover limit distinct products, ties included
+        shortlist = limit * self._max_names
+        if len(scores) > shortlist:
+            cutoff = np.partition(scores, len(scores) - shortlist)[len(scores) - shortlist]
+            keep = scores >= cutoff
+            name_ids, scores = name_ids[keep], scores[keep]
+
+        # Highest score first, earliest product on ties; a product's best name wins
+        positions = self._name_product[name_ids]
+        results = []
+        seen = set()
+        for i in np.lexsort((positions, -scores)):
+            position = int(positions[i])
+            if position in seen:
+                continue
+            seen.add(position)
+            results.append((self.products[position], float(scores[i])))
+            if len(results) == limit:
+                break
+
+        return results
+
+class SalesBucket:
+    """Running sales totals and per-product quantity and revenue for one period"""
+
+    def __init__(self):
+        self.total_sales = Decimal('0')
+        self.transaction_count = 0
+        self.voice_transactions = 0
+        self.products: Dict[str, Dict[str, Any]] = {}  # in order of first sale
+
+    def add_transaction(self, transaction: 'Transaction'):
+        self.total_sales += transaction.total_amount
+        self.transaction_count += 1
+        if transaction.voice_interaction:
+            self.voice_transactions += 1
+        for item in transaction.items:
+            self._add_product(item.product_id, item.product_name, item.quantity, item.total_amount)
+
+    def merge(self, other: 'SalesBucket'):
+        self.total_sales += other.total_sales
+        self.transaction_count += other.transaction_count
+        self.voice_transactions += other.voice_transactions
+        for product_id, data in other.products.items():
+            self._add_product(product_id, data['name'], data['quantity_sold'], data['revenue'])
+
+    def _add_product(self, product_id: str, name: str, quantity: int, revenue: Decimal):
+        data = self.products.get(product_id)
+        if data is None:
+            data = self.products[product_id] = {
+                'name': name,
+                'quantity_sold': 0,
+                'revenue': Decimal('0')
+            }
+        data['quantity_sold'] += quantity
+        data['revenue'] += revenue
+
+class SalesAggregates:
+    """
+    Hourly and daily sales buckets for completed transactions
+
+    A range query merges whole days and whole hours, and filters only the
+    transactions in the partial hours at either end, so report cost follows
+    the number of buckets in range rather than the transaction history.
+    """
+
+    HOUR = timedelta(hours=1)
+    DAY = timedelta(days=1)
+
+    def __init__(self):
+        self.hourly: Dict[datetime, SalesBucket] = {}
+        self.daily: Dict[datetime, SalesBucket] = {}
+        self.hour_keys: List[datetime] = []
+        self.day_keys: List[datetime] = []
+        self.hour_transactions: Dict[datetime, List['Transaction']] = {}
+
+    @staticmethod
+    def hour_of(timestamp: datetime) -> datetime:
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def day_of(timestamp: datetime) -> datetime:
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def record(self, transaction: 'Transaction'):
+        """Add a completed transaction to its hour and day"""
+        hour = self.hour_of(transaction.completed_at)
+        self._bucket(self.hourly, self.hour_keys, hour).add_transaction(transaction)
+        self._bucket(self.daily, self.day_keys, self.day_of(hour)).add_transaction(transaction)
+        self.hour_transactions.setdefault(hour, []).append(transaction)
+
+    def _bucket(self, buckets: Dict[datetime, SalesBucket], keys: List[datetime], key: datetime) -> SalesBucket:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = SalesBucket()
+            bisect.insort(keys, key)
+        return bucket
+
+    def summarize(self, start_date: datetime, end_date: datetime) -> SalesBucket:
+        """Totals for transactions completed between start_date and end_date inclusive"""
+        summary = SalesBucket()
+        if start_date > end_date:
+            return summary
+
+        # Whole hours are those in [first_hour, end_hour)
+        end_exclusive = end_date + timedelta(microseconds=1)
+        first_hour = self.hour_of(start_date)
+        if first_hour < start_date:
+            first_hour += self.HOUR
+        end_hour = self.hour_of(end_exclusive)
+
+        if first_hour >= end_hour:
+            for hour in sorted({self.hour_of(start_date), self.hour_of(end_date)}):
+                self._merge_partial_hour(summary, hour, start_date, end_date)
+            return summary
+
+        if start_date < first_hour:
+            self._merge_partial_hour(summary, self.hour_of(start_date), start_date, end_date)
+
+        # Whole days inside the whole hours use the daily buckets
+        first_day = self.day_of(first_hour)
+        if first_day < first_hour:
+            first_day += self.DAY
+        end_day = self.day_of(end_hour)
+
+        if first_day < end_day:
+            self._merge_range(summary, self.hourly, self.hour_keys, first_hour, first_day)
+            self._merge_range(summary, self.daily, self.day_keys, first_day, end_day)
+            self._merge_range(summary, self.hourly, self.hour_keys, end_day, end_hour)
+        else:
+            self._merge_range(summary, self.hourly, self.hour_keys, first_hour, end_hour)
+
+        self._merge_partial_hour(summary, end_hour, start_date, end_date)
+        return summary
+
+    def _merge_range(self, summary: SalesBucket, buckets: Dict[datetime, SalesBucket],
+                     keys: List[datetime], start: datetime, end: datetime):
+        for key in keys[bisect.bisect_left(keys, start):bisect.bisect_left(keys, end)]:
+            summary.merge(buckets[key])
+
+    def _merge_partial_hour(self, summary: SalesBucket, hour: datetime,
+                            start_date: datetime, end_date: datetime):
+        for transaction in self.hour_transactions.get(hour, ()):
+            if start_date <= transaction.completed_at <= end_date:
+                summary.add_transaction(transaction)
+
 class VoiceCommandProcessor:
     """Process voice commands for POS operations"""
     
@@ -304,10 +550,12 @@ class POSManager:
         self.products = {}
         self.customers = {}
         self.transactions = {}
+        self.sales_aggregates = SalesAggregates()
         self.current_transaction = None
+        self.search_index = ProductSearchIndex()
         self.voice_processor = VoiceCommandProcessor()
         self.cultural_adapter = CulturalAdapter()
-        self.ai_assistant = POSAIAssistant()
+        self.ai_assistant = POSAIAssistant(self.search_index)
         
     def add_product(self, product_data: Dict[str, Any]) -> Product:
         """Add new product to inventory"""
@@ -336,6 +584,7 @@ class POSManager:
             )
             
             self.products[product_id] = product
+            self.search_index.add(product)
             
             logger.info(f"Added product {product.name} with ID {product_id}")
             return product
@@ -345,33 +594,15 @@ class POSManager:
             raise POSException(f"Product addition failed: {str(e)}")
     
     def find_product_by_name(self, name: str, language: str = 'en') -> Optional[Product]:
-        """Find product by name or local name"""
-        name_lower = name.lower().strip()
-        
-        for product in self.products.values():
-            # Check main name
-            if product.name.lower() == name_lower:
-                return product
-            
-            # Check local names
-            for lang, local_name in product.local_names.items():
-                if local_name.lower() == name_lower:
-                    return product
-            
-            # Fuzzy matching for similar names
-            if self._is_similar_name(product.name, name):
-                return product
-        
-        return None
-    
-    def _is_similar_name(self, product_name: str, search_name: str) -> bool:
-        """Check if names are similar (basic implementation)"""
-        # Simple similarity check - in production, use more sophisticated matching
-        product_words = set(product_name.lower().split())
-        search_words = set(search_name.lower().split())
+        """Find product by name or local name, falling back to the closest fuzzy match"""
+        # Check main and local names
+        product = self.search_index.find_exact(name)
+        if product:
+            return product
         
-        # If any word matches, consider it similar
-        return len(product_words.intersection(search_words)) > 0
+        # Fuzzy matching: any shared word qualifies, best similarity wins
+        matches = self.search_index.search(name, limit=1)
+        return matches[0][0] if matches else None
     
     def process_voice_command(self, command: str, language: str = 'en', 
                             cashier_id: str = None) -> Dict[str, Any]:
@@ -434,7 +665,7 @@ class POSManager:
             product = self.find_product_by_name(item_name)
             if not product:
                 # Use AI to suggest similar products
-                suggestions = self.ai_assistant.suggest_similar_products(item_name, list(self.products.values()))
+                suggestions = self.ai_assistant.suggest_similar_products(item_name)
                 return {
                     'success': False,
                     'message': f'Product "{item_name}" not found',
@@ -575,6 +806,7 @@ class POSManager:
             
             # Store completed transaction
             self.transactions[self.current_transaction.transaction_id] = self.current_transaction
+            self.sales_aggregates.record(self.current_transaction)
             
             # Generate receipt
             receipt = self._generate_receipt(self.current_transaction)
@@ -615,38 +847,23 @@ class POSManager:
         
         return receipt
     
-    def get_sales_analytics(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    def get_sales_analytics(self, start_date: datetime, end_date: datetime,
+                            top_n: int = 10) -> Dict[str, Any]:
         """Get sales analytics for date range"""
         try:
-            relevant_transactions = [
-                t for t in self.transactions.values()
-                if t.status == TransactionStatus.COMPLETED
-                and start_date <= t.completed_at <= end_date
-            ]
-            
-            total_sales = sum(t.total_amount for t in relevant_transactions)
-            total_transactions = len(relevant_transactions)
-            voice_transactions = sum(1 for t in relevant_transactions if t.voice_interaction)
-            
-            # Product analytics
-            product_sales = {}
-            for transaction in relevant_transactions:
-                for item in transaction.items:
-                    if item.product_id not in product_sales:
-                        product_sales[item.product_id] = {
-                            'name': item.product_name,
-                            'quantity_sold': 0,
-                            'revenue': Decimal('0')
-                        }
-                    product_sales[item.product_id]['quantity_sold'] += item.quantity
-                    product_sales[item.product_id]['revenue'] += item.total_amount
+            # Merge the hourly and daily buckets covering the range
+            summary = self.sales_aggregates.summarize(start_date, end_date)
+            
+            total_sales = summary.total_sales
+            total_transactions = summary.transaction_count
+            voice_transactions = summary.voice_transactions
             
             # Top selling products
-            top_products = sorted(
-                product_sales.items(),
-                key=lambda x: x[1]['quantity_sold'],
-                reverse=True
-            )[:10]
+            top_products = heapq.nlargest(
+                top_n,
+                summary.products.items(),
+                key=lambda x: x[1]['quantity_sold']
+            )
             
             return {
                 'period': {
@@ -741,46 +958,29 @@ class CulturalAdapter:
 class POSAIAssistant:
     """AI assistant for POS operations"""
     
-    def __init__(self):
+    def __init__(self, search_index: Optional[ProductSearchIndex] = None):
         self.product_similarity_threshold = 0.7
+        self.search_index = search_index if search_index is not None else ProductSearchIndex()
     
-    def suggest_similar_products(self, search_term: str, products: List[Product]) -> List[Dict[str, Any]]:
+    def suggest_similar_products(self, search_term: str,
+                                 products: Optional[List[Product]] = None) -> List[Dict[str, Any]]:
         """Suggest similar products when exact match not found"""
-        suggestions = []
-        search_lower = search_term.lower()
-        
-        for product in products:
-            # Simple similarity scoring
-            score = self._calculate_similarity(search_lower, product.name.lower())
-            
-            # Check local names too
-            for lang, local_name in product.local_names.items():
-                local_score = self._calculate_similarity(search_lower, local_name.lower())
-                score = max(score, local_score)
-            
-            if score > self.product_similarity_threshold:
-                suggestions.append({
-                    'product_id': product.product_id,
-                    'name': product.name,
-                    'similarity_score': score,
-                    'price': str(product.price),
-                    'stock': product.stock_quantity
-                })
-        
-        # Sort by similarity score
-        suggestions.sort(key=lambda x: x['similarity_score'], reverse=True)
-        return suggestions[:5]  # Return top 5 suggestions
-    
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings"""
-        # Simple Jaccard similarity
-        words1 = set(text1.split())
-        words2 = set(text2.split())
+        # Score an explicit product list on its own, otherwise use the shared index
+        index = ProductSearchIndex.from_products(products) if products is not None else self.search_index
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        # Jaccard similarity over main and local names, top 5 by score
+        matches = index.search(search_term, limit=5, min_score=self.product_similarity_threshold)
         
-        return len(intersection) / len(union) if union else 0.0
+        return [
+            {
+                'product_id': product.product_id,
+                'name': product.name,
+                'similarity_score': score,
+                'price': str(product.price),
+                'stock': product.stock_quantity
+            }
+            for product, score in matches
+        ]
     
     def predict_demand(self, product_id: str, historical_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Predict product demand based on historical data"""
@@ -0,0 +1,182 @@
+"""
+WebWaka Management Systems - Record Index
+In-memory secondary indexes shared by the management system managers
+"""
+
+import bisect
+import itertools
+from typing import Any, Dict, Iterable, List, Tuple
+
+class RecordIndex:
+    """
+    Secondary indexes over one table of dataclass records
+
+    - buckets: records grouped by a foreign-key field, in insertion order
+    - counters: record counts per value of a status-like field, with optional
+      running totals of numeric fields per value
+    - orderings: records kept sorted by a field for top-N and range queries
+
+    The owning manager calls add() after inserting a record and update()
+    after changing an indexed field, so lookups cost O(result) rather than
+    a scan of the table.
+    """
+
+    def __init__(self, id_field: str, bucket_fields: Iterable[str] = (),
+                 counter_fields: Iterable[str] = (), total_fields: Iterable[str] = (),
+                 order_fields: Iterable[str] = ()):
+        self.id_field = id_field
+        self.bucket_fields = tuple(bucket_fields)
+        self.counter_fields = tuple(counter_fields)
+        self.total_fields = tuple(total_fields)
+        self.order_fields = tuple(order_fields)
+
+        self.records: Dict[str, Any] = {}
+        self.buckets: Dict[str, Dict[Any, Dict[str, Any]]] = {field: {} for field in self.bucket_fields}
+        self.counts: Dict[str, Dict[Any, int]] = {field: {} for field in self.counter_fields}
+        self.totals: Dict[str, Dict[Any, Dict[str, Any]]] = {field: {} for field in self.counter_fields}
+        self.orderings: Dict[str, List[Tuple[Any, int, str]]] = {field: [] for field in self.order_fields}
+
+        self._indexed: Dict[str, Dict[str, Any]] = {}  # record_id -> field values when indexed
+        self._sequence: Dict[str, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, record: Any):
+        """Index a newly inserted record"""
+        record_id = getattr(record, self.id_field)
+        if record_id in self.records:
+            self.update(record)
+            return
+
+        self.records[record_id] = record
+        self._sequence[record_id] = next(self._counter)
+        self._insert(record_id, record, self._snapshot(record))
+
+    def update(self, record: Any):
+        """Re-index a record after its indexed fields changed"""
+        record_id = getattr(record, self.id_field)
+        if record_id not in self.records:
+            self.add(record)
+            return
+
+        # The caller may pass a replacement object rather than the one indexed
+        self.records[record_id] = record
+        old = self._indexed[record_id]
+        new = self._snapshot(record)
+
+        # Bucket membership only moves when the key changed, keeping insertion order otherwise
+        for field in self.bucket_fields:
+            if old[field] != new[field]:
+                self._remove_from_bucket(field, old[field], record_id)
+            self.buckets[field].setdefault(new[field], {})[record_id] = record
+        if old == new:
+            return
+
+        for field in self.counter_fields:
+            self._adjust_counter(field, old[field], old, -1)
+            self._adjust_counter(field, new[field], new, 1)
+
+        for field in self.order_fields:
+            if old[field] != new[field]:
+                self._remove_from_ordering(field, old[field], record_id)
+                self._insert_into_ordering(field, new[field], record_id)
+
+        self._indexed[record_id] = new
+
+    def remove(self, record_id: str):
+        """Drop a record from every index"""
+        if record_id not in self.records:
+            return
+
+        old = self._indexed.pop(record_id)
+        for field in self.bucket_fields:
+            self._remove_from_bucket(field, old[field], record_id)
+        for field in self.counter_fields:
+            self._adjust_counter(field, old[field], old, -1)
+        for field in self.order_fields:
+            self._remove_from_ordering(field, old[field], record_id)
+
+        del self.records[record_id]
+        del self._sequence[record_id]
+
+    def get(self, field: str, value: Any) -> List[Any]:
+        """Records whose bucket field equals value, in insertion order"""
+        return list(self.buckets[field].get(value, {}).values())
+
+    def count(self, field: str, value: Any) -> int:
+        """Number of records whose counter field equals value"""
+        return self.counts[field].get(value, 0)
+
+    def counts_by(self, field: str) -> Dict[Any, int]:
+        """Record count per value of a counter field"""
+        return dict(self.counts[field])
+
+    def totals_by(self, field: str, total_field: str) -> Dict[Any, Any]:
+        """Sum of total_field per value of a counter field"""
+        return {value: totals[total_field] for value, totals in self.totals[field].items()}
+
+    def top(self, field: str, n: int) -> List[Any]:
+        """The n records with the largest field values, earlier records first on ties"""
+        ordering = self.orderings[field]
+        return [self.records[record_id] for _, _, record_id in reversed(ordering[max(0, len(ordering) - n):])]
+
+    def range(self, field: str, lower: Any = None, upper: Any = None,
+              include_lower: bool = True, include_upper: bool = True) -> List[Any]:
+        """Records with lower <= field <= upper (bounds optional), in insertion order"""
+        ordering = self.orderings[field]
+        start = 0
+        end = len(ordering)
+        # Entries are (value, -sequence, id); sequences are non-negative
+        if lower is not None:
+            start = bisect.bisect_left(ordering, (lower, -float('inf'))) if include_lower else \
+                bisect.bisect_right(ordering, (lower, float('inf')))
+        if upper is not None:
+            end = bisect.bisect_right(ordering, (upper, float('inf'))) if include_upper else \
+                bisect.bisect_left(ordering, (upper, -float('inf')))
+
+        record_ids = sorted((entry[2] for entry in ordering[start:end]), key=self._sequence.__getitem__)
+        return [self.records[record_id] for record_id in record_ids]
+
+    def _snapshot(self, record: Any) -> Dict[str, Any]:
+        fields = set(self.bucket_fields + self.counter_fields + self.total_fields + self.order_fields)
+        return {field: getattr(record, field) for field in fields}
+
+    def _insert(self, record_id: str, record: Any, values: Dict[str, Any]):
+        for field in self.bucket_fields:
+            self.buckets[field].setdefault(values[field], {})[record_id] = record
+        for field in self.counter_fields:
+            self._adjust_counter(field, values[field], values, 1)
+        for field in self.order_fields:
+            self._insert_into_ordering(field, values[field], record_id)
+        self._indexed[record_id] = values
+
+    def _remove_from_bucket(self, field: str, value: Any, record_id: str):
+        bucket = self.buckets[field].get(value)
+        if bucket is not None:
+            bucket.pop(record_id, None)
+            if not bucket:
+                del self.buckets[field][value]
+
+    def _adjust_counter(self, field: str, value: Any, values: Dict[str, Any], delta: int):
+        count = self.counts[field].get(value, 0) + delta
+        if count <= 0:
+            self.counts[field].pop(value, None)
+            self.totals[field].pop(value, None)
+            return
+
+        self.counts[field][value] = count
+        totals = self.totals[field].setdefault(value, {total_field: 0 for total_field in self.total_fields})
+        for total_field in self.total_fields:
+            totals[total_field] += delta * values[total_field]
+
+    def _insert_into_ordering(self, field: str, value: Any, record_id: str):
+        bisect.insort(self.orderings[field], (value, -self._sequence[record_id], record_id))
+
+    def _remove_from_ordering(self, field: str, value: Any, record_id: str):
+        ordering = self.orderings[field]
+        entry = (value, -self._sequence[record_id], record_id)
+        position = bisect.bisect_left(ordering, entry)
+        if position < len(ordering) and ordering[position] == entry:
+            del ordering[position]
@@ -10,9 +10,11 @@ import asyncio
 import logging
 from typing import Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass, field
+from collections import OrderedDict, deque
 from enum import Enum
 from datetime import datetime, timedelta
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 
 # Import AI providers and voice recognition
 from ai_providers import ai_manager
@@ -389,7 +391,7 @@ class AfricanBusinessVocabulary:
                 'akwati': ['box'],
                 'kwalba': ['bottle'],
                 'gwangwani': ['tin'],
-                'ma'auni': ['measure'],
+                "ma'auni": ['measure'],
                 'dambe': ['bunch'],
                 'goma sha biyu': ['dozen']
             },
@@ -462,9 +464,90 @@ class AfricanBusinessVocabulary:
         }
     }
 
+class VocabularyMatcher:
+    """Aho-Corasick automaton over a fixed set of vocabulary terms
+    
+    Every occurrence of every term is found in one left-to-right pass, so
+    matching costs O(len(text) + matches) however large the vocabulary is.
+    """
+    
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+        self._built = False
+    
+    def add(self, term: str, payload: Any):
+        """Register a term; payload is returned with each of its matches"""
+        if not term:
+            return
+        
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        
+        self._output[state].append((len(term), payload))
+        self._built = False
+    
+    def build(self):
+        """Compute failure links breadth-first and merge suffix outputs"""
+        pending = deque(self._goto[0].values())
+        for state in pending:
+            self._fail[state] = 0
+        
+        while pending:
+            parent = pending.popleft()
+            for char, state in self._goto[parent].items():
+                pending.append(state)
+                
+                fallback = self._fail[parent]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[state] = self._goto[fallback].get(char, 0)
+                self._output[state] = self._output[state] + self._output[self._fail[state]]
+        
+        self._built = True
+    
+    def find_all(self, text: str) -> List[Tuple[int, int, Any]]:
+        """Return (start, end, payload) for every term occurrence in text"""
+        if not self._built:
+            self.build()
+        
+        goto, fail, output = self._goto, self._fail, self._output
+        matches = []
+        state = 0
+        
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            
+            for length, payload in output[state]:
+                matches.append((index + 1 - length, index + 1, payload))
+        
+        return matches
+
 class BusinessEntityExtractor:
     """Extract business entities from African language text"""
     
+    # Vocabulary categories in reporting order, with the entity type and confidence each produces
+    VOCABULARY_CATEGORIES = [
+        ('products', 'product', EntityType.PRODUCT, 0.9),
+        ('quantities', 'quantity', EntityType.QUANTITY, 0.8),
+        ('actions', 'action', EntityType.PRODUCT, 0.9),  # Using PRODUCT as general entity
+        ('money', 'money', EntityType.PRICE, 0.8)
+    ]
+    
+    # One automaton per language, shared by every extractor instance
+    _matchers: Dict[str, VocabularyMatcher] = {}
+    
     def __init__(self):
         self.vocabulary = AfricanBusinessVocabulary.BUSINESS_VOCABULARY
         self.cultural_expressions = AfricanBusinessVocabulary.CULTURAL_EXPRESSIONS
@@ -477,6 +560,9 @@ class BusinessEntityExtractor:
             'ig': r'\b(otu|abụọ|atọ|anọ|ise|isii|asaa|asatọ|itoolu|iri|\d+)\b',
             'ha': r'\b(ɗaya|biyu|uku|huɗu|biyar|shida|bakwai|takwas|tara|goma|\d+)\b'
         }
+        self._compiled_number_patterns = {
+            language: re.compile(pattern) for language, pattern in self.number_patterns.items()
+        }
         
         self.currency_patterns = {
             'sw': r'\b(shilingi|dola|pesa)\b',
@@ -486,129 +572,98 @@ class BusinessEntityExtractor:
             'ha': r'\b(naira|dola|kuɗi)\b'
         }
     
-    def extract_entities(self, text: str, language: str) -> List[Entity]:
-        """Extract entities from text"""
-        entities = []
-        text_lower = text.lower()
+    @classmethod
+    def get_matcher(cls, language: str) -> VocabularyMatcher:
+        """Get (building on first use) the vocabulary automaton for a language"""
+        matcher = cls._matchers.get(language)
+        if matcher is None:
+            matcher = cls._build_matcher(language)
+            cls._matchers[language] = matcher
+        return matcher
+    
+    @classmethod
+    def _build_matcher(cls, language: str) -> VocabularyMatcher:
+        """Compile business vocabulary and cultural expressions into one automaton
         
-        # Get vocabulary for the language
-        lang_vocab = self.vocabulary.get(language, {})
+        Each payload carries a rank that preserves vocabulary order, so entities
+        come out in the same category and term order as the vocabulary tables.
+        """
+        matcher = VocabularyMatcher()
+        lang_vocab = AfricanBusinessVocabulary.BUSINESS_VOCABULARY.get(language, {})
+        rank = 0
         
-        # Extract products
-        entities.extend(self._extract_products(text_lower, language, lang_vocab))
+        for vocab_key, category, entity_type, confidence in cls.VOCABULARY_CATEGORIES:
+            for term_key, term_names in lang_vocab.get(vocab_key, {}).items():
+                if category == 'money' and 'currency' in term_key:
+                    term_type = EntityType.CURRENCY
+                else:
+                    term_type = entity_type
+                for name in [term_key] + term_names:
+                    matcher.add(name.lower(), (rank, category, term_key, name, term_type, confidence))
+                    rank += 1
         
-        # Extract quantities
-        entities.extend(self._extract_quantities(text_lower, language, lang_vocab))
+        for category, terms in AfricanBusinessVocabulary.CULTURAL_EXPRESSIONS.get(language, {}).items():
+            for term in terms:
+                matcher.add(term.lower(), (rank, 'cultural', category, term, EntityType.PERSON, 0.7))
+                rank += 1
         
-        # Extract actions
-        entities.extend(self._extract_actions(text_lower, language, lang_vocab))
+        matcher.build()
+        return matcher
+    
+    def extract_entities(self, text: str, language: str, text_lower: Optional[str] = None) -> List[Entity]:
+        """Extract entities from text (text_lower lets callers share one lowercased copy)"""
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Extract money-related entities
-        entities.extend(self._extract_money_entities(text_lower, language, lang_vocab))
+        # Products, quantities, actions, money and cultural expressions in one pass
+        vocabulary_entities, cultural_entities = self._extract_vocabulary_entities(text_lower, language)
         
         # Extract numbers
-        entities.extend(self._extract_numbers(text_lower, language))
-        
-        # Extract cultural expressions
-        entities.extend(self._extract_cultural_expressions(text_lower, language))
-        
-        return entities
+        return vocabulary_entities + self._extract_numbers(text_lower, language) + cultural_entities
     
-    def _extract_products(self, text: str, language: str, vocab: Dict) -> List[Entity]:
-        """Extract product entities"""
-        entities = []
-        products = vocab.get('products', {})
-        
-        for product_key, product_names in products.items():
-            for name in [product_key] + product_names:
-                if name.lower() in text:
-                    start_pos = text.find(name.lower())
-                    entities.append(Entity(
-                        text=name,
-                        entity_type=EntityType.PRODUCT,
-                        value=product_key,
-                        confidence=0.9,
-                        start_pos=start_pos,
-                        end_pos=start_pos + len(name),
-                        language=language,
-                        metadata={'category': 'product', 'normalized': product_key}
-                    ))
+    def _extract_vocabulary_entities(self, text: str, language: str) -> Tuple[List[Entity], List[Entity]]:
+        """Extract every vocabulary and cultural-expression occurrence with the language automaton"""
+        matches = self.get_matcher(language).find_all(text)
+        matches.sort(key=lambda match: (match[2][0], match[0]))
         
-        return entities
-    
-    def _extract_quantities(self, text: str, language: str, vocab: Dict) -> List[Entity]:
-        """Extract quantity entities"""
-        entities = []
-        quantities = vocab.get('quantities', {})
-        
-        for quantity_key, quantity_names in quantities.items():
-            for name in [quantity_key] + quantity_names:
-                if name.lower() in text:
-                    start_pos = text.find(name.lower())
-                    entities.append(Entity(
-                        text=name,
-                        entity_type=EntityType.QUANTITY,
-                        value=quantity_key,
-                        confidence=0.8,
-                        start_pos=start_pos,
-                        end_pos=start_pos + len(name),
-                        language=language,
-                        metadata={'category': 'quantity', 'normalized': quantity_key}
-                    ))
-        
-        return entities
-    
-    def _extract_actions(self, text: str, language: str, vocab: Dict) -> List[Entity]:
-        """Extract action entities"""
-        entities = []
-        actions = vocab.get('actions', {})
-        
-        for action_key, action_names in actions.items():
-            for name in [action_key] + action_names:
-                if name.lower() in text:
-                    start_pos = text.find(name.lower())
-                    entities.append(Entity(
-                        text=name,
-                        entity_type=EntityType.PRODUCT,  # Using PRODUCT as general entity
-                        value=action_key,
-                        confidence=0.9,
-                        start_pos=start_pos,
-                        end_pos=start_pos + len(name),
-                        language=language,
-                        metadata={'category': 'action', 'normalized': action_key}
-                    ))
+        vocabulary_entities = []
+        cultural_entities = []
         
-        return entities
-    
-    def _extract_money_entities(self, text: str, language: str, vocab: Dict) -> List[Entity]:
-        """Extract money-related entities"""
-        entities = []
-        money_terms = vocab.get('money', {})
-        
-        for money_key, money_names in money_terms.items():
-            for name in [money_key] + money_names:
-                if name.lower() in text:
-                    start_pos = text.find(name.lower())
-                    entities.append(Entity(
-                        text=name,
-                        entity_type=EntityType.CURRENCY if 'currency' in money_key else EntityType.PRICE,
-                        value=money_key,
-                        confidence=0.8,
-                        start_pos=start_pos,
-                        end_pos=start_pos + len(name),
-                        language=language,
-                        metadata={'category': 'money', 'normalized': money_key}
-                    ))
+        for start_pos, _, payload in matches:
+            _, category, key, name, entity_type, confidence = payload
+            
+            if category == 'cultural':
+                cultural_entities.append(Entity(
+                    text=name,
+                    entity_type=entity_type,  # Using PERSON for cultural expressions
+                    value=name,
+                    confidence=confidence,
+                    start_pos=start_pos,
+                    end_pos=start_pos + len(name),
+                    language=language,
+                    cultural_context=CulturalContext.RESPECTFUL if key == 'respect' else CulturalContext.POLITE,
+                    metadata={'category': 'cultural', 'type': key}
+                ))
+            else:
+                vocabulary_entities.append(Entity(
+                    text=name,
+                    entity_type=entity_type,
+                    value=key,
+                    confidence=confidence,
+                    start_pos=start_pos,
+                    end_pos=start_pos + len(name),
+                    language=language,
+                    metadata={'category': category, 'normalized': key}
+                ))
         
-        return entities
+        return vocabulary_entities, cultural_entities
     
     def _extract_numbers(self, text: str, language: str) -> List[Entity]:
         """Extract number entities"""
         entities = []
-        pattern = self.number_patterns.get(language, r'\d+')
+        pattern = self._compiled_number_patterns.get(language)
+        matches = pattern.finditer(text) if pattern else re.finditer(r'\d+', text)
         
-        import re
-        matches = re.finditer(pattern, text)
         for match in matches:
             entities.append(Entity(
                 text=match.group(),
@@ -622,36 +677,71 @@ class BusinessEntityExtractor:
             ))
         
         return entities
-    
-    def _extract_cultural_expressions(self, text: str, language: str) -> List[Entity]:
-        """Extract cultural expressions"""
-        entities = []
-        expressions = self.cultural_expressions.get(language, {})
-        
-        for category, terms in expressions.items():
-            for term in terms:
-                if term.lower() in text:
-                    start_pos = text.find(term.lower())
-                    entities.append(Entity(
-                        text=term,
-                        entity_type=EntityType.PERSON,  # Using PERSON for cultural expressions
-                        value=term,
-                        confidence=0.7,
-                        start_pos=start_pos,
-                        end_pos=start_pos + len(term),
-                        language=language,
-                        cultural_context=CulturalContext.RESPECTFUL if category == 'respect' else CulturalContext.POLITE,
-                        metadata={'category': 'cultural', 'type': category}
-                    ))
-        
-        return entities
 
 class BusinessIntentClassifier:
     """Classify business intents from African language text"""
     
+    PATTERN_MEMO_SIZE = 4096
+    
     def __init__(self):
         self.entity_extractor = BusinessEntityExtractor()
         self.intent_patterns = self._build_intent_patterns()
+        self._intent_index = self._compile_intent_index()
+        
+        # Voice traffic repeats short phrases, so memoize pattern scans per (text, language)
+        self._pattern_memo = OrderedDict()
+        self.memo_stats = {'hits': 0, 'misses': 0}
+    
+    def _compile_intent_index(self) -> Dict[str, VocabularyMatcher]:
+        """Compile every intent pattern for a language into a single automaton"""
+        index = {}
+        rank = 0
+        
+        for intent, patterns in self.intent_patterns.items():
+            for language, lang_patterns in patterns.items():
+                matcher = index.setdefault(language, VocabularyMatcher())
+                for pattern in lang_patterns:
+                    matcher.add(pattern, (rank, intent, pattern))
+                    rank += 1
+        
+        for matcher in index.values():
+            matcher.build()
+        return index
+    
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Lowercase and collapse whitespace so repeated phrases share memo entries"""
+        return ' '.join(text.lower().split())
+    
+    def _scan_patterns(self, text_lower: str, language: str) -> Tuple[Dict[BusinessIntent, int], List[str]]:
+        """Score every intent's pattern matches in one pass, memoized on (text, language)
+        
+        Returns the pattern score per intent (10 per distinct matching pattern)
+        and the matched patterns formatted for debugging.
+        """
+        memo_key = (self.normalize_text(text_lower), language)
+        cached = self._pattern_memo.get(memo_key)
+        if cached is not None:
+            self._pattern_memo.move_to_end(memo_key)
+            self.memo_stats['hits'] += 1
+            return cached
+        
+        self.memo_stats['misses'] += 1
+        pattern_scores = {intent: 0 for intent in self.intent_patterns}
+        matched = {}
+        
+        matcher = self._intent_index.get(language)
+        if matcher is not None:
+            for _, _, (rank, intent, pattern) in matcher.find_all(memo_key[0]):
+                if rank not in matched:
+                    matched[rank] = f"{intent.value}: {pattern}"
+                    pattern_scores[intent] += 10
+        
+        result = (pattern_scores, [matched[rank] for rank in sorted(matched)])
+        self._pattern_memo[memo_key] = result
+        if len(self._pattern_memo) > self.PATTERN_MEMO_SIZE:
+            self._pattern_memo.popitem(last=False)
+        return result
     
     def _build_intent_patterns(self) -> Dict[BusinessIntent, Dict[str, List[str]]]:
         """Build intent classification patterns"""
@@ -700,33 +790,37 @@ class BusinessIntentClassifier:
             }
         }
     
-    def classify_intent(self, text: str, language: str, entities: List[Entity]) -> Intent:
+    def classify_intent(self, text: str, language: str, entities: List[Entity],
+                        text_lower: Optional[str] = None) -> Intent:
         """Classify business intent from text and entities"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Score each intent
-        intent_scores = {}
+        # Score every intent's patterns in a single scan
+        pattern_scores, pattern_matches = self._scan_patterns(text_lower, language)
         
-        for intent, patterns in self.intent_patterns.items():
-            score = 0
-            lang_patterns = patterns.get(language, [])
-            
-            # Check for pattern matches
-            for pattern in lang_patterns:
-                if pattern in text_lower:
-                    score += 10
-            
-            # Boost score based on entities
-            for entity in entities:
-                if intent == BusinessIntent.SELL and entity.metadata.get('category') == 'action' and 'sell' in str(entity.value):
-                    score += 15
-                elif intent == BusinessIntent.BUY and entity.metadata.get('category') == 'action' and 'buy' in str(entity.value):
-                    score += 15
-                elif intent == BusinessIntent.PRICE_INQUIRY and entity.entity_type == EntityType.PRICE:
-                    score += 10
-                elif entity.metadata.get('category') == 'product':
-                    score += 5
-            
+        # Tally the entity signals once rather than once per intent
+        sell_actions = buy_actions = prices = products = 0
+        for entity in entities:
+            category = entity.metadata.get('category')
+            if category == 'action':
+                sell_actions += 'sell' in str(entity.value)
+                buy_actions += 'buy' in str(entity.value)
+            elif category == 'product':
+                products += 1
+            if entity.entity_type == EntityType.PRICE:
+                prices += 1
+        
+        # Boost score based on entities
+        intent_scores = {}
+        for intent, score in pattern_scores.items():
+            score += products * 5
+            if intent == BusinessIntent.SELL:
+                score += sell_actions * 15
+            elif intent == BusinessIntent.BUY:
+                score += buy_actions * 15
+            elif intent == BusinessIntent.PRICE_INQUIRY:
+                score += prices * 10
             intent_scores[intent] = score
         
         # Find best intent
@@ -742,7 +836,7 @@ class BusinessIntentClassifier:
             confidence = 0.1
         
         # Determine cultural context
-        cultural_context = self._determine_cultural_context(text, language, entities)
+        cultural_context = self._determine_cultural_context(text, language, entities, text_lower)
         
         return Intent(
             intent=best_intent,
@@ -752,13 +846,15 @@ class BusinessIntentClassifier:
             cultural_context=cultural_context,
             metadata={
                 'intent_scores': intent_scores,
-                'pattern_matches': self._get_pattern_matches(text_lower, language)
+                'pattern_matches': pattern_matches
             }
         )
     
-    def _determine_cultural_context(self, text: str, language: str, entities: List[Entity]) -> CulturalContext:
+    def _determine_cultural_context(self, text: str, language: str, entities: List[Entity],
+                                    text_lower: Optional[str] = None) -> CulturalContext:
         """Determine cultural context from text and entities"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Check for respectful terms
         cultural_entities = [e for e in entities if e.metadata.get('category') == 'cultural']
@@ -787,15 +883,7 @@ class BusinessIntentClassifier:
     
     def _get_pattern_matches(self, text: str, language: str) -> List[str]:
         """Get all pattern matches for debugging"""
-        matches = []
-        
-        for intent, patterns in self.intent_patterns.items():
-            lang_patterns = patterns.get(language, [])
-            for pattern in lang_patterns:
-                if pattern in text:
-                    matches.append(f"{intent.value}: {pattern}")
-        
-        return matches
+        return self._scan_patterns(text, language)[1]
 
 class SentimentAnalyzer:
     """Analyze sentiment in African business contexts"""
@@ -854,9 +942,10 @@ class SentimentAnalyzer:
             }
         }
     
-    def analyze_sentiment(self, text: str, language: str) -> Dict[str, float]:
+    def analyze_sentiment(self, text: str, language: str, text_lower: Optional[str] = None) -> Dict[str, float]:
         """Analyze sentiment of text"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         lexicon = self.sentiment_lexicon.get(language, {})
         
         scores = []
@@ -923,9 +1012,11 @@ class CulturalAnalyzer:
             }
         }
     
-    def analyze_cultural_context(self, text: str, language: str, entities: List[Entity]) -> Dict[str, Any]:
+    def analyze_cultural_context(self, text: str, language: str, entities: List[Entity],
+                                 text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Analyze cultural context of text"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         analysis = {
             'ubuntu_score': 0.0,
             'respect_score': 0.0,
@@ -977,6 +1068,10 @@ class CulturalAnalyzer:
 class NLUEngine:
     """Main Natural Language Understanding engine"""
     
+    # Batch sizing for analyze_many
+    BATCH_CHUNK_SIZE = 256
+    PROCESS_POOL_MIN_BATCH = 2000
+    
     def __init__(self):
         self.entity_extractor = BusinessEntityExtractor()
         self.intent_classifier = BusinessIntentClassifier()
@@ -992,23 +1087,78 @@ class NLUEngine:
     
     async def analyze(self, text: str, language: str, context: Optional[Dict[str, Any]] = None) -> NLUResult:
         """Perform complete NLU analysis"""
+        result = self._analyze_text(text, language, context)
+        self._record_result(result)
+        return result
+    
+    async def analyze_many(self, texts: List[str], language: str,
+                           context: Optional[Dict[str, Any]] = None,
+                           max_workers: Optional[int] = None) -> List[NLUResult]:
+        """Analyze a batch of texts in one language, preserving input order
+        
+        Each text is lowercased once and shared by all four analyzers. Batches
+        of at least PROCESS_POOL_MIN_BATCH texts are fanned out over a process
+        pool when max_workers is given; smaller batches run in-process,
+        yielding to the event loop between chunks.
+        """
+        if not texts:
+            return []
+        
+        if max_workers and max_workers > 1 and len(texts) >= self.PROCESS_POOL_MIN_BATCH:
+            results = await self._analyze_in_process_pool(texts, language, context, max_workers)
+        else:
+            results = []
+            for offset in range(0, len(texts), self.BATCH_CHUNK_SIZE):
+                chunk = texts[offset:offset + self.BATCH_CHUNK_SIZE]
+                results.extend(self._analyze_text(text, language, context) for text in chunk)
+                await asyncio.sleep(0)
+        
+        for result in results:
+            self._record_result(result)
+        return results
+    
+    async def _analyze_in_process_pool(self, texts: List[str], language: str,
+                                       context: Optional[Dict[str, Any]],
+                                       max_workers: int) -> List[NLUResult]:
+        """Split a batch into chunks and analyze them on worker processes"""
+        chunk_size = max(self.BATCH_CHUNK_SIZE, -(-len(texts) // max_workers))
+        chunks = [texts[offset:offset + chunk_size] for offset in range(0, len(texts), chunk_size)]
+        loop = asyncio.get_running_loop()
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = await asyncio.gather(*[
+                loop.run_in_executor(executor, _analyze_chunk, chunk, language, context)
+                for chunk in chunks
+            ])
+        
+        return [result for chunk in chunk_results for result in chunk]
+    
+    def _record_result(self, result: NLUResult):
+        """Fold a finished analysis into the performance statistics"""
+        self.performance_stats['total_requests'] += 1
+        if 'error' not in result.metadata:
+            self.performance_stats['successful_analyses'] += 1
+            self._update_stats(result.processing_time, result.language, result.intent.intent)
+    
+    def _analyze_text(self, text: str, language: str, context: Optional[Dict[str, Any]] = None) -> NLUResult:
+        """Run every analyzer over one text without touching performance statistics"""
         start_time = datetime.now()
         
         try:
-            # Update stats
-            self.performance_stats['total_requests'] += 1
+            # Normalize once and share the lowercased text with every analyzer
+            text_lower = text.lower()
             
             # Extract entities
-            entities = self.entity_extractor.extract_entities(text, language)
+            entities = self.entity_extractor.extract_entities(text, language, text_lower)
             
             # Classify intent
-            intent = self.intent_classifier.classify_intent(text, language, entities)
+            intent = self.intent_classifier.classify_intent(text, language, entities, text_lower)
             
             # Analyze sentiment
-            sentiment = self.sentiment_analyzer.analyze_sentiment(text, language)
+            sentiment = self.sentiment_analyzer.analyze_sentiment(text, language, text_lower)
             
             # Analyze cultural context
-            cultural_analysis = self.cultural_analyzer.analyze_cultural_context(text, language, entities)
+            cultural_analysis = self.cultural_analyzer.analyze_cultural_context(text, language, entities, text_lower)
             
             # Build business context
             business_context = self._build_business_context(intent, entities, context)
@@ -1022,10 +1172,6 @@ class NLUEngine:
                           cultural_analysis.get('respect_score', 0) + 
                           cultural_analysis.get('business_etiquette_score', 0)) / 3) / 3
             
-            # Update performance stats
-            self.performance_stats['successful_analyses'] += 1
-            self._update_stats(processing_time, language, intent.intent)
-            
             # Create result
             result = NLUResult(
                 text=text,
@@ -1148,6 +1294,8 @@ class NLUEngine:
                 self.performance_stats['successful_analyses'] / 
                 max(1, self.performance_stats['total_requests'])
             ) * 100,
+            'intent_memo': dict(self.intent_classifier.memo_stats,
+                                size=len(self.intent_classifier._pattern_memo)),
             'supported_languages': len(AfricanBusinessVocabulary.BUSINESS_VOCABULARY),
             'supported_intents': len(BusinessIntent)
         }
@@ -1155,3 +1303,7 @@ class NLUEngine:
 # Global NLU engine instance
 nlu_engine = NLUEngine()
 
+def _analyze_chunk(texts: List[str], language: str, context: Optional[Dict[str, Any]]) -> List[NLUResult]:
+    """Process-pool worker for NLUEngine.analyze_many, using the worker's own engine"""
+    return [nlu_engine._analyze_text(text, language, context) for text in texts]
+
@@ -0,0 +1,145 @@
+"""
+WebWaka Provider Health
+Latency/error tracking and circuit breaking shared by the AI provider routers
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+class ProviderHealth:
+    """Live health of one provider: EWMA error rate and cost, recent latency percentiles and a circuit breaker
+
+    Scores start from the configured priors and move towards observed traffic;
+    a provider that stops receiving traffic drifts back to its priors over
+    `recovery_seconds`, so one that lost out is eventually tried again.
+    After `failure_threshold` consecutive failures the breaker opens and the
+    provider is skipped; once `open_seconds` have passed a single half-open
+    probe is let through, and its outcome closes or re-opens the breaker.
+    A probe that ends without an outcome (cancelled) releases its slot, and
+    one that never reports back is abandoned after `probe_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, prior_error_rate: float = 0.05, prior_latency_score: float = 0.8,
+                 prior_cost: float = 0.0, alpha: float = 0.2, latency_target: float = 2.0,
+                 window: int = 256, failure_threshold: int = 5, open_seconds: float = 30.0,
+                 recovery_seconds: float = 300.0, probe_timeout: float = 60.0):
+        self.alpha = alpha
+        self.latency_target = latency_target
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.recovery_seconds = recovery_seconds
+        self.probe_timeout = probe_timeout
+        self._prior_error_rate = prior_error_rate
+        self.error_rate = prior_error_rate
+        self.latency_ewma: Optional[float] = None
+        self.cost_ewma = prior_cost
+        self._prior_latency_score = prior_latency_score
+        self._latencies = deque(maxlen=window)
+        self._percentiles: Optional[Tuple[float, float]] = None
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self.samples = 0
+        self.last_observed = 0.0
+
+    def is_available(self) -> bool:
+        """True if a request may be routed here; does not reserve the half-open probe"""
+        if self.state == self.CLOSED:
+            return True
+        if self._probe_pending():
+            return False
+        return time.monotonic() - self.opened_at >= self.open_seconds
+
+    def begin_request(self):
+        """Mark the provider as chosen; an open breaker past its cool-down becomes the probe"""
+        if self.state != self.CLOSED and not self._probe_pending():
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = True
+            self._probe_started = time.monotonic()
+
+    def release_probe(self):
+        """End a request without an outcome (e.g. cancelled) so the next one can probe"""
+        self._probe_in_flight = False
+
+    def _probe_pending(self) -> bool:
+        return self._probe_in_flight and time.monotonic() - self._probe_started < self.probe_timeout
+
+    def record_success(self, latency: float, cost: float = 0.0):
+        self._observe(latency, error=0.0)
+        self.cost_ewma += self.alpha * (cost - self.cost_ewma)
+        self.consecutive_failures = 0
+        self.state = self.CLOSED
+        self._probe_in_flight = False
+
+    def record_failure(self, latency: Optional[float] = None):
+        self._observe(latency, error=1.0)
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def _observe(self, latency: Optional[float], error: float):
+        self.error_rate = self._current_error_rate()
+        self.samples += 1
+        self.last_observed = time.monotonic()
+        self.error_rate += self.alpha * (error - self.error_rate)
+        if latency is not None:
+            self.latency_ewma = latency if self.latency_ewma is None else (
+                self.latency_ewma + self.alpha * (latency - self.latency_ewma))
+            self._latencies.append(latency)
+            self._percentiles = None
+
+    def _recency(self) -> float:
+        """1.0 right after an observation, decaying towards 0.0 while idle"""
+        if not self.samples:
+            return 0.0
+        return math.exp(-(time.monotonic() - self.last_observed) / self.recovery_seconds)
+
+    def _current_error_rate(self) -> float:
+        return self._prior_error_rate + (self.error_rate - self._prior_error_rate) * self._recency()
+
+    def latency_percentiles(self) -> Tuple[Optional[float], Optional[float]]:
+        """(p50, p99) over the recent latency window"""
+        if not self._latencies:
+            return None, None
+        if self._percentiles is None:
+            ordered = sorted(self._latencies)
+            last = len(ordered) - 1
+            self._percentiles = (ordered[int(round(0.50 * last))], ordered[int(round(0.99 * last))])
+        return self._percentiles
+
+    def latency_score(self) -> float:
+        """1.0 for instant answers, 0.5 when p50/p99 sit at the latency target"""
+        p50, p99 = self.latency_percentiles()
+        if p50 is None:
+            return self._prior_latency_score
+        target = self.latency_target
+        observed = 0.6 / (1.0 + p50 / target) + 0.4 / (1.0 + p99 / target)
+        return self._prior_latency_score + (observed - self._prior_latency_score) * self._recency()
+
+    def score(self) -> float:
+        """Reliability and latency blended into 0..1 (higher is better)"""
+        return (1.0 - self._current_error_rate()) * 0.6 + self.latency_score() * 0.4
+
+    def snapshot(self) -> Dict[str, Any]:
+        p50, p99 = self.latency_percentiles()
+        return {
+            "state": self.state,
+            "score": round(self.score(), 4),
+            "error_rate": round(self._current_error_rate(), 4),
+            "latency_p50": p50,
+            "latency_p99": p99,
+            "latency_ewma": self.latency_ewma,
+            "cost_ewma": self.cost_ewma,
+            "consecutive_failures": self.consecutive_failures,
+            "samples": self.samples
+        }
@@ -0,0 +1,303 @@
+"""
+WebWaka Digital Operating System - Phase 3
+Referral Agent Scheduler
+
+Shared scheduler and work queues for the referral system agents. One dispatcher
+thread waits on a condition variable until the next job is due or new work is
+enqueued, and a bounded worker pool runs the jobs, so background services no
+longer hold a sleeping thread each per agent instance.
+
+Version: 3.8.0
+"""
+
+import atexit
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_BATCH = 500
+SHUTDOWN_TIMEOUT_SECONDS = 30.0
+
+def _callable_ref(func: Callable) -> Callable[[], Optional[Callable]]:
+    """Hold bound methods weakly so scheduled work never keeps an agent alive"""
+    if hasattr(func, '__self__') and hasattr(func, '__func__'):
+        return weakref.WeakMethod(func)
+    return lambda: func
+
+class PeriodicJob:
+    """A recurring job; the next run is scheduled once the current one finishes"""
+
+    def __init__(self, scheduler: 'AgentScheduler', name: str, func: Callable[[], Any], interval: float):
+        self.scheduler = scheduler
+        self.name = name
+        self.interval = interval
+        self._func_ref = _callable_ref(func)
+        self.cancelled = False
+        self.runs = 0
+        self.failures = 0
+        self.last_run: Optional[float] = None
+
+    def cancel(self):
+        """Stop scheduling further runs"""
+        self.cancelled = True
+
+    def _run(self):
+        func = self._func_ref()
+        if func is None:
+            # Owner was garbage collected
+            self.cancelled = True
+            return
+
+        try:
+            func()
+            self.runs += 1
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"Scheduled job {self.name} failed: {e}")
+        finally:
+            self.last_run = time.time()
+            if not self.cancelled:
+                self.scheduler._schedule(self, self.interval)
+
+class WorkQueue:
+    """
+    Named queue of work items drained in batches by a handler
+
+    put() wakes the scheduler immediately. At most one handler call runs per
+    queue at a time; items arriving meanwhile are picked up as the next batch.
+    A batch whose handler raised is kept in dead_letters for retry_dead_letters().
+    """
+
+    def __init__(self, scheduler: 'AgentScheduler', name: str, handler: Callable[[List[Any]], Any], max_batch: int):
+        self.scheduler = scheduler
+        self.name = name
+        self.max_batch = max_batch
+        self._handler_ref = _callable_ref(handler)
+        self._items: List[Any] = []
+        self.dead_letters: List[Any] = []
+        self._lock = threading.Lock()
+        self._running = False
+        self.cancelled = False
+        self.processed = 0
+        self.failures = 0
+
+    def put(self, item: Any):
+        """Enqueue one item"""
+        self.put_many([item])
+
+    def put_many(self, items: List[Any]):
+        """Enqueue several items with a single wake-up"""
+        if self.cancelled:
+            raise RuntimeError(f"Work queue {self.name} is closed")
+        with self._lock:
+            start = len(self._items)
+            self._items.extend(items)
+            should_dispatch = not self._running
+            self._running = True
+        if should_dispatch:
+            try:
+                self.scheduler._submit(self._drain)
+            except Exception:
+                # Nothing will drain the queue; take the items back so the caller can retry
+                with self._lock:
+                    del self._items[start:start + len(items)]
+                    self._running = False
+                raise
+
+    def pending(self) -> int:
+        """Number of items waiting for the handler"""
+        with self._lock:
+            return len(self._items)
+
+    def retry_dead_letters(self) -> int:
+        """Re-enqueue items from failed batches; returns how many were queued"""
+        with self._lock:
+            items = self.dead_letters
+            self.dead_letters = []
+        if items:
+            self.put_many(items)
+        return len(items)
+
+    def cancel(self):
+        """Stop accepting items; anything already queued is still processed"""
+        self.cancelled = True
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                batch = self._items[:self.max_batch]
+                del self._items[:self.max_batch]
+                if not batch:
+                    self._running = False
+                    return
+
+            handler = self._handler_ref()
+            if handler is None:
+                with self._lock:
+                    self._items.clear()
+                    self._running = False
+                self.cancelled = True
+                return
+
+            try:
+                handler(batch)
+                self.processed += len(batch)
+            except Exception as e:
+                self.failures += 1
+                with self._lock:
+                    self.dead_letters.extend(batch)
+                logger.error(f"Work queue {self.name} handler failed on {len(batch)} items, kept as dead letters: {e}")
+
+class AgentScheduler:
+    """Condition-variable driven scheduler with a bounded worker pool"""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+        self._condition = threading.Condition()
+        self._timers: List[Any] = []  # heap of (due, sequence, job)
+        self._sequence = itertools.count()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._queues = weakref.WeakSet()
+        self._stopping = False
+
+    def schedule_periodic(self, name: str, func: Callable[[], Any], interval: float, initial_delay: Optional[float] = None) -> PeriodicJob:
+        """Run func every interval seconds, first after initial_delay (default interval)"""
+        job = PeriodicJob(self, name, func, interval)
+        self._schedule(job, interval if initial_delay is None else initial_delay)
+        return job
+
+    def create_queue(self, name: str, handler: Callable[[List[Any]], Any], max_batch: int = DEFAULT_MAX_BATCH) -> WorkQueue:
+        """Create a work queue whose handler runs as soon as items are enqueued"""
+        queue = WorkQueue(self, name, handler, max_batch)
+        with self._condition:
+            self._queues.add(queue)
+        return queue
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """Run a one-off callable on the worker pool"""
+        return self._submit(func, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, timeout: float = SHUTDOWN_TIMEOUT_SECONDS):
+        """Stop timers, let queued work finish and release the worker threads"""
+        with self._condition:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._timers.clear()
+            self._condition.notify_all()
+            dispatcher = self._dispatcher
+            executor = self._executor
+
+        if dispatcher is not None and wait:
+            dispatcher.join(timeout)
+
+        # Running jobs and queue drains finish before the workers exit
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+        logger.info("Agent scheduler shut down")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics"""
+        with self._condition:
+            scheduled_jobs = sum(1 for _, _, job in self._timers if not job.cancelled)
+            next_due = self._timers[0][0] if self._timers else None
+            queues = list(self._queues)
+
+        return {
+            'max_workers': self.max_workers,
+            'scheduled_jobs': scheduled_jobs,
+            'next_run_in': max(0.0, next_due - time.monotonic()) if next_due is not None else None,
+            'queues': {
+                queue.name: {
+                    'pending': queue.pending(),
+                    'processed': queue.processed,
+                    'failures': queue.failures,
+                    'dead_letters': len(queue.dead_letters)
+                }
+                for queue in queues if not queue.cancelled
+            },
+            'stopping': self._stopping
+        }
+
+    def _ensure_started(self):
+        # Called with the condition held
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="referral-agent-worker"
+            )
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop,
+                name="referral-agent-scheduler",
+                daemon=True
+            )
+            self._dispatcher.start()
+
+    def _schedule(self, job: PeriodicJob, delay: float):
+        with self._condition:
+            if self._stopping:
+                return
+            self._ensure_started()
+            heapq.heappush(self._timers, (time.monotonic() + delay, next(self._sequence), job))
+            # Wake the dispatcher only if this job is now the earliest
+            if self._timers[0][2] is job:
+                self._condition.notify()
+
+    def _submit(self, func: Callable, *args, **kwargs):
+        with self._condition:
+            if self._stopping and self._executor is None:
+                raise RuntimeError("Agent scheduler is shut down")
+            self._ensure_started()
+            return self._executor.submit(func, *args, **kwargs)
+
+    def _dispatch_loop(self):
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    if not self._timers:
+                        self._condition.wait()
+                        continue
+                    delay = self._timers[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._stopping:
+                    return
+
+                _, _, job = heapq.heappop(self._timers)
+                if job.cancelled:
+                    continue
+                # Submit under the condition: shutdown() sets _stopping here
+                # before it shuts the executor down, so submit cannot race it
+                self._executor.submit(job._run)
+
+_scheduler: Optional[AgentScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> AgentScheduler:
+    """Get the process-wide scheduler shared by the referral agents"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None or _scheduler._stopping:
+            _scheduler = AgentScheduler()
+        return _scheduler
+
+def shutdown_scheduler(wait: bool = True):
+    """Shut down the shared scheduler, if one was started"""
+    with _scheduler_lock:
+        scheduler = _scheduler
+    if scheduler is not None:
+        scheduler.shutdown(wait=wait)
+
+atexit.register(shutdown_scheduler)
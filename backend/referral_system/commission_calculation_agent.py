@@ -17,6 +17,7 @@ import time
 import uuid
 import logging
 import asyncio
+import itertools
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -25,9 +26,12 @@ from pathlib import Path
 from enum import Enum
 import yaml
 import hashlib
+import numpy as np
 from decimal import Decimal, ROUND_HALF_UP
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -175,8 +179,15 @@ class CommissionCalculationAgent:
     multi-level commission distribution, and performance bonuses.
     """
     
-    def __init__(self):
-        """Initialize the Commission Calculation Agent"""
+    def __init__(self, hierarchy_agent=None):
+        """
+        Initialize the Commission Calculation Agent
+        
+        Args:
+            hierarchy_agent: PartnerHierarchyAgent used to resolve uplines and
+                revenue targets; without one a representative affiliate chain
+                and fixed performance figures are used
+        """
         self.agent_id = "commission_calculation_agent"
         self.version = "3.8.0"
         self.calculation_engine = CalculationEngine()
@@ -191,6 +202,10 @@ class CommissionCalculationAgent:
         self.commission_calculations = {}
         self.commission_distributions = {}
         self.performance_metrics = {}
+        self.partner_sales = {}
+        self.hierarchy_agent = hierarchy_agent
+        # Serializes settlement between batch calls and the calculation queue
+        self._settlement_lock = threading.RLock()
         self.commission_configurations = self._load_commission_configurations()
         self.calculation_rules = self._load_calculation_rules()
         
@@ -225,9 +240,11 @@ class CommissionCalculationAgent:
             
             # Step 2: Get partner hierarchy
             hierarchy_result = await self._get_partner_hierarchy(transaction.partner_id)
+            if not hierarchy_result['valid']:
+                raise ValueError(hierarchy_result['error'])
             
             # Step 3: Calculate performance metrics
-            performance_result = await self._calculate_performance_metrics(transaction.partner_id)
+            performance_result = await self._calculate_performance_metrics(transaction.partner_id, hierarchy_result)
             
             # Step 4: Apply commission rules
             rules_result = await self._apply_commission_rules(transaction, hierarchy_result)
@@ -255,8 +272,8 @@ class CommissionCalculationAgent:
             # Step 10: Store calculations
             storage_result = await self._store_commission_calculations(distribution_result)
             
-            # Calculate totals
-            total_commission = direct_commission['commission_amount']
+            # Calculate totals from the distributed (capped, rounded) amounts
+            total_commission = direct_commission['total_commission']
             for indirect in indirect_commissions:
                 total_commission += indirect['commission_amount']
             for bonus in performance_bonuses.values():
@@ -335,33 +352,15 @@ class CommissionCalculationAgent:
         logger.info(f"Processing batch commission calculations for {len(transactions)} transactions")
         
         try:
-            # Process transactions concurrently
-            tasks = []
-            for transaction in transactions:
-                task = asyncio.create_task(self.calculate_commission(transaction))
-                tasks.append(task)
+            # Settle the whole window at once: uplines, performance and rate
+            # tables are resolved once per distinct partner, not per transaction.
+            # The settlement is CPU-bound, so it runs off the event loop.
+            settlement = await asyncio.to_thread(self._settle_locked, transactions)
             
-            # Wait for all calculations to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Aggregate results
-            successful_results = [r for r in results if isinstance(r, CommissionCalculationResult) and r.status == "completed"]
-            failed_results = [r for r in results if not isinstance(r, CommissionCalculationResult) or r.status != "completed"]
-            
-            # Calculate totals
             total_transactions = len(transactions)
-            successful_transactions = len(successful_results)
-            total_commissions = sum(r.commissions_calculated for r in successful_results)
-            total_amount = sum(r.total_commission_amount for r in successful_results)
-            
-            # Aggregate performance bonuses
-            all_bonuses = {}
-            for result in successful_results:
-                for partner_id, bonus in result.performance_bonuses.items():
-                    if partner_id in all_bonuses:
-                        all_bonuses[partner_id] += bonus
-                    else:
-                        all_bonuses[partner_id] = bonus
+            successful_transactions = settlement['transactions_settled']
+            failed_transactions = len(settlement['errors'])
+            total_amount = settlement['total_commission']
             
             # Calculate operation time
             operation_time = time.time() - start_time
@@ -370,23 +369,26 @@ class CommissionCalculationAgent:
             result = CommissionCalculationResult(
                 operation_id=operation_id,
                 operation_type="batch_commission_calculation",
-                status="completed" if len(failed_results) == 0 else "partial",
+                status="completed" if failed_transactions == 0 else "partial",
                 transactions_processed=successful_transactions,
-                commissions_calculated=total_commissions,
+                commissions_calculated=settlement['commissions_calculated'],
                 total_commission_amount=total_amount,
                 currency=transactions[0].currency if transactions else "USD",
                 operation_time=operation_time,
                 distribution_summary={
-                    'successful_calculations': len(successful_results),
-                    'failed_calculations': len(failed_results),
-                    'success_rate': (successful_transactions / total_transactions * 100) if total_transactions > 0 else 0
+                    'successful_calculations': successful_transactions,
+                    'failed_calculations': failed_transactions,
+                    'success_rate': (successful_transactions / total_transactions * 100) if total_transactions > 0 else 0,
+                    'commission_by_type': settlement['commission_by_type'],
+                    'partners_resolved': settlement['partners_resolved']
                 },
-                performance_bonuses=all_bonuses,
+                performance_bonuses=settlement['performance_bonuses'],
                 validation_results={
                     'batch_processing': True,
-                    'all_successful': len(failed_results) == 0
+                    'all_successful': failed_transactions == 0,
+                    'calculations': settlement['over_distributed'] == 0
                 },
-                error_messages=[str(r) for r in failed_results if isinstance(r, Exception)]
+                error_messages=settlement['errors']
             )
             
             logger.info(f"Batch commission processing completed in {operation_time:.2f} seconds")
@@ -581,82 +583,75 @@ class CommissionCalculationAgent:
     
     def _start_background_services(self):
         """Start background services for commission calculation"""
-        # Real-time calculation service
-        self.realtime_calc_thread = threading.Thread(
-            target=self._realtime_calculation_service,
-            daemon=True
-        )
-        self.realtime_calc_thread.start()
-        
-        # Performance monitoring service
-        self.performance_monitor_thread = threading.Thread(
-            target=self._performance_monitoring_service,
-            daemon=True
-        )
-        self.performance_monitor_thread.start()
-        
-        # Payment processing service
-        self.payment_processing_thread = threading.Thread(
-            target=self._payment_processing_service,
-            daemon=True
-        )
-        self.payment_processing_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each;
+        # queued calculations and payouts are handled as soon as they arrive
+        scheduler = get_scheduler()
+        self.calculation_queue = scheduler.create_queue("commission.calculations", self._process_pending_calculations)
+        self.payment_queue = scheduler.create_queue("commission.payments", self._process_pending_payments)
+        self.background_jobs = [
+            # Monitor performance metrics, check every 5 minutes
+            scheduler.schedule_periodic("commission.performance_monitoring", self._monitor_performance_metrics, 300, initial_delay=0)
+        ]
         
         logger.info("Background commission calculation services started")
     
-    def _realtime_calculation_service(self):
-        """Background service for real-time calculations"""
-        while True:
-            try:
-                # Process pending calculations
-                self._process_pending_calculations()
-                time.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"Real-time calculation service error: {e}")
-                time.sleep(10)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled jobs and close its work queues"""
+        for job in self.background_jobs:
+            job.cancel()
+        self.calculation_queue.cancel()
+        self.payment_queue.cancel()
     
-    def _performance_monitoring_service(self):
-        """Background service for performance monitoring"""
-        while True:
-            try:
-                # Monitor performance metrics
-                self._monitor_performance_metrics()
-                time.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Performance monitoring service error: {e}")
-                time.sleep(300)
+    def queue_commission_calculations(self, transactions: List[Transaction]):
+        """Queue transactions for background settlement"""
+        self.calculation_queue.put_many(transactions)
     
-    def _payment_processing_service(self):
-        """Background service for payment processing"""
-        while True:
-            try:
-                # Process pending payments
-                self._process_pending_payments()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Payment processing service error: {e}")
-                time.sleep(3600)
+    def queue_commission_payments(self, calculation_ids: List[str]):
+        """Queue calculated commissions for payout"""
+        self.payment_queue.put_many(calculation_ids)
     
-    def _process_pending_calculations(self):
-        """Process pending calculations"""
-        # Implementation would process pending calculations
-        pass
+    def _process_pending_calculations(self, transactions: List[Transaction]):
+        """Settle a batch of queued transactions"""
+        settlement = self._settle_locked(transactions)
+        
+        for error in settlement['errors']:
+            logger.error(f"Queued commission calculation failed: {error}")
+        logger.info(f"Settled {settlement['transactions_settled']} queued transactions, "
+                    f"total commission {settlement['total_commission']}")
     
     def _monitor_performance_metrics(self):
         """Monitor performance metrics"""
         # Implementation would monitor performance metrics
         pass
     
-    def _process_pending_payments(self):
-        """Process pending payments"""
-        # Implementation would process pending payments
-        pass
+    def _process_pending_payments(self, calculation_ids: List[str]):
+        """Pay out a batch of queued commission calculations"""
+        paid = 0
+        for calculation_id in calculation_ids:
+            calculation = self.commission_calculations.get(calculation_id)
+            if calculation is None or calculation.status not in (CommissionStatus.CALCULATED, CommissionStatus.APPROVED):
+                continue
+            
+            if self.payment_engine.process_payment(calculation):
+                calculation.status = CommissionStatus.PAID
+                calculation.payment_date = datetime.now()
+                paid += 1
+            else:
+                logger.error(f"Commission payment failed for calculation {calculation_id}")
+        
+        logger.info(f"Paid {paid}/{len(calculation_ids)} queued commissions")
     
     async def _validate_transaction(self, transaction: Transaction) -> Dict[str, Any]:
         """Validate transaction"""
+        errors = self._check_transaction(transaction)
+        
+        return {
+            'valid': len(errors) == 0,
+            'errors': errors
+        }
+    
+    def _check_transaction(self, transaction: Transaction) -> List[str]:
+        """Collect validation errors for a transaction"""
         errors = []
         
         # Check required fields
@@ -680,16 +675,34 @@ class CommissionCalculationAgent:
         if transaction.amount < self.calculation_rules['calculation']['minimum_transaction']:
             errors.append("Transaction amount below minimum")
         
-        return {
-            'valid': len(errors) == 0,
-            'errors': errors
-        }
+        return errors
     
     async def _get_partner_hierarchy(self, partner_id: str) -> Dict[str, Any]:
         """Get partner hierarchy for commission calculation"""
         try:
-            # Mock hierarchy data - in real implementation, this would fetch from partner hierarchy agent
-            hierarchy = {
+            hierarchy = self._resolve_partner_hierarchy(partner_id)
+            if hierarchy is None:
+                return {
+                    'valid': False,
+                    'error': f"Partner {partner_id} not found in hierarchy"
+                }
+            
+            return {
+                'valid': True,
+                'hierarchy': hierarchy
+            }
+            
+        except Exception as e:
+            return {
+                'valid': False,
+                'error': str(e)
+            }
+    
+    def _resolve_partner_hierarchy(self, partner_id: str) -> Optional[Dict[str, Any]]:
+        """Resolve a partner's level and upline from the hierarchy agent"""
+        if self.hierarchy_agent is None:
+            # Standalone: use a representative six-level affiliate chain
+            return {
                 'partner_id': partner_id,
                 'level': 'affiliate',
                 'parent_partners': [
@@ -699,12 +712,35 @@ class CommissionCalculationAgent:
                     {'partner_id': 'regional_001', 'level': 'regional'},
                     {'partner_id': 'continental_001', 'level': 'continental'}
                 ],
-                'depth': 6
+                'depth': 6,
+                'revenue_target': None
             }
+        
+        partners = self.hierarchy_agent.partners
+        partner = partners.get(partner_id)
+        if partner is None:
+            return None
+        
+        upline = self.hierarchy_agent.get_upline(partner_id)
+        return {
+            'partner_id': partner_id,
+            'level': partner.partner_level.value,
+            'parent_partners': [
+                {'partner_id': parent_id, 'level': partners[parent_id].partner_level.value}
+                for parent_id in upline
+            ],
+            'depth': len(upline) + 1,
+            'revenue_target': partner.performance_metrics.get('revenue_target')
+        }
+    
+    async def _calculate_performance_metrics(self, partner_id: str, hierarchy_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate performance metrics for partner"""
+        try:
+            performance = self._resolve_performance(partner_id, hierarchy_result['hierarchy'])
             
             return {
                 'valid': True,
-                'hierarchy': hierarchy
+                'performance': asdict(performance)
             }
             
         except Exception as e:
@@ -713,14 +749,27 @@ class CommissionCalculationAgent:
                 'error': str(e)
             }
     
-    async def _calculate_performance_metrics(self, partner_id: str) -> Dict[str, Any]:
-        """Calculate performance metrics for partner"""
-        try:
-            # Mock performance data - in real implementation, this would fetch actual performance data
+    def _resolve_performance(self, partner_id: str, hierarchy: Dict[str, Any]) -> PerformanceMetrics:
+        """Build performance metrics from recorded sales against the partner's revenue target"""
+        sales = self.partner_sales.get(partner_id, {})
+        performance = self._performance_for_sales(
+            partner_id, hierarchy, sales.get('total_sales', Decimal('0')),
+            sales.get('total_transactions', 0), sales.get('since')
+        )
+        self.performance_metrics[partner_id] = performance
+        return performance
+    
+    def _performance_for_sales(self, partner_id: str, hierarchy: Dict[str, Any], total_sales: Decimal,
+                               total_transactions: int, since: Optional[datetime]) -> PerformanceMetrics:
+        """Performance metrics for a partner with the given sales so far"""
+        now = datetime.now()
+        
+        if self.hierarchy_agent is None:
+            # Standalone: fixed figures for a partner performing well
             performance = PerformanceMetrics(
                 partner_id=partner_id,
-                period_start=datetime.now() - timedelta(days=30),
-                period_end=datetime.now(),
+                period_start=now - timedelta(days=30),
+                period_end=now,
                 total_sales=Decimal('50000.00'),
                 total_transactions=100,
                 average_transaction=Decimal('500.00'),
@@ -728,21 +777,83 @@ class CommissionCalculationAgent:
                 client_satisfaction=Decimal('0.90'),
                 performance_score=Decimal('0.88'),
                 bonus_multiplier=Decimal('1.2'),
-                calculated_at=datetime.now()
+                calculated_at=now
             )
+        else:
+            # Sales achievement against target picks the multiplier tier
+            thresholds = self.commission_configurations['performance_thresholds']
+            target = hierarchy.get('revenue_target')
+            achievement = total_sales / Decimal(str(target)) if target else Decimal('0')
+            tier = 'average'
+            for candidate in ('excellent', 'good'):
+                if achievement >= thresholds[candidate]['sales_target_achievement']:
+                    tier = candidate
+                    break
+            score = min(Decimal('1'), achievement / thresholds['excellent']['sales_target_achievement'])
             
-            self.performance_metrics[partner_id] = performance
-            
-            return {
-                'valid': True,
-                'performance': asdict(performance)
-            }
-            
-        except Exception as e:
-            return {
-                'valid': False,
-                'error': str(e)
-            }
+            performance = PerformanceMetrics(
+                partner_id=partner_id,
+                period_start=since or now,
+                period_end=now,
+                total_sales=total_sales,
+                total_transactions=total_transactions,
+                average_transaction=(total_sales / total_transactions).quantize(Decimal('0.01')) if total_transactions else Decimal('0'),
+                team_performance=Decimal('0'),
+                client_satisfaction=Decimal('0'),
+                performance_score=score.quantize(Decimal('0.0001'), rounding=ROUND_HALF_UP),
+                bonus_multiplier=self.commission_configurations['performance_multipliers'][tier],
+                calculated_at=now
+            )
+        
+        return performance
+    
+    def _performance_runs(self, partner_id: str, hierarchy: Dict[str, Any],
+                          amounts: List[Decimal]) -> List[Tuple[PerformanceMetrics, int, int]]:
+        """
+        Split a partner's transactions in a window into (performance, start, end) runs
+        
+        Each transaction is settled with the performance the partner had before
+        it, from recorded sales plus the running sum of earlier amounts in the
+        window, as calculate_commission would settle them one by one. Amounts
+        are positive, so tiers only rise and each run's end is found by bisection.
+        """
+        sales = self.partner_sales.get(partner_id, {})
+        recorded = sales.get('total_transactions', 0)
+        since = sales.get('since')
+        prior_sales = list(itertools.accumulate(amounts[:-1], initial=sales.get('total_sales', Decimal('0'))))
+        
+        def performance_at(index: int) -> PerformanceMetrics:
+            return self._performance_for_sales(partner_id, hierarchy, prior_sales[index], recorded + index, since)
+        
+        def tier(performance: PerformanceMetrics) -> Tuple[Decimal, str]:
+            return performance.bonus_multiplier, self._bonus_tier(performance.performance_score)
+        
+        runs = []
+        start = 0
+        while start < len(amounts):
+            performance = performance_at(start)
+            current = tier(performance)
+            low, high = start, len(amounts) - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if tier(performance_at(middle)) == current:
+                    low = middle
+                else:
+                    high = middle - 1
+            runs.append((performance, start, low + 1))
+            start = low + 1
+        
+        # Leave the performance the last transaction was settled with, as the per-transaction path does
+        self.performance_metrics[partner_id] = performance_at(len(amounts) - 1)
+        return runs
+    
+    def _bonus_tier(self, performance_score: Decimal) -> str:
+        """Map a performance score to its bonus tier"""
+        if performance_score >= Decimal('0.9'):
+            return 'excellent'
+        elif performance_score >= Decimal('0.8'):
+            return 'good'
+        return 'average'
     
     async def _apply_commission_rules(self, transaction: Transaction, hierarchy_result: Dict[str, Any]) -> Dict[str, Any]:
         """Apply commission rules to transaction"""
@@ -892,12 +1003,7 @@ class CommissionCalculationAgent:
         performance_score = Decimal(str(performance['performance_score']))
         
         # Determine performance tier
-        if performance_score >= Decimal('0.9'):
-            tier = 'excellent'
-        elif performance_score >= Decimal('0.8'):
-            tier = 'good'
-        else:
-            tier = 'average'
+        tier = self._bonus_tier(performance_score)
         
         # Calculate bonus amount
         bonus_rate = self.commission_configurations['rates'][hierarchy_result['hierarchy']['level']]['bonus']
@@ -1009,9 +1115,278 @@ class CommissionCalculationAgent:
     
     async def _store_transaction(self, transaction: Transaction):
         """Store transaction"""
-        self.transactions[transaction.transaction_id] = transaction
+        self._record_transaction(transaction)
         logger.info(f"Transaction {transaction.transaction_id} stored")
     
+    def _record_transaction(self, transaction: Transaction):
+        """Store transaction and add it to the partner's running sales"""
+        self.transactions[transaction.transaction_id] = transaction
+        
+        with self._settlement_lock:
+            sales = self.partner_sales.get(transaction.partner_id)
+            if sales is None:
+                sales = {'total_sales': Decimal('0'), 'total_transactions': 0, 'since': transaction.transaction_date}
+                self.partner_sales[transaction.partner_id] = sales
+            sales['total_sales'] += transaction.amount
+            sales['total_transactions'] += 1
+    
+    def _settle_locked(self, transactions: List[Transaction]) -> Dict[str, Any]:
+        """Settle a window while holding the settlement lock"""
+        with self._settlement_lock:
+            return self._settle_commission_window(transactions)
+    
+    def _settle_commission_window(self, transactions: List[Transaction]) -> Dict[str, Any]:
+        """
+        Calculate direct, indirect and bonus commissions for a settlement window
+        
+        Amounts and rates are held as scaled integer columns so a whole window is
+        computed with a few array operations, and half-up rounding to cents gives
+        exactly the amounts the per-transaction Decimal path produces. Each row
+        uses the partner's performance tier as of that transaction, so a partner
+        crossing a sales threshold mid-window moves up a tier as it would when
+        settled one transaction at a time.
+        """
+        rates = self.commission_configurations['rates']
+        inheritance = self.commission_configurations['inheritance']
+        multipliers = self.commission_configurations['performance_multipliers']
+        calculation_rules = self.calculation_rules['calculation']
+        max_levels = inheritance['max_levels']
+        
+        # Validate and resolve each distinct partner once
+        hierarchies = {}
+        partner_rows: Dict[str, List[int]] = {}
+        settled = []
+        errors = []
+        for transaction in transactions:
+            problems = self._check_transaction(transaction)
+            partner_id = transaction.partner_id
+            if not problems and partner_id not in hierarchies:
+                hierarchies[partner_id] = self._resolve_partner_hierarchy(partner_id)
+            if not problems and hierarchies[partner_id] is None:
+                problems = [f"Partner {partner_id} not found in hierarchy"]
+            
+            if problems:
+                errors.append(f"{transaction.transaction_id}: {', '.join(problems)}")
+            else:
+                partner_rows.setdefault(partner_id, []).append(len(settled))
+                settled.append(transaction)
+        
+        # Rate entries per run of rows a partner settles at the same performance tier
+        rate_entries = []
+        row_entries = [0] * len(settled)
+        for partner_id, rows in partner_rows.items():
+            hierarchy = hierarchies[partner_id]
+            level_rates = rates[hierarchy['level']]
+            
+            indirect_rates = []
+            current_rate = level_rates['indirect']
+            for parent in hierarchy['parent_partners'][:max_levels]:
+                if current_rate < inheritance['min_commission']:
+                    break
+                indirect_rates.append(current_rate)
+                current_rate = current_rate * inheritance['decay_rate']
+            
+            for performance, start, end in self._performance_runs(
+                    partner_id, hierarchy, [settled[row].amount for row in rows]):
+                for row in rows[start:end]:
+                    row_entries[row] = len(rate_entries)
+                rate_entries.append({
+                    'direct': level_rates['direct'],
+                    'multiplier': performance.bonus_multiplier,
+                    'bonus': level_rates['bonus'] * multipliers[self._bonus_tier(performance.performance_score)],
+                    'indirect': indirect_rates,
+                    'performance_score': performance.performance_score
+                })
+        
+        settlement = {
+            'transactions_settled': len(settled),
+            'commissions_calculated': 0,
+            'total_commission': Decimal('0.00'),
+            'commission_by_type': {},
+            'performance_bonuses': {},
+            'partners_resolved': len(partner_rows),
+            'over_distributed': 0,
+            'errors': errors
+        }
+        if not settled:
+            return settlement
+        
+        # Scale amounts and rates to integers with enough places to be exact
+        def places(value: Decimal) -> int:
+            return max(0, -value.as_tuple().exponent)
+        
+        all_rates = [rate for entry in rate_entries
+                     for rate in [entry['direct'] * entry['multiplier'], entry['bonus']] + entry['indirect']]
+        amount_places = max(2, max(places(t.amount) for t in settled))
+        rate_places = max(places(rate) for rate in all_rates)
+        
+        scaled_rates = [
+            (
+                int((entry['direct'] * entry['multiplier']).scaleb(rate_places)),
+                int(entry['bonus'].scaleb(rate_places)),
+                [int(rate.scaleb(rate_places)) for rate in entry['indirect']]
+            )
+            for entry in rate_entries
+        ]
+        amounts = [int(t.amount.scaleb(amount_places)) for t in settled]
+        largest_rate = max(int(rate.scaleb(rate_places)) for rate in all_rates)
+        dtype = np.int64 if max(amounts) * max(largest_rate, 1) < 2 ** 62 else object
+        
+        count = len(settled)
+        amount_column = np.array(amounts, dtype=dtype)
+        direct_column = np.empty(count, dtype=dtype)
+        bonus_column = np.empty(count, dtype=dtype)
+        indirect_matrix = np.zeros((count, max_levels), dtype=dtype)
+        for row, entry_index in enumerate(row_entries):
+            direct_rate, bonus_rate, indirect_rates = scaled_rates[entry_index]
+            direct_column[row] = direct_rate
+            bonus_column[row] = bonus_rate
+            indirect_matrix[row, :len(indirect_rates)] = indirect_rates
+        
+        # Products are in units of 10**-(amount_places + rate_places)
+        unit_exponent = amount_places + rate_places
+        to_cents = 10 ** (unit_exponent - 2)
+        direct_cents = self.calculation_engine.calculate_columns(
+            amount_column, direct_column, to_cents,
+            cap=int(calculation_rules['commission_cap'].scaleb(unit_exponent))
+        )
+        bonus_cents = self.calculation_engine.calculate_columns(
+            amount_column, bonus_column, to_cents,
+            cap=int(calculation_rules['performance_bonus_cap'].scaleb(unit_exponent))
+        )
+        indirect_cents = self.calculation_engine.calculate_columns(
+            amount_column[:, None], indirect_matrix, to_cents
+        )
+        indirect_mask = indirect_matrix > 0
+        total_cents = direct_cents + bonus_cents + indirect_cents.sum(axis=1)
+        
+        # Totals stay exact: integer cents converted to Decimal once
+        def to_decimal(cents) -> Decimal:
+            return Decimal(int(cents)).scaleb(-2)
+        
+        direct_total = to_decimal(direct_cents.sum())
+        indirect_total = to_decimal(indirect_cents.sum())
+        bonus_total = to_decimal(bonus_cents.sum())
+        settlement['commissions_calculated'] = count + int(indirect_mask.sum())
+        settlement['total_commission'] = direct_total + indirect_total + bonus_total
+        settlement['commission_by_type'] = {
+            CommissionType.DIRECT.value: direct_total,
+            CommissionType.INDIRECT.value: indirect_total,
+            CommissionType.BONUS.value: bonus_total
+        }
+        settlement['over_distributed'] = int(
+            (total_cents * 10 ** (amount_places - 2) > amount_column).sum()
+        )
+        
+        # Materialize calculation and distribution records, drawing the random
+        # ID suffixes in one call instead of a uuid4 per record (16 bytes each)
+        direct_cents = direct_cents.tolist()
+        bonus_cents = bonus_cents.tolist()
+        indirect_cents = indirect_cents.tolist()
+        total_cents = total_cents.tolist()
+        record_count = count + settlement['commissions_calculated']
+        id_suffixes = os.urandom(16 * record_count).hex()
+        next_id = 0
+        
+        performance_bonuses = settlement['performance_bonuses']
+        calculation_date = datetime.now()
+        for row, transaction in enumerate(settled):
+            partner_id = transaction.partner_id
+            hierarchy = hierarchies[partner_id]
+            entry = rate_entries[row_entries[row]]
+            currency = transaction.currency
+            direct_amount = to_decimal(direct_cents[row])
+            bonus_amount = to_decimal(bonus_cents[row])
+            base_commission = transaction.amount * entry['direct']
+            
+            direct = CommissionCalculation(
+                calculation_id=f"calc_{id_suffixes[next_id:next_id + 32]}",
+                transaction_id=transaction.transaction_id,
+                partner_id=partner_id,
+                commission_type=CommissionType.DIRECT,
+                base_amount=transaction.amount,
+                commission_rate=entry['direct'],
+                commission_amount=base_commission,
+                performance_bonus=base_commission * entry['multiplier'] - base_commission,
+                total_commission=direct_amount,
+                currency=currency,
+                calculation_date=calculation_date,
+                status=CommissionStatus.CALCULATED,
+                payment_date=None,
+                notes=f"Direct commission for {transaction.transaction_type.value}",
+                metadata={
+                    'performance_multiplier': float(entry['multiplier']),
+                    'performance_score': entry['performance_score']
+                }
+            )
+            self.commission_calculations[direct.calculation_id] = direct
+            next_id += 32
+            distributions = [{
+                'partner_id': partner_id,
+                'commission_type': 'direct',
+                'amount': direct_amount,
+                'currency': currency
+            }]
+            
+            for level, rate in enumerate(entry['indirect']):
+                parent = hierarchy['parent_partners'][level]
+                amount = to_decimal(indirect_cents[row][level])
+                indirect = CommissionCalculation(
+                    calculation_id=f"calc_{id_suffixes[next_id:next_id + 32]}",
+                    transaction_id=transaction.transaction_id,
+                    partner_id=parent['partner_id'],
+                    commission_type=CommissionType.INDIRECT,
+                    base_amount=transaction.amount,
+                    commission_rate=rate,
+                    commission_amount=amount,
+                    performance_bonus=Decimal('0'),
+                    total_commission=amount,
+                    currency=currency,
+                    calculation_date=calculation_date,
+                    status=CommissionStatus.CALCULATED,
+                    payment_date=None,
+                    notes=f"Indirect commission level {level + 1} for {transaction.transaction_type.value}",
+                    metadata={
+                        'hierarchy_level': level + 1,
+                        'parent_level': parent['level']
+                    }
+                )
+                self.commission_calculations[indirect.calculation_id] = indirect
+                next_id += 32
+                distributions.append({
+                    'partner_id': parent['partner_id'],
+                    'commission_type': 'indirect',
+                    'amount': amount,
+                    'currency': currency
+                })
+            
+            distributions.append({
+                'partner_id': partner_id,
+                'commission_type': 'bonus',
+                'amount': bonus_amount,
+                'currency': currency
+            })
+            performance_bonuses[partner_id] = performance_bonuses.get(partner_id, Decimal('0')) + bonus_amount
+            
+            total_distributed = to_decimal(total_cents[row])
+            distribution = CommissionDistribution(
+                distribution_id=f"dist_{transaction.transaction_id}_{id_suffixes[next_id:next_id + 32]}",
+                transaction_id=transaction.transaction_id,
+                total_amount=transaction.amount,
+                currency=currency,
+                distributions=distributions,
+                calculation_date=calculation_date,
+                status="calculated",
+                total_distributed=total_distributed,
+                remaining_amount=transaction.amount - total_distributed
+            )
+            self.commission_distributions[distribution.distribution_id] = distribution
+            next_id += 32
+            
+            self._record_transaction(transaction)
+        
+        return settlement
+    
     def get_commission_calculations(self, partner_id: str) -> List[Dict[str, Any]]:
         """Get commission calculations for partner"""
         calculations = []
@@ -1063,6 +1438,18 @@ class CalculationEngine:
     def calculate_commission(self, transaction: Transaction, rate: Decimal) -> Decimal:
         """Calculate commission"""
         return transaction.amount * rate
+    
+    def calculate_columns(self, amounts: np.ndarray, rates: np.ndarray, to_cents: int, cap: Optional[int] = None) -> np.ndarray:
+        """
+        Calculate commissions in cents from scaled-integer amount and rate columns
+        
+        Products are capped, then rounded half-up by the to_cents divisor, matching
+        Decimal quantize with ROUND_HALF_UP for non-negative values.
+        """
+        products = amounts * rates
+        if cap is not None:
+            products = np.minimum(products, cap)
+        return (products + to_cents // 2) // to_cents
 
 class DistributionEngine:
     """Handles commission distribution"""
@@ -17,7 +17,6 @@ import time
 import uuid
 import logging
 import asyncio
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
@@ -28,6 +27,8 @@ import hashlib
 from decimal import Decimal, ROUND_HALF_UP
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -1005,83 +1006,25 @@ class MobilePartnerAgent:
     
     def _start_background_services(self):
         """Start background services for mobile management"""
-        # Sync monitoring service
-        self.sync_monitoring_thread = threading.Thread(
-            target=self._sync_monitoring_service,
-            daemon=True
-        )
-        self.sync_monitoring_thread.start()
-        
-        # Notification delivery service
-        self.notification_delivery_thread = threading.Thread(
-            target=self._notification_delivery_service,
-            daemon=True
-        )
-        self.notification_delivery_thread.start()
-        
-        # Performance monitoring service
-        self.performance_monitoring_thread = threading.Thread(
-            target=self._performance_monitoring_service,
-            daemon=True
-        )
-        self.performance_monitoring_thread.start()
-        
-        # Ubuntu integration service
-        self.ubuntu_integration_thread = threading.Thread(
-            target=self._ubuntu_integration_service,
-            daemon=True
-        )
-        self.ubuntu_integration_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each
+        scheduler = get_scheduler()
+        self.background_jobs = [
+            # Monitor sync operations, check every 5 minutes
+            scheduler.schedule_periodic("mobile.sync_monitoring", self._monitor_sync_operations, 300, initial_delay=0),
+            # Process notification queue, check every minute
+            scheduler.schedule_periodic("mobile.notification_delivery", self._process_notification_queue, 60, initial_delay=0),
+            # Monitor app performance, check every 30 minutes
+            scheduler.schedule_periodic("mobile.performance_monitoring", self._monitor_app_performance, 1800, initial_delay=0),
+            # Monitor Ubuntu integration, check every hour
+            scheduler.schedule_periodic("mobile.ubuntu_integration", self._monitor_ubuntu_integration, 3600, initial_delay=0)
+        ]
         
         logger.info("Background mobile services started")
     
-    def _sync_monitoring_service(self):
-        """Background service for sync monitoring"""
-        while True:
-            try:
-                # Monitor sync operations
-                self._monitor_sync_operations()
-                time.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Sync monitoring service error: {e}")
-                time.sleep(300)
-    
-    def _notification_delivery_service(self):
-        """Background service for notification delivery"""
-        while True:
-            try:
-                # Process notification queue
-                self._process_notification_queue()
-                time.sleep(60)  # Check every minute
-                
-            except Exception as e:
-                logger.error(f"Notification delivery service error: {e}")
-                time.sleep(60)
-    
-    def _performance_monitoring_service(self):
-        """Background service for performance monitoring"""
-        while True:
-            try:
-                # Monitor app performance
-                self._monitor_app_performance()
-                time.sleep(1800)  # Check every 30 minutes
-                
-            except Exception as e:
-                logger.error(f"Performance monitoring service error: {e}")
-                time.sleep(1800)
-    
-    def _ubuntu_integration_service(self):
-        """Background service for Ubuntu integration"""
-        while True:
-            try:
-                # Monitor Ubuntu integration
-                self._monitor_ubuntu_integration()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Ubuntu integration service error: {e}")
-                time.sleep(3600)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled background jobs"""
+        for job in self.background_jobs:
+            job.cancel()
     
     def _monitor_sync_operations(self):
         """Monitor sync operations"""
@@ -17,7 +17,6 @@ import time
 import uuid
 import logging
 import asyncio
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
@@ -27,6 +26,8 @@ import yaml
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -164,6 +165,7 @@ class PartnerHierarchyAgent:
         
         # Initialize partner registry and configurations
         self.partners = {}
+        self.hierarchy_index = PartnerHierarchyIndex()
         self.hierarchy_structures = {}
         self.hierarchy_operations = {}
         self.partner_configurations = self._load_partner_configurations()
@@ -613,64 +615,23 @@ class PartnerHierarchyAgent:
     
     def _start_background_services(self):
         """Start background services for hierarchy management"""
-        # Hierarchy monitoring service
-        self.hierarchy_monitor_thread = threading.Thread(
-            target=self._hierarchy_monitoring_service,
-            daemon=True
-        )
-        self.hierarchy_monitor_thread.start()
-        
-        # Performance tracking service
-        self.performance_tracking_thread = threading.Thread(
-            target=self._performance_tracking_service,
-            daemon=True
-        )
-        self.performance_tracking_thread.start()
-        
-        # Territory management service
-        self.territory_management_thread = threading.Thread(
-            target=self._territory_management_service,
-            daemon=True
-        )
-        self.territory_management_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each
+        scheduler = get_scheduler()
+        self.background_jobs = [
+            # Monitor hierarchy health, check every 5 minutes
+            scheduler.schedule_periodic("hierarchy.hierarchy_monitoring", self._monitor_hierarchy_health, 300, initial_delay=0),
+            # Track partner performance, check every hour
+            scheduler.schedule_periodic("hierarchy.performance_tracking", self._track_partner_performance, 3600, initial_delay=0),
+            # Manage territories, check every 30 minutes
+            scheduler.schedule_periodic("hierarchy.territory_management", self._manage_territories, 1800, initial_delay=0)
+        ]
         
         logger.info("Background hierarchy services started")
     
-    def _hierarchy_monitoring_service(self):
-        """Background service for hierarchy monitoring"""
-        while True:
-            try:
-                # Monitor hierarchy health
-                self._monitor_hierarchy_health()
-                time.sleep(300)  # Check every 5 minutes
-                
-            except Exception as e:
-                logger.error(f"Hierarchy monitoring service error: {e}")
-                time.sleep(300)
-    
-    def _performance_tracking_service(self):
-        """Background service for performance tracking"""
-        while True:
-            try:
-                # Track partner performance
-                self._track_partner_performance()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Performance tracking service error: {e}")
-                time.sleep(3600)
-    
-    def _territory_management_service(self):
-        """Background service for territory management"""
-        while True:
-            try:
-                # Manage territories
-                self._manage_territories()
-                time.sleep(1800)  # Check every 30 minutes
-                
-            except Exception as e:
-                logger.error(f"Territory management service error: {e}")
-                time.sleep(1800)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled background jobs"""
+        for job in self.background_jobs:
+            job.cancel()
     
     def _monitor_hierarchy_health(self):
         """Monitor hierarchy health"""
@@ -755,8 +716,9 @@ class PartnerHierarchyAgent:
             metadata=partner_data.get('metadata', {})
         )
         
-        # Store partner
+        # Store partner and index its position in the tree
         self.partners[partner_id] = partner
+        self.hierarchy_index.add_partner(partner)
         
         logger.info(f"Partner {partner_id} created at level {level.value}")
         
@@ -928,8 +890,13 @@ class PartnerHierarchyAgent:
     
     async def _update_hierarchy_structure(self, new_partner: Partner) -> Dict[str, Any]:
         """Update hierarchy structure with new partner"""
-        # Implementation would update hierarchy structure
-        return {'updated': True}
+        # The index is updated as the partner is stored; report where it landed
+        index = self.hierarchy_index
+        return {
+            'updated': new_partner.partner_id in index.depth,
+            'depth': index.depth.get(new_partner.partner_id, 0),
+            'upline': list(index.get_upline(new_partner.partner_id))
+        }
     
     async def _setup_partner_territory(self, partner: Partner, parent_partner: Partner) -> Dict[str, Any]:
         """Setup territory for new partner"""
@@ -963,24 +930,25 @@ class PartnerHierarchyAgent:
             return {'success': False, 'error': str(e)}
     
     async def _get_hierarchy_structure(self, partner_id: str) -> HierarchyStructure:
-        """Get hierarchy structure for partner"""
-        # Implementation would retrieve hierarchy structure
-        # For now, return a mock structure
+        """Get hierarchy structure for partner from the hierarchy index"""
+        index = self.hierarchy_index
+        root_id = index.get_root(partner_id)
+        
+        # Levels hold the partner's path from the root; full level membership
+        # is available from list_partners_by_level
+        levels = {level: [] for level in PartnerLevel}
+        for path_partner_id in reversed((partner_id,) + index.get_upline(partner_id)):
+            if path_partner_id in index.level:
+                levels[index.level[path_partner_id]].append(path_partner_id)
+        
         return HierarchyStructure(
-            structure_id="mock_structure",
-            root_partner_id=partner_id,
-            levels={
-                PartnerLevel.CONTINENTAL: [partner_id],
-                PartnerLevel.REGIONAL: [],
-                PartnerLevel.NATIONAL: [],
-                PartnerLevel.STATE: [],
-                PartnerLevel.LOCAL: [],
-                PartnerLevel.AFFILIATE: []
-            },
-            relationships={partner_id: []},
-            depth=1,
-            total_partners=1,
-            active_partners=1,
+            structure_id=f"structure_{root_id}",
+            root_partner_id=root_id,
+            levels=levels,
+            relationships={partner_id: list(index.children.get(partner_id, []))},
+            depth=index.tree_depth.get(root_id, 0),
+            total_partners=index.subtree_size.get(root_id, 0),
+            active_partners=index.subtree_active.get(root_id, 0),
             performance_summary={},
             created_at=datetime.now(),
             updated_at=datetime.now()
@@ -1024,32 +992,125 @@ class PartnerHierarchyAgent:
             'performance_metrics': partner.performance_metrics
         }
     
+    def update_partner_status(self, partner_id: str, status: PartnerStatus) -> bool:
+        """Change a partner's status, keeping the hierarchy counters in step"""
+        partner = self.partners.get(partner_id)
+        if not partner:
+            return False
+        
+        self.hierarchy_index.update_status(partner_id, partner.partner_status, status)
+        partner.partner_status = status
+        partner.updated_at = datetime.now()
+        if status == PartnerStatus.ACTIVE and partner.activated_at is None:
+            partner.activated_at = partner.updated_at
+        
+        return True
+    
+    def get_upline(self, partner_id: str, max_levels: Optional[int] = None) -> List[str]:
+        """Get ancestor partner IDs, nearest first, in O(depth)"""
+        upline = self.hierarchy_index.get_upline(partner_id)
+        return list(upline if max_levels is None else upline[:max_levels])
+    
+    def get_downline_size(self, partner_id: str) -> int:
+        """Get the number of partners below a partner"""
+        return max(0, self.hierarchy_index.subtree_size.get(partner_id, 0) - 1)
+    
     def list_partners_by_level(self, level: PartnerLevel) -> List[Dict[str, Any]]:
         """List partners by hierarchy level"""
-        partners = []
-        for partner in self.partners.values():
-            if partner.partner_level == level:
-                partners.append(asdict(partner))
-        return partners
+        return [asdict(self.partners[partner_id]) for partner_id in self.hierarchy_index.by_level[level]]
     
     def get_hierarchy_statistics(self) -> Dict[str, Any]:
         """Get hierarchy statistics"""
-        stats = {
+        index = self.hierarchy_index
+        return {
             'total_partners': len(self.partners),
-            'active_partners': len([p for p in self.partners.values() if p.partner_status == PartnerStatus.ACTIVE]),
-            'partners_by_level': {},
+            'active_partners': index.status_counts[PartnerStatus.ACTIVE],
+            'partners_by_level': {level.value: len(index.by_level[level]) for level in PartnerLevel},
+            'partners_by_status': {status.value: count for status, count in index.status_counts.items()},
+            'hierarchy_depth': index.max_depth,
             'total_structures': len(self.hierarchy_structures),
             'total_operations': len(self.hierarchy_operations)
         }
+
+# Supporting classes
+class PartnerHierarchyIndex:
+    """
+    Incrementally maintained index over the partner tree
+    
+    Each partner's ancestor path is stored when it joins, so uplines are read
+    in O(depth) and never re-walked through parent links. Level membership,
+    subtree sizes and status counts are updated on every insert or status
+    change, keeping hierarchy statistics O(1) however large the network grows.
+    """
+    
+    def __init__(self):
+        self.ancestors: Dict[str, Tuple[str, ...]] = {}  # nearest first, root last
+        self.children: Dict[str, List[str]] = {}
+        self.level: Dict[str, PartnerLevel] = {}
+        self.depth: Dict[str, int] = {}
+        # Dicts as insertion-ordered sets
+        self.by_level: Dict[PartnerLevel, Dict[str, None]] = {level: {} for level in PartnerLevel}
+        self.subtree_size: Dict[str, int] = {}
+        self.subtree_active: Dict[str, int] = {}
+        self.tree_depth: Dict[str, int] = {}
+        self.status_counts: Dict[PartnerStatus, int] = {status: 0 for status in PartnerStatus}
+        self.max_depth = 0
+    
+    def add_partner(self, partner: Partner):
+        """Index a newly stored partner under its parent"""
+        partner_id = partner.partner_id
+        if partner_id in self.ancestors:
+            return
+        
+        parent_id = partner.parent_partner_id
+        if parent_id is not None and parent_id not in self.ancestors:
+            raise ValueError(f"Parent partner {parent_id} is not indexed")
+        
+        upline = (parent_id,) + self.ancestors[parent_id] if parent_id is not None else ()
+        depth = len(upline) + 1
+        active = 1 if partner.partner_status == PartnerStatus.ACTIVE else 0
+        
+        self.ancestors[partner_id] = upline
+        self.children[partner_id] = []
+        self.level[partner_id] = partner.partner_level
+        self.depth[partner_id] = depth
+        self.by_level[partner.partner_level][partner_id] = None
+        self.subtree_size[partner_id] = 1
+        self.subtree_active[partner_id] = active
+        self.status_counts[partner.partner_status] += 1
+        self.max_depth = max(self.max_depth, depth)
         
-        # Count partners by level
-        for level in PartnerLevel:
-            count = len([p for p in self.partners.values() if p.partner_level == level])
-            stats['partners_by_level'][level.value] = count
+        if parent_id is not None:
+            self.children[parent_id].append(partner_id)
+        for ancestor_id in upline:
+            self.subtree_size[ancestor_id] += 1
+            self.subtree_active[ancestor_id] += active
         
-        return stats
+        root_id = upline[-1] if upline else partner_id
+        self.tree_depth[root_id] = max(self.tree_depth.get(root_id, 0), depth)
+    
+    def update_status(self, partner_id: str, old_status: PartnerStatus, new_status: PartnerStatus):
+        """Move a partner between status counters"""
+        if partner_id not in self.ancestors or old_status == new_status:
+            return
+        
+        self.status_counts[old_status] -= 1
+        self.status_counts[new_status] += 1
+        
+        delta = (new_status == PartnerStatus.ACTIVE) - (old_status == PartnerStatus.ACTIVE)
+        if delta:
+            for ancestor_id in (partner_id,) + self.ancestors[partner_id]:
+                self.subtree_active[ancestor_id] += delta
+    
+    def get_upline(self, partner_id: str) -> Tuple[str, ...]:
+        """Get ancestor IDs, nearest first"""
+        return self.ancestors.get(partner_id, ())
+    
+    def get_root(self, partner_id: str) -> str:
+        """Get the root partner of the tree containing a partner"""
+        upline = self.ancestors.get(partner_id, ())
+        return upline[-1] if upline else partner_id
 
-# Supporting classes
 class HierarchyManager:
     """Manages hierarchy structures"""
     
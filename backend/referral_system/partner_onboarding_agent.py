@@ -17,7 +17,6 @@ import time
 import uuid
 import logging
 import asyncio
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
@@ -28,6 +27,8 @@ import hashlib
 from decimal import Decimal, ROUND_HALF_UP
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -848,83 +849,25 @@ class PartnerOnboardingAgent:
     
     def _start_background_services(self):
         """Start background services for partner onboarding"""
-        # Progress monitoring service
-        self.progress_monitoring_thread = threading.Thread(
-            target=self._progress_monitoring_service,
-            daemon=True
-        )
-        self.progress_monitoring_thread.start()
-        
-        # Mentor matching service
-        self.mentor_matching_thread = threading.Thread(
-            target=self._mentor_matching_service,
-            daemon=True
-        )
-        self.mentor_matching_thread.start()
-        
-        # Communication service
-        self.communication_thread = threading.Thread(
-            target=self._communication_service,
-            daemon=True
-        )
-        self.communication_thread.start()
-        
-        # Ubuntu integration service
-        self.ubuntu_integration_thread = threading.Thread(
-            target=self._ubuntu_integration_service,
-            daemon=True
-        )
-        self.ubuntu_integration_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each
+        scheduler = get_scheduler()
+        self.background_jobs = [
+            # Monitor onboarding progress, check every hour
+            scheduler.schedule_periodic("onboarding.progress_monitoring", self._monitor_onboarding_progress, 3600, initial_delay=0),
+            # Match mentors with mentees, check every 2 hours
+            scheduler.schedule_periodic("onboarding.mentor_matching", self._match_mentors_with_mentees, 7200, initial_delay=0),
+            # Send scheduled communications, check every 30 minutes
+            scheduler.schedule_periodic("onboarding.communication", self._send_scheduled_communications, 1800, initial_delay=0),
+            # Apply Ubuntu philosophy integration, check every hour
+            scheduler.schedule_periodic("onboarding.ubuntu_integration", self._apply_ubuntu_philosophy_integration, 3600, initial_delay=0)
+        ]
         
         logger.info("Background partner onboarding services started")
     
-    def _progress_monitoring_service(self):
-        """Background service for progress monitoring"""
-        while True:
-            try:
-                # Monitor onboarding progress
-                self._monitor_onboarding_progress()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Progress monitoring service error: {e}")
-                time.sleep(3600)
-    
-    def _mentor_matching_service(self):
-        """Background service for mentor matching"""
-        while True:
-            try:
-                # Match mentors with mentees
-                self._match_mentors_with_mentees()
-                time.sleep(7200)  # Check every 2 hours
-                
-            except Exception as e:
-                logger.error(f"Mentor matching service error: {e}")
-                time.sleep(7200)
-    
-    def _communication_service(self):
-        """Background service for communications"""
-        while True:
-            try:
-                # Send scheduled communications
-                self._send_scheduled_communications()
-                time.sleep(1800)  # Check every 30 minutes
-                
-            except Exception as e:
-                logger.error(f"Communication service error: {e}")
-                time.sleep(1800)
-    
-    def _ubuntu_integration_service(self):
-        """Background service for Ubuntu integration"""
-        while True:
-            try:
-                # Apply Ubuntu philosophy integration
-                self._apply_ubuntu_philosophy_integration()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Ubuntu integration service error: {e}")
-                time.sleep(3600)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled background jobs"""
+        for job in self.background_jobs:
+            job.cancel()
     
     def _monitor_onboarding_progress(self):
         """Monitor onboarding progress"""
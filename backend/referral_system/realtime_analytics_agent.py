@@ -17,7 +17,6 @@ import time
 import uuid
 import logging
 import asyncio
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
@@ -31,6 +30,8 @@ import statistics
 import numpy as np
 from collections import defaultdict, deque
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -695,83 +696,25 @@ class RealTimeAnalyticsAgent:
     
     def _start_background_services(self):
         """Start background services for real-time analytics"""
-        # Real-time metrics processing service
-        self.metrics_processing_thread = threading.Thread(
-            target=self._metrics_processing_service,
-            daemon=True
-        )
-        self.metrics_processing_thread.start()
-        
-        # Alert monitoring service
-        self.alert_monitoring_thread = threading.Thread(
-            target=self._alert_monitoring_service,
-            daemon=True
-        )
-        self.alert_monitoring_thread.start()
-        
-        # Dashboard update service
-        self.dashboard_update_thread = threading.Thread(
-            target=self._dashboard_update_service,
-            daemon=True
-        )
-        self.dashboard_update_thread.start()
-        
-        # Prediction update service
-        self.prediction_update_thread = threading.Thread(
-            target=self._prediction_update_service,
-            daemon=True
-        )
-        self.prediction_update_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each
+        scheduler = get_scheduler()
+        self.background_jobs = [
+            # Process pending metrics, check every 5 seconds
+            scheduler.schedule_periodic("analytics.metrics_processing", self._process_pending_metrics, 5, initial_delay=0),
+            # Monitor for alert conditions, check every 30 seconds
+            scheduler.schedule_periodic("analytics.alert_monitoring", self._monitor_alert_conditions, 30, initial_delay=0),
+            # Update dashboards, update every minute
+            scheduler.schedule_periodic("analytics.dashboard_update", self._update_all_dashboards, 60, initial_delay=0),
+            # Update predictions, update every hour
+            scheduler.schedule_periodic("analytics.prediction_update", self._update_all_predictions, 3600, initial_delay=0)
+        ]
         
         logger.info("Background real-time analytics services started")
     
-    def _metrics_processing_service(self):
-        """Background service for metrics processing"""
-        while True:
-            try:
-                # Process pending metrics
-                self._process_pending_metrics()
-                time.sleep(5)  # Check every 5 seconds
-                
-            except Exception as e:
-                logger.error(f"Metrics processing service error: {e}")
-                time.sleep(5)
-    
-    def _alert_monitoring_service(self):
-        """Background service for alert monitoring"""
-        while True:
-            try:
-                # Monitor for alert conditions
-                self._monitor_alert_conditions()
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Alert monitoring service error: {e}")
-                time.sleep(30)
-    
-    def _dashboard_update_service(self):
-        """Background service for dashboard updates"""
-        while True:
-            try:
-                # Update dashboards
-                self._update_all_dashboards()
-                time.sleep(60)  # Update every minute
-                
-            except Exception as e:
-                logger.error(f"Dashboard update service error: {e}")
-                time.sleep(60)
-    
-    def _prediction_update_service(self):
-        """Background service for prediction updates"""
-        while True:
-            try:
-                # Update predictions
-                self._update_all_predictions()
-                time.sleep(3600)  # Update every hour
-                
-            except Exception as e:
-                logger.error(f"Prediction update service error: {e}")
-                time.sleep(3600)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled background jobs"""
+        for job in self.background_jobs:
+            job.cancel()
     
     def _process_pending_metrics(self):
         """Process pending metrics"""
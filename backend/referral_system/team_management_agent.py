@@ -17,7 +17,6 @@ import time
 import uuid
 import logging
 import asyncio
-import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
@@ -28,6 +27,8 @@ import hashlib
 from decimal import Decimal, ROUND_HALF_UP
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from agent_scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -994,83 +995,25 @@ class TeamManagementAgent:
     
     def _start_background_services(self):
         """Start background services for team management"""
-        # Performance monitoring service
-        self.performance_monitoring_thread = threading.Thread(
-            target=self._performance_monitoring_service,
-            daemon=True
-        )
-        self.performance_monitoring_thread.start()
-        
-        # Team health monitoring service
-        self.team_health_thread = threading.Thread(
-            target=self._team_health_monitoring_service,
-            daemon=True
-        )
-        self.team_health_thread.start()
-        
-        # Ubuntu integration service
-        self.ubuntu_integration_thread = threading.Thread(
-            target=self._ubuntu_integration_service,
-            daemon=True
-        )
-        self.ubuntu_integration_thread.start()
-        
-        # Training coordination service
-        self.training_coordination_thread = threading.Thread(
-            target=self._training_coordination_service,
-            daemon=True
-        )
-        self.training_coordination_thread.start()
+        # Jobs run on the shared scheduler instead of a sleeping thread each
+        scheduler = get_scheduler()
+        self.background_jobs = [
+            # Monitor team and member performance, check every hour
+            scheduler.schedule_periodic("team.performance_monitoring", self._monitor_team_performance, 3600, initial_delay=0),
+            # Monitor team health and dynamics, check every 30 minutes
+            scheduler.schedule_periodic("team.team_health_monitoring", self._monitor_team_health, 1800, initial_delay=0),
+            # Monitor and enhance Ubuntu integration, check every hour
+            scheduler.schedule_periodic("team.ubuntu_integration", self._monitor_ubuntu_integration, 3600, initial_delay=0),
+            # Coordinate team training activities, check every 2 hours
+            scheduler.schedule_periodic("team.training_coordination", self._coordinate_team_training, 7200, initial_delay=0)
+        ]
         
         logger.info("Background team management services started")
     
-    def _performance_monitoring_service(self):
-        """Background service for performance monitoring"""
-        while True:
-            try:
-                # Monitor team and member performance
-                self._monitor_team_performance()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Performance monitoring service error: {e}")
-                time.sleep(3600)
-    
-    def _team_health_monitoring_service(self):
-        """Background service for team health monitoring"""
-        while True:
-            try:
-                # Monitor team health and dynamics
-                self._monitor_team_health()
-                time.sleep(1800)  # Check every 30 minutes
-                
-            except Exception as e:
-                logger.error(f"Team health monitoring service error: {e}")
-                time.sleep(1800)
-    
-    def _ubuntu_integration_service(self):
-        """Background service for Ubuntu integration"""
-        while True:
-            try:
-                # Monitor and enhance Ubuntu integration
-                self._monitor_ubuntu_integration()
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Ubuntu integration service error: {e}")
-                time.sleep(3600)
-    
-    def _training_coordination_service(self):
-        """Background service for training coordination"""
-        while True:
-            try:
-                # Coordinate team training activities
-                self._coordinate_team_training()
-                time.sleep(7200)  # Check every 2 hours
-                
-            except Exception as e:
-                logger.error(f"Training coordination service error: {e}")
-                time.sleep(7200)
+    def stop_background_services(self):
+        """Cancel this agent's scheduled background jobs"""
+        for job in self.background_jobs:
+            job.cancel()
     
     def _monitor_team_performance(self):
         """Monitor team performance"""
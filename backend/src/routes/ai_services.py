@@ -32,6 +32,9 @@ except ImportError as e:
                 'response_time': 0.0
             })()
         
+        async def chat_completion_async(self, *args, **kwargs):
+            return self.chat_completion(*args, **kwargs)
+        
         def get_system_status(self):
             return {"status": "AI services not configured"}
 
@@ -45,9 +48,12 @@ except Exception as e:
     ai_orchestrator = AIOrchestrator()  # Use mock version
 
 @ai_bp.route('/chat', methods=['POST'])
-def chat_completion():
+async def chat_completion():
     """
     Chat completion endpoint with AI provider orchestration
+    Providers are hedged: a slow first choice is raced against the next one.
+    Flask still runs this view to completion on a WSGI worker, so hedging
+    trims the tail latency of each request but not worker occupancy.
     """
     try:
         data = request.get_json()
@@ -66,7 +72,7 @@ def chat_completion():
         cost_optimize = data.get('cost_optimize', True)
         
         # Process chat completion through AI orchestrator
-        response = ai_orchestrator.chat_completion(
+        response = await ai_orchestrator.chat_completion_async(
             messages=messages,
             model=model,
             max_tokens=max_tokens,
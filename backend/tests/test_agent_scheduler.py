@@ -0,0 +1,165 @@
+"""
+Test suite for WebWaka referral agent scheduler
+Covers work queue wake-ups, per-queue serialization, dead letters and shutdown
+"""
+
+import unittest
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add referral system to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'referral_system'))
+
+from agent_scheduler import AgentScheduler
+
+WAIT_TIMEOUT = 5.0
+
+def wait_until(predicate, timeout: float = WAIT_TIMEOUT) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+class TestWorkQueue(unittest.TestCase):
+    """Work queues drained by the shared worker pool"""
+
+    def setUp(self):
+        self.scheduler = AgentScheduler(max_workers=4)
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def test_put_wakes_handler(self):
+        """An item is handled right away, not on the next timer tick"""
+        handled = threading.Event()
+        # A far-off timer keeps the dispatcher parked in a long wait
+        self.scheduler.schedule_periodic("idle", lambda: None, 3600)
+        queue = self.scheduler.create_queue("wake", lambda batch: handled.set())
+
+        started = time.monotonic()
+        queue.put("item")
+        self.assertTrue(handled.wait(WAIT_TIMEOUT))
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_one_handler_per_queue(self):
+        """Concurrent producers never get two handler calls running on one queue"""
+        lock = threading.Lock()
+        active = [0]
+        max_active = [0]
+        handled = []
+
+        def handler(batch):
+            with lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+            time.sleep(0.002)
+            with lock:
+                handled.extend(batch)
+                active[0] -= 1
+
+        queue = self.scheduler.create_queue("serial", handler, max_batch=7)
+
+        def produce(offset):
+            for index in range(100):
+                queue.put(offset + index)
+
+        producers = [threading.Thread(target=produce, args=(offset * 100,)) for offset in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+
+        self.assertTrue(wait_until(lambda: queue.processed == 400))
+        self.assertEqual(max_active[0], 1)
+        self.assertEqual(sorted(handled), list(range(400)))
+        self.assertEqual(queue.pending(), 0)
+
+    def test_dead_letters_and_retry(self):
+        """A failed batch is kept as dead letters and handled again on retry"""
+        fail = threading.Event()
+        fail.set()
+        handled = []
+
+        def handler(batch):
+            if fail.is_set():
+                raise ValueError("downstream unavailable")
+            handled.extend(batch)
+
+        queue = self.scheduler.create_queue("flaky", handler)
+        queue.put_many([1, 2, 3])
+
+        self.assertTrue(wait_until(lambda: queue.failures == 1))
+        self.assertTrue(wait_until(lambda: len(queue.dead_letters) == 3))
+        self.assertEqual(queue.processed, 0)
+        self.assertEqual(self.scheduler.get_stats()['queues']['flaky']['dead_letters'], 3)
+
+        fail.clear()
+        self.assertEqual(queue.retry_dead_letters(), 3)
+        self.assertTrue(wait_until(lambda: queue.processed == 3))
+        self.assertEqual(sorted(handled), [1, 2, 3])
+        self.assertEqual(queue.dead_letters, [])
+        self.assertEqual(queue.retry_dead_letters(), 0)
+
+    def test_closed_queue_rejects_items(self):
+        queue = self.scheduler.create_queue("closed", lambda batch: None)
+        queue.cancel()
+        with self.assertRaises(RuntimeError):
+            queue.put("item")
+
+class TestSchedulerShutdown(unittest.TestCase):
+    """Shutdown with timers that are due or about to be dispatched"""
+
+    def setUp(self):
+        self.thread_errors = []
+        self._excepthook = threading.excepthook
+        threading.excepthook = lambda args: self.thread_errors.append(args.exc_value)
+
+    def tearDown(self):
+        threading.excepthook = self._excepthook
+
+    def test_shutdown_while_jobs_are_due(self):
+        """Shutting down while the dispatcher hands a due job to the pool leaves it running cleanly"""
+        submitting = threading.Event()
+
+        class SlowSubmitExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                if threading.current_thread().name == "referral-agent-scheduler":
+                    submitting.set()
+                    time.sleep(0.05)
+                return super().submit(fn, *args, **kwargs)
+
+        scheduler = AgentScheduler(max_workers=2)
+        with scheduler._condition:
+            scheduler._executor = SlowSubmitExecutor(max_workers=2)
+        scheduler.schedule_periodic("due", lambda: None, 0.001, initial_delay=0)
+        dispatcher = scheduler._dispatcher
+
+        self.assertTrue(submitting.wait(WAIT_TIMEOUT))
+        # Without waiting for the dispatcher, the pool shuts down right away
+        scheduler.shutdown(wait=False)
+        dispatcher.join(WAIT_TIMEOUT)
+
+        self.assertFalse(dispatcher.is_alive())
+        self.assertEqual(self.thread_errors, [])
+
+    def test_no_runs_after_shutdown(self):
+        runs = []
+        scheduler = AgentScheduler(max_workers=2)
+        job = scheduler.schedule_periodic("tick", lambda: runs.append(1), 0.001, initial_delay=0)
+        self.assertTrue(wait_until(lambda: job.runs >= 3))
+        scheduler.shutdown()
+
+        settled = len(runs)
+        time.sleep(0.05)
+        self.assertEqual(len(runs), settled)
+        self.assertEqual(scheduler.get_stats()['scheduled_jobs'], 0)
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(lambda: None)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
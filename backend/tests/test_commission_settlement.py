@@ -0,0 +1,110 @@
+"""
+Test suite for WebWaka commission settlement
+Checks that batched window settlement pays what per-transaction calculation pays
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+# Add referral system to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'referral_system'))
+
+from partner_hierarchy_agent import PartnerHierarchyAgent, PartnerLevel
+from commission_calculation_agent import CommissionCalculationAgent, Transaction, TransactionType
+
+PARTNER_DATA = {
+    'partner_name': 'Test Partner',
+    'organization_name': 'Test Organization',
+    'contact_person': 'Test Contact',
+    'email': 'partner@example.com',
+    'phone': '+254700000000',
+    'address': '1 Market Street',
+    'country': 'Kenya',
+    'region': 'East Africa'
+}
+
+class TestCommissionSettlement(unittest.TestCase):
+    """Batch settlement against the per-transaction path with a real hierarchy"""
+
+    def setUp(self):
+        """Build a continental > regional > national chain"""
+        self.hierarchy_agent = PartnerHierarchyAgent()
+        root = asyncio.run(self.hierarchy_agent.create_partner_hierarchy(PARTNER_DATA))
+        self.assertEqual(root.status, "completed")
+        continental_id = root.hierarchy_structure['root_partner_id']
+
+        self.regional_id = self._add_partner(continental_id, PartnerLevel.REGIONAL)
+        self.national_id = self._add_partner(self.regional_id, PartnerLevel.NATIONAL)
+        self.agents = []
+
+    def tearDown(self):
+        for agent in self.agents + [self.hierarchy_agent]:
+            agent.stop_background_services()
+
+    def _add_partner(self, parent_id: str, level: PartnerLevel) -> str:
+        result = asyncio.run(self.hierarchy_agent.add_partner_to_hierarchy(PARTNER_DATA, parent_id, level))
+        self.assertEqual(result.status, "completed")
+        return next(partner.partner_id for partner in self.hierarchy_agent.partners.values()
+                    if partner.parent_partner_id == parent_id and partner.partner_level == level)
+
+    def _agent(self) -> CommissionCalculationAgent:
+        agent = CommissionCalculationAgent(self.hierarchy_agent)
+        self.agents.append(agent)
+        return agent
+
+    def _transactions(self, partner_ids, amount: Decimal, count: int):
+        return [
+            Transaction(
+                transaction_id=f"txn_{index}",
+                transaction_type=TransactionType.SALE,
+                amount=amount,
+                currency="USD",
+                partner_id=partner_ids[index % len(partner_ids)],
+                client_id=f"client_{index}",
+                product_id="product_1",
+                commission_eligible=True,
+                commission_rate=Decimal('0.10'),
+                transaction_date=datetime.now(),
+                processed_date=None,
+                metadata={}
+            )
+            for index in range(count)
+        ]
+
+    def _compare_paths(self, transactions):
+        single_agent = self._agent()
+        single_total = Decimal('0')
+        single_bonuses = {}
+        for transaction in transactions:
+            result = asyncio.run(single_agent.calculate_commission(transaction))
+            self.assertEqual(result.status, "completed", result.error_messages)
+            single_total += result.total_commission_amount
+            for partner_id, bonus in result.performance_bonuses.items():
+                single_bonuses[partner_id] = single_bonuses.get(partner_id, Decimal('0')) + bonus
+
+        batch_agent = self._agent()
+        batch = asyncio.run(batch_agent.process_batch_commissions(transactions))
+        self.assertEqual(batch.status, "completed", batch.error_messages)
+
+        self.assertEqual(batch.total_commission_amount, single_total)
+        self.assertEqual(batch.performance_bonuses, single_bonuses)
+        for partner_id in single_bonuses:
+            self.assertEqual(batch_agent.performance_metrics[partner_id].bonus_multiplier,
+                             single_agent.performance_metrics[partner_id].bonus_multiplier)
+        return batch
+
+    def test_partner_moving_up_tiers_mid_window(self):
+        """A regional partner crossing its sales targets settles the same either way"""
+        batch = self._compare_paths(self._transactions([self.regional_id], Decimal('50000.00'), 150))
+        self.assertEqual(batch.total_commission_amount, Decimal('1830050.00'))
+
+    def test_interleaved_partners(self):
+        """Running sales are kept per partner when their transactions interleave"""
+        self._compare_paths(self._transactions([self.regional_id, self.national_id], Decimal('33333.33'), 120))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
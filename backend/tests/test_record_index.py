@@ -0,0 +1,159 @@
+"""
+Test suite for WebWaka management systems record index
+Checks indexed counts, totals and orderings against a full scan as records change
+"""
+
+import unittest
+import os
+import sys
+import random
+from dataclasses import dataclass
+from decimal import Decimal
+
+# Add management systems to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'management_systems'))
+
+from record_index import RecordIndex
+
+STATUSES = ['open', 'won', 'lost', 'on_hold']
+STAGES = ['lead', 'qualified', 'proposal', 'closing']
+OWNERS = ['owner_1', 'owner_2', 'owner_3']
+
+@dataclass
+class Record:
+    record_id: str
+    owner_id: str
+    status: str
+    stage: str
+    value: Decimal
+
+class TestRecordIndex(unittest.TestCase):
+    """RecordIndex lookups after update() and remove()"""
+
+    def setUp(self):
+        self.random = random.Random(42)
+        self.index = RecordIndex('record_id', bucket_fields=['owner_id'],
+                                 counter_fields=['status', 'stage'], total_fields=['value'],
+                                 order_fields=['value'])
+        self.table = {}  # record_id -> record, in insertion order
+        for number in range(200):
+            self._insert(f"rec_{number}")
+
+    def _random_value(self) -> Decimal:
+        # Few distinct values so ties in top() and range() are exercised
+        return Decimal(self.random.randint(1, 40) * 250) / 100
+
+    def _insert(self, record_id: str):
+        record = Record(record_id, self.random.choice(OWNERS), self.random.choice(STATUSES),
+                        self.random.choice(STAGES), self._random_value())
+        self.table[record_id] = record
+        self.index.add(record)
+
+    def _assert_matches_scan(self):
+        records = list(self.table.values())
+        self.assertEqual(len(self.index), len(records))
+
+        for field in ('status', 'stage'):
+            expected_counts = {}
+            expected_totals = {}
+            for record in records:
+                key = getattr(record, field)
+                expected_counts[key] = expected_counts.get(key, 0) + 1
+                expected_totals[key] = expected_totals.get(key, 0) + record.value
+            self.assertEqual(self.index.counts_by(field), expected_counts)
+            self.assertEqual(self.index.totals_by(field, 'value'), expected_totals)
+            for key in STATUSES + STAGES:
+                if field == 'status' and key in STATUSES or field == 'stage' and key in STAGES:
+                    self.assertEqual(self.index.count(field, key), expected_counts.get(key, 0))
+
+        # sorted() is stable, so equal values keep insertion order
+        by_value = sorted(records, key=lambda record: record.value, reverse=True)
+        for n in (1, 10, 50, len(records) + 5):
+            self.assertEqual(self.index.top('value', n), by_value[:n])
+
+        for owner in OWNERS:
+            self.assertEqual(self.index.get('owner_id', owner),
+                             [record for record in records if record.owner_id == owner])
+
+        lower, upper = Decimal('25.00'), Decimal('75.00')
+        self.assertEqual(self.index.range('value', lower, upper),
+                         [record for record in records if lower <= record.value <= upper])
+        self.assertEqual(self.index.range('value', lower, upper, include_lower=False, include_upper=False),
+                         [record for record in records if lower < record.value < upper])
+
+    def test_update_status_stage_and_value(self):
+        """Changing indexed fields in place moves counts, totals and orderings"""
+        self._assert_matches_scan()
+        for _ in range(500):
+            record = self.table[self.random.choice(list(self.table))]
+            change = self.random.choice(['status', 'stage', 'value', 'all'])
+            if change in ('status', 'all'):
+                record.status = self.random.choice(STATUSES)
+            if change in ('stage', 'all'):
+                record.stage = self.random.choice(STAGES)
+            if change in ('value', 'all'):
+                record.value = self._random_value()
+            self.index.update(record)
+        self._assert_matches_scan()
+
+    def test_update_replacing_record(self):
+        """A replacement object for an existing id is re-indexed in its original position"""
+        record = self.table['rec_5']
+        replacement = Record(record.record_id, 'owner_9', 'won', 'closing', Decimal('150.00'))
+        self.table['rec_5'] = replacement
+        self.index.update(replacement)
+
+        self._assert_matches_scan()
+        self.assertEqual(self.index.get('owner_id', 'owner_9'), [replacement])
+        self.assertEqual(self.index.top('value', 1), [replacement])
+
+        # Same indexed values, new object: lookups must return the replacement
+        record = self.table['rec_7']
+        replacement = Record(record.record_id, record.owner_id, record.status, record.stage, record.value)
+        self.table['rec_7'] = replacement
+        self.index.update(replacement)
+
+        self._assert_matches_scan()
+        self.assertTrue(any(found is replacement for found in self.index.get('owner_id', record.owner_id)))
+
+    def test_remove(self):
+        """Removed records leave every index; emptied keys disappear"""
+        for record_id in self.random.sample(list(self.table), 120):
+            del self.table[record_id]
+            self.index.remove(record_id)
+        self._assert_matches_scan()
+
+        self.index.remove('missing')
+        self._assert_matches_scan()
+
+        for record_id in list(self.table):
+            del self.table[record_id]
+            self.index.remove(record_id)
+        self._assert_matches_scan()
+        self.assertEqual(self.index.counts_by('status'), {})
+        self.assertEqual(self.index.totals_by('stage', 'value'), {})
+        self.assertEqual(self.index.top('value', 5), [])
+
+    def test_mixed_updates_removes_and_inserts(self):
+        """Interleaved changes stay consistent with a full scan throughout"""
+        next_number = len(self.table)
+        for step in range(600):
+            operation = self.random.random()
+            if operation < 0.2 and self.table:
+                record_id = self.random.choice(list(self.table))
+                del self.table[record_id]
+                self.index.remove(record_id)
+            elif operation < 0.35:
+                self._insert(f"rec_{next_number}")
+                next_number += 1
+            elif self.table:
+                record = self.table[self.random.choice(list(self.table))]
+                record.status = self.random.choice(STATUSES)
+                record.value = self._random_value()
+                self.index.update(record)
+            if step % 100 == 0:
+                self._assert_matches_scan()
+        self._assert_matches_scan()
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,11 +7,12 @@ import os
 import json
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterable, AsyncIterator
 from dataclasses import dataclass
 from enum import Enum
 import base64
 import io
+import re
 import wave
 import numpy as np
 from datetime import datetime
@@ -177,80 +178,228 @@ class AfricanLanguageConfig:
         }
     }
 
+    # Everyday market phrases used as reference text for language identification
+    SAMPLE_PHRASES = {
+        'sw': ['nataka kuuza paketi ya sukari', 'habari za asubuhi', 'asante sana kwa msaada wako',
+               'bei ya mchele ni shilingi ngapi', 'karibu dukani kwetu', 'mteja anataka kununua unga'],
+        'zu': ['ngifuna ukuthengisa iphakheji loshukela', 'sawubona unjani', 'ngiyabonga kakhulu',
+               'yimalini lokhu', 'siyakwamukela esitolo sethu', 'ikhasimende lifuna ukuthenga ufulawa'],
+        'xh': ['molo unjani', 'enkosi kakhulu', 'yimalini le', 'ndifuna ukuthenga iswekile',
+               'wamkelekile evenkileni yethu'],
+        'rw': ['muraho amakuru', 'murakoze cyane', 'ni angahe', 'ndashaka kugura isukari',
+               'murakaza neza mu iduka ryacu'],
+        'yo': ['mo fẹ ta apoti suga kan', 'ẹ kaaro bawo ni', 'ẹ ṣe pupọ', 'elo ni iresi yi',
+               'ẹ kaabo si ile itaja wa', 'onibara fẹ ra ọja'],
+        'ig': ['achọrọ m ire akpa shuga', 'ndewo kedu ka ị mere', 'daalụ nke ukwuu',
+               'ego ole ka osikapa a bụ', 'nnọọ n ụlọ ahịa anyị', 'onye ahịa chọrọ ịzụta ngwaahịa'],
+        'ha': ['ina son sayar da fakitin sukari', 'sannu yaya kake', 'na gode sosai',
+               'nawa ne farashin shinkafa', 'barka da zuwa kantin mu', 'abokin ciniki yana son siyan kaya'],
+        'wo': ['salaam aleekum na nga def', 'jërëjëf', 'ñaata la', 'dama bëgg jënd suukar'],
+        'ar': ['مرحبا كيف حالك', 'شكرا جزيلا', 'كم سعر هذا', 'أريد أن أشتري السكر',
+               'أهلا وسهلا في متجرنا'],
+        'am': ['ሰላም እንዴት ነህ', 'አመሰግናለሁ', 'ይህ ስንት ነው', 'ስኳር መግዛት እፈልጋለሁ'],
+        'so': ['subax wanaagsan', 'mahadsanid', 'waa imisa qiimaha', 'waxaan rabaa inaan iibsado sonkor'],
+        'ln': ['mbote ndeko', 'matondo mingi', 'ntalo na yango ezali boni', 'nalingi kosomba sukali'],
+        'af': ['goeie more hoe gaan dit', 'baie dankie', 'hoeveel kos dit', 'ek wil suiker koop',
+               'welkom by ons winkel'],
+        'sn': ['mhoro makadii', 'ndatenda zvikuru', 'imarii', 'ndinoda kutenga shuga'],
+    }
+
+@dataclass
+class AudioStatistics:
+    """Whole-clip audio statistics gathered in a single frame-by-frame pass"""
+    sample_count: int
+    signal_power: float
+    noise_floor: float      # 10th percentile of sample magnitude
+    gate_threshold: float   # 15th percentile of sample magnitude
+    peak: float
+    
+    @property
+    def snr_db(self) -> float:
+        """Signal-to-noise ratio in decibels"""
+        if self.noise_floor == 0:
+            return float('inf')
+        return 10 * np.log10(self.signal_power / (self.noise_floor ** 2))
+
+class AudioStatisticsAccumulator:
+    """Accumulate audio statistics over fixed-size int16 frames
+    
+    Magnitudes are counted in a 32769-bin histogram, so the noise-floor and
+    gate percentiles are exact without sorting or holding the whole clip.
+    Scratch buffers are allocated once per accumulator and reused per frame.
+    """
+    
+    MAGNITUDE_BINS = 32769
+    
+    def __init__(self, frame_size: int):
+        self.frame_size = frame_size
+        self.sample_count = 0
+        self.sum_of_squares = 0.0
+        self.peak = 0
+        self.histogram = np.zeros(self.MAGNITUDE_BINS, dtype=np.int64)
+        self._magnitude = np.empty(frame_size, dtype=np.int32)
+        self._scratch = np.empty(frame_size, dtype=np.float32)
+    
+    def update(self, frame: np.ndarray):
+        """Fold one int16 frame (at most frame_size samples) into the statistics"""
+        count = len(frame)
+        if count == 0:
+            return
+        
+        magnitude = self._magnitude[:count]
+        scratch = self._scratch[:count]
+        
+        np.abs(frame, out=magnitude, dtype=np.int32)
+        np.copyto(scratch, magnitude, casting='unsafe')
+        
+        self.sample_count += count
+        self.sum_of_squares += float(np.dot(scratch, scratch))
+        self.peak = max(self.peak, int(magnitude.max()))
+        self.histogram += np.bincount(magnitude, minlength=self.MAGNITUDE_BINS)
+    
+    def percentile(self, q: float) -> float:
+        """Percentile of sample magnitude, interpolated like np.percentile"""
+        if self.sample_count == 0:
+            return 0.0
+        
+        cumulative = np.cumsum(self.histogram)
+        rank = q / 100 * (self.sample_count - 1)
+        lower_rank = int(rank)
+        fraction = rank - lower_rank
+        
+        lower = int(np.searchsorted(cumulative, lower_rank, side='right'))
+        if fraction == 0:
+            return float(lower)
+        upper = int(np.searchsorted(cumulative, lower_rank + 1, side='right'))
+        return lower + fraction * (upper - lower)
+    
+    def result(self) -> AudioStatistics:
+        """Snapshot the statistics accumulated so far"""
+        return AudioStatistics(
+            sample_count=self.sample_count,
+            signal_power=self.sum_of_squares / max(1, self.sample_count),
+            noise_floor=self.percentile(10),
+            gate_threshold=self.percentile(15),
+            peak=float(self.peak)
+        )
+
 class AudioProcessor:
     """Audio processing utilities for African voice recognition"""
     
+    # Samples per processing window (about 2 seconds of 16 kHz audio)
+    FRAME_SIZE = 32768
+    
+    # Smaller windows for streaming, so partial results arrive every half second
+    STREAM_FRAME_SIZE = 8000
+    SAMPLE_RATE = 16000
+    
     @staticmethod
-    def assess_audio_quality(audio_data: bytes) -> AudioQuality:
-        """Assess audio quality for processing optimization"""
+    def _samples(audio_data: bytes) -> np.ndarray:
+        """View 16-bit PCM bytes as int16 samples without copying"""
+        return np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+    
+    @staticmethod
+    def analyze_audio(audio_data: bytes, frame_size: int = None) -> AudioStatistics:
+        """Compute signal power, noise percentiles and peak in one frame-by-frame pass"""
+        frame_size = frame_size or AudioProcessor.FRAME_SIZE
+        samples = AudioProcessor._samples(audio_data)
+        accumulator = AudioStatisticsAccumulator(frame_size)
+        
+        for offset in range(0, len(samples), frame_size):
+            accumulator.update(samples[offset:offset + frame_size])
+        
+        return accumulator.result()
+    
+    @staticmethod
+    def quality_from_statistics(stats: AudioStatistics) -> AudioQuality:
+        """Classify audio quality from SNR"""
+        if stats.sample_count == 0:
+            return AudioQuality.FAIR
+        
+        snr = stats.snr_db
+        if snr > 30:
+            return AudioQuality.EXCELLENT
+        elif snr > 20:
+            return AudioQuality.GOOD
+        elif snr > 10:
+            return AudioQuality.FAIR
+        elif snr > 5:
+            return AudioQuality.POOR
+        else:
+            return AudioQuality.VERY_POOR
+    
+    @staticmethod
+    def assess_with_statistics(audio_data: bytes) -> Tuple[AudioQuality, Optional[AudioStatistics]]:
+        """Assess audio quality, also returning the statistics for reuse by enhancement"""
         try:
-            # Convert bytes to numpy array for analysis
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            
-            # Calculate signal-to-noise ratio
-            signal_power = np.mean(audio_array ** 2)
-            noise_floor = np.percentile(np.abs(audio_array), 10)
-            
-            if noise_floor == 0:
-                snr = float('inf')
-            else:
-                snr = 10 * np.log10(signal_power / (noise_floor ** 2))
-            
-            # Classify quality based on SNR
-            if snr > 30:
-                return AudioQuality.EXCELLENT
-            elif snr > 20:
-                return AudioQuality.GOOD
-            elif snr > 10:
-                return AudioQuality.FAIR
-            elif snr > 5:
-                return AudioQuality.POOR
-            else:
-                return AudioQuality.VERY_POOR
+            stats = AudioProcessor.analyze_audio(audio_data)
+            return AudioProcessor.quality_from_statistics(stats), stats
                 
         except Exception as e:
             logger.warning(f"Audio quality assessment failed: {e}")
-            return AudioQuality.FAIR
+            return AudioQuality.FAIR, None
     
     @staticmethod
-    def enhance_audio_for_recognition(audio_data: bytes, quality: AudioQuality) -> bytes:
-        """Enhance audio quality for better recognition"""
+    def assess_audio_quality(audio_data: bytes) -> AudioQuality:
+        """Assess audio quality for processing optimization"""
+        return AudioProcessor.assess_with_statistics(audio_data)[0]
+    
+    @staticmethod
+    def enhance_audio_for_recognition(audio_data: bytes, quality: AudioQuality,
+                                      stats: Optional[AudioStatistics] = None) -> bytes:
+        """Enhance audio quality for better recognition
+        
+        Pass the AudioStatistics from analyze_audio to avoid a second analysis pass.
+        """
         try:
-            audio_array = np.frombuffer(audio_data, dtype=np.int16)
-            
             # Apply enhancement based on quality
-            if quality in [AudioQuality.POOR, AudioQuality.VERY_POOR]:
-                # Noise reduction
-                audio_array = AudioProcessor._reduce_noise(audio_array)
-                
-                # Amplification
-                audio_array = AudioProcessor._amplify_signal(audio_array)
-                
-                # Frequency filtering
-                audio_array = AudioProcessor._filter_frequencies(audio_array)
+            if quality not in [AudioQuality.POOR, AudioQuality.VERY_POOR]:
+                return audio_data
+            
+            if stats is None:
+                stats = AudioProcessor.analyze_audio(audio_data)
             
-            return audio_array.tobytes()
+            samples = AudioProcessor._samples(audio_data)
+            enhanced = np.empty_like(samples)
+            frame_size = AudioProcessor.FRAME_SIZE
+            scratch = np.empty(frame_size, dtype=np.float32)
+            magnitude = np.empty(frame_size, dtype=np.float32)
+            gated = np.empty(frame_size, dtype=bool)
+            gain = AudioProcessor._signal_gain(stats.peak)
+            
+            for offset in range(0, len(samples), frame_size):
+                frame = samples[offset:offset + frame_size]
+                count = len(frame)
+                AudioProcessor._enhance_frame(
+                    frame, stats.gate_threshold, gain,
+                    scratch[:count], magnitude[:count], gated[:count]
+                )
+                enhanced[offset:offset + count] = scratch[:count]
+            
+            return enhanced.tobytes()
             
         except Exception as e:
             logger.warning(f"Audio enhancement failed: {e}")
             return audio_data
     
     @staticmethod
-    def _reduce_noise(audio_array: np.ndarray) -> np.ndarray:
-        """Simple noise reduction"""
-        # Basic noise gate
-        threshold = np.percentile(np.abs(audio_array), 15)
-        audio_array[np.abs(audio_array) < threshold] *= 0.1
-        return audio_array
+    def _signal_gain(peak: float) -> float:
+        """Amplify weak signals towards half scale, by at most 3x"""
+        return min(3.0, 16384 / peak) if peak > 0 else 1.0
     
     @staticmethod
-    def _amplify_signal(audio_array: np.ndarray) -> np.ndarray:
-        """Amplify weak signals"""
-        max_val = np.max(np.abs(audio_array))
-        if max_val > 0:
-            amplification = min(3.0, 16384 / max_val)
-            audio_array = audio_array * amplification
-        return np.clip(audio_array, -32768, 32767).astype(np.int16)
+    def _enhance_frame(frame: np.ndarray, gate_threshold: float, gain: float,
+                       scratch: np.ndarray, magnitude: np.ndarray, gated: np.ndarray):
+        """Noise gate, gain and clip one frame into the float32 scratch buffer"""
+        np.copyto(scratch, frame, casting='unsafe')
+        np.abs(scratch, out=magnitude)
+        np.less(magnitude, gate_threshold, out=gated)
+        
+        # Basic noise gate, then amplification
+        np.multiply(scratch, gain, out=scratch)
+        np.multiply(scratch, 0.1, out=scratch, where=gated)
+        AudioProcessor._filter_frequencies(scratch)
+        np.clip(scratch, -32768, 32767, out=scratch)
     
     @staticmethod
     def _filter_frequencies(audio_array: np.ndarray) -> np.ndarray:
@@ -259,11 +408,215 @@ class AudioProcessor:
         # In production, use proper DSP libraries
         return audio_array
 
+class StreamingAudioProcessor:
+    """Incremental quality assessment and enhancement for chunked 16-bit PCM audio
+    
+    Chunks of any size are buffered up to whole frames. Each frame updates
+    the running statistics and is then gated and amplified with the estimate
+    available at that point, so only one frame is held in memory at a time.
+    """
+    
+    def __init__(self, frame_size: int = None):
+        self.frame_size = frame_size or AudioProcessor.STREAM_FRAME_SIZE
+        self.accumulator = AudioStatisticsAccumulator(self.frame_size)
+        self.quality = AudioQuality.FAIR
+        self.frames_processed = 0
+        self.frames_enhanced = 0
+        self._pending = bytearray()
+        self._scratch = np.empty(self.frame_size, dtype=np.float32)
+        self._magnitude = np.empty(self.frame_size, dtype=np.float32)
+        self._gated = np.empty(self.frame_size, dtype=bool)
+        self._enhanced = np.empty(self.frame_size, dtype=np.int16)
+    
+    @property
+    def samples_processed(self) -> int:
+        return self.accumulator.sample_count
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Buffer a chunk and return the enhanced audio of every frame it completes"""
+        self._pending.extend(chunk)
+        frame_bytes = self.frame_size * 2
+        frames = []
+        
+        while len(self._pending) >= frame_bytes:
+            frames.append(self._process_frame(bytes(self._pending[:frame_bytes])))
+            del self._pending[:frame_bytes]
+        
+        return frames
+    
+    def flush(self) -> List[bytes]:
+        """Process whatever is left of the stream as a final, shorter frame"""
+        usable = len(self._pending) - len(self._pending) % 2
+        frames = [self._process_frame(bytes(self._pending[:usable]))] if usable else []
+        self._pending.clear()
+        return frames
+    
+    def _process_frame(self, frame_bytes: bytes) -> bytes:
+        samples = AudioProcessor._samples(frame_bytes)
+        self.accumulator.update(samples)
+        stats = self.accumulator.result()
+        self.quality = AudioProcessor.quality_from_statistics(stats)
+        self.frames_processed += 1
+        
+        if self.quality not in [AudioQuality.POOR, AudioQuality.VERY_POOR]:
+            return frame_bytes
+        
+        count = len(samples)
+        AudioProcessor._enhance_frame(
+            samples, stats.gate_threshold, AudioProcessor._signal_gain(stats.peak),
+            self._scratch[:count], self._magnitude[:count], self._gated[:count]
+        )
+        self._enhanced[:count] = self._scratch[:count]
+        self.frames_enhanced += 1
+        return self._enhanced[:count].tobytes()
+
+class CharNgramLanguageModel:
+    """Character n-gram language identifier backed by precomputed log-probability tables
+
+    Words are padded with spaces and cut into 1-3 character n-grams. Every
+    n-gram seen in the reference text gets a column in a
+    [languages x n-grams] float32 table of smoothed log-probabilities, so a text
+    is scored against all languages at once by gathering its n-gram columns and
+    summing them. N-grams no language has seen carry no evidence and are skipped.
+
+    N-grams of one text are far from independent, so posteriors come from the
+    per-n-gram average log-likelihood scaled by POSTERIOR_SCALE rather than the
+    raw sum, which would put almost any text at confidence 1.0.
+    """
+
+    NGRAM_ORDERS = (1, 2, 3)
+    SMOOTHING = 0.5
+    POSTERIOR_SCALE = 8.0  # mean confidence roughly tracks accuracy on held-out utterances
+    COLUMN_CACHE_SIZE = 50000
+    _SEPARATORS = re.compile(r"[\W\d_]+")
+
+    def __init__(self, reference_texts: Dict[str, List[str]]):
+        self.languages = [lang for lang, texts in reference_texts.items() if texts]
+        self.feature_index: Dict[str, int] = {}
+        self._column_cache: Dict[str, List[int]] = {}
+
+        language_counts = []
+        for lang in self.languages:
+            counts: Dict[int, int] = {}
+            for text in reference_texts[lang]:
+                for word in self.words(text):
+                    for ngram in self._ngrams(word):
+                        column = self.feature_index.setdefault(ngram, len(self.feature_index))
+                        counts[column] = counts.get(column, 0) + 1
+            language_counts.append(counts)
+
+        table = np.zeros((len(self.languages), len(self.feature_index)), dtype=np.float64)
+        for row, counts in enumerate(language_counts):
+            columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            table[row, columns] = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+
+        totals = table.sum(axis=1, keepdims=True)
+        vocabulary_size = max(1, len(self.feature_index))
+        self.log_probs = np.log(
+            (table + self.SMOOTHING) / (totals + self.SMOOTHING * vocabulary_size)
+        ).astype(np.float32)
+
+    @classmethod
+    def from_language_config(cls, extra_texts: Optional[Dict[str, List[str]]] = None) -> 'CharNgramLanguageModel':
+        """Build the model from the phrases and keywords in AfricanLanguageConfig"""
+        reference_texts: Dict[str, List[str]] = {}
+        for lang_code in AfricanLanguageConfig.LANGUAGES:
+            texts = list(AfricanLanguageConfig.SAMPLE_PHRASES.get(lang_code, []))
+            for words in AfricanLanguageConfig.BUSINESS_KEYWORDS.get(lang_code, {}).values():
+                texts.extend(words)
+            if extra_texts:
+                texts.extend(extra_texts.get(lang_code, []))
+            reference_texts[lang_code] = texts
+        return cls(reference_texts)
+
+    @classmethod
+    def words(cls, text: str) -> List[str]:
+        """Lowercase and split on anything that is not a letter"""
+        return cls._SEPARATORS.sub(' ', text.lower()).split()
+
+    @classmethod
+    def _ngrams(cls, word: str) -> List[str]:
+        padded = f' {word} '
+        return [padded[i:i + order] for order in cls.NGRAM_ORDERS
+                for i in range(len(padded) - order + 1) if padded[i:i + order] != ' ']
+
+    def _word_columns(self, word: str) -> List[int]:
+        columns = self._column_cache.get(word)
+        if columns is None:
+            feature_index = self.feature_index
+            columns = [feature_index[ngram] for ngram in self._ngrams(word) if ngram in feature_index]
+            if len(self._column_cache) >= self.COLUMN_CACHE_SIZE:
+                self._column_cache.clear()
+            self._column_cache[word] = columns
+        return columns
+
+    def _columns(self, text: str) -> List[int]:
+        columns: List[int] = []
+        for word in self.words(text):
+            columns.extend(self._word_columns(word))
+        return columns
+
+    def score_many(self, texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ([texts x languages] log-likelihoods, known n-gram count per text)"""
+        column_lists = [self._columns(text) for text in texts]
+        lengths = np.fromiter((len(columns) for columns in column_lists), dtype=np.int64, count=len(texts))
+        scores = np.zeros((len(texts), len(self.languages)), dtype=np.float32)
+
+        if lengths.sum() == 0:
+            return scores, lengths
+
+        all_columns = np.fromiter((c for columns in column_lists for c in columns), dtype=np.int64,
+                                  count=int(lengths.sum()))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        non_empty = lengths > 0
+        # One gather over every text's n-grams, then a segmented sum per text
+        gathered = self.log_probs[:, all_columns]
+        scores[non_empty] = np.add.reduceat(gathered, offsets[non_empty], axis=1).T
+        return scores, lengths
+
+    def predict_many(self, texts: List[str]) -> List[Optional[Tuple[str, float]]]:
+        """Best (language, posterior) per text, or None when a text has no known n-grams"""
+        if not texts or not self.languages:
+            return [None] * len(texts)
+
+        scores, lengths = self.score_many(texts)
+        scores = scores * (self.POSTERIOR_SCALE / np.maximum(lengths, 1))[:, None]
+        best = np.argmax(scores, axis=1)
+        shifted = np.exp(scores - scores[np.arange(len(texts)), best][:, None])
+        posteriors = 1.0 / shifted.sum(axis=1)
+
+        return [
+            (self.languages[best[i]], float(posteriors[i])) if lengths[i] else None
+            for i in range(len(texts))
+        ]
+
+    def predict(self, text: str) -> Optional[Tuple[str, float]]:
+        return self.predict_many([text])[0]
+
 class LanguageDetector:
     """Detect African languages from speech patterns"""
     
+    COMMON_WORDS = {
+        'sw': ['na', 'ya', 'wa', 'ni', 'kwa', 'mimi', 'wewe'],
+        'zu': ['ngi', 'nga', 'ku', 'e', 'o', 'mina', 'wena'],
+        'yo': ['mi', 'ni', 'ti', 'si', 'ki', 'emi', 'iwo'],
+        'ig': ['m', 'na', 'ka', 'ga', 'nke', 'mu', 'gi'],
+        'ha': ['na', 'da', 'a', 'ta', 'ya', 'ni', 'ka'],
+        'ar': ['wa', 'fi', 'min', 'ila', 'an', 'la', 'ma'],
+        'am': ['na', 'ka', 'ba', 'la', 'sa', 'ta', 'ma']
+    }
+
+    _model: Optional[CharNgramLanguageModel] = None
+
     def __init__(self):
         self.language_patterns = self._load_language_patterns()
+
+    @classmethod
+    def get_model(cls) -> CharNgramLanguageModel:
+        """Return the shared n-gram model, building its tables on first use"""
+        if cls._model is None:
+            cls._model = CharNgramLanguageModel.from_language_config(cls.COMMON_WORDS)
+        return cls._model
     
     def _load_language_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load language-specific patterns for detection"""
@@ -295,51 +648,28 @@ class LanguageDetector:
     
     def _get_common_words(self, lang_code: str) -> List[str]:
         """Get common words for language detection"""
-        common_words = {
-            'sw': ['na', 'ya', 'wa', 'ni', 'kwa', 'mimi', 'wewe'],
-            'zu': ['ngi', 'nga', 'ku', 'e', 'o', 'mina', 'wena'],
-            'yo': ['mi', 'ni', 'ti', 'si', 'ki', 'emi', 'iwo'],
-            'ig': ['m', 'na', 'ka', 'ga', 'nke', 'mu', 'gi'],
-            'ha': ['na', 'da', 'a', 'ta', 'ya', 'ni', 'ka'],
-            'ar': ['wa', 'fi', 'min', 'ila', 'an', 'la', 'ma'],
-            'am': ['na', 'ka', 'ba', 'la', 'sa', 'ta', 'ma']
-        }
-        return common_words.get(lang_code, [])
+        return self.COMMON_WORDS.get(lang_code, [])
     
     def detect_language(self, text: str, audio_features: Optional[Dict] = None) -> Tuple[str, float]:
         """Detect language from text and optional audio features"""
-        scores = {}
-        
-        for lang_code, patterns in self.language_patterns.items():
-            score = 0
-            
-            # Check common words
-            words = text.lower().split()
-            common_word_matches = sum(1 for word in words if word in patterns['common_words'])
-            score += common_word_matches * 10
-            
-            # Check phonetic patterns (simplified)
-            for pattern in patterns['phonetic_patterns']:
-                if pattern in text.lower():
-                    score += 5
-            
-            # Normalize by text length
-            if len(words) > 0:
-                score = score / len(words)
-            
-            scores[lang_code] = score
-        
-        # Find best match
-        if scores:
-            best_lang = max(scores, key=scores.get)
-            confidence = min(1.0, scores[best_lang])
-            return best_lang, confidence
-        
-        return 'sw', 0.1  # Default to Swahili with low confidence
+        return self.detect_languages([text])[0]
+
+    def detect_languages(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """Detect the language of many texts in one scoring pass"""
+        try:
+            predictions = self.get_model().predict_many(texts)
+        except Exception as e:
+            logger.error(f"Language detection failed: {e}")
+            predictions = [None] * len(texts)
+
+        # Default to Swahili with low confidence when there is nothing to go on
+        return [prediction or ('sw', 0.1) for prediction in predictions]
 
 class VoiceRecognitionEngine:
     """Main voice recognition engine for African languages"""
     
+    STREAM_DETECTION_WORDS = 40  # partial results detect the language on this many trailing words
+    
     def __init__(self):
         self.audio_processor = AudioProcessor()
         self.language_detector = LanguageDetector()
@@ -359,10 +689,10 @@ class VoiceRecognitionEngine:
             # Update stats
             self.performance_stats['total_requests'] += 1
             
-            # Assess and enhance audio quality
-            quality = self.audio_processor.assess_audio_quality(voice_input.audio_data)
+            # Assess and enhance audio quality from a single analysis pass
+            quality, audio_stats = self.audio_processor.assess_with_statistics(voice_input.audio_data)
             enhanced_audio = self.audio_processor.enhance_audio_for_recognition(
-                voice_input.audio_data, quality
+                voice_input.audio_data, quality, audio_stats
             )
             
             # Perform speech recognition
@@ -425,6 +755,112 @@ class VoiceRecognitionEngine:
                 }
             )
     
+    async def recognize_speech_stream(self, audio_chunks: AsyncIterable[bytes], language_code: str,
+                                      user_id: Optional[str] = None,
+                                      context: Optional[Dict[str, Any]] = None,
+                                      frame_size: Optional[int] = None) -> AsyncIterator[RecognitionResult]:
+        """Recognize speech incrementally from an async stream of 16-bit PCM chunks
+        
+        Yields a partial RecognitionResult (metadata['is_final'] False) for each
+        frame as soon as it is recognized, then one final result with the full
+        transcript. Callers can act on a partial result, such as a POS voice
+        command, before the speaker has finished.
+        """
+        start_time = datetime.now()
+        processor = StreamingAudioProcessor(frame_size)
+        segments = []
+        
+        try:
+            # Update stats
+            self.performance_stats['total_requests'] += 1
+            
+            async for chunk in audio_chunks:
+                for enhanced_frame in processor.feed(chunk):
+                    await self._recognize_stream_segment(enhanced_frame, language_code, segments)
+                    yield await self._build_stream_result(
+                        processor, segments, language_code, start_time, user_id, context, is_final=False
+                    )
+            
+            for enhanced_frame in processor.flush():
+                await self._recognize_stream_segment(enhanced_frame, language_code, segments)
+            
+            result = await self._build_stream_result(
+                processor, segments, language_code, start_time, user_id, context, is_final=True
+            )
+            
+            # Update performance stats
+            self.performance_stats['successful_recognitions'] += 1
+            self._update_average_processing_time(result.processing_time)
+            self._update_language_distribution(result.language_detected)
+            
+            yield result
+            
+        except Exception as e:
+            logger.error(f"Streaming speech recognition failed: {e}")
+            
+            # Return error result
+            yield RecognitionResult(
+                text=" ".join(segments),
+                confidence=0.0,
+                language_detected=language_code or 'sw',
+                language_family=LanguageFamily.NIGER_CONGO,
+                processing_time=(datetime.now() - start_time).total_seconds(),
+                quality_score=0.0,
+                alternatives=[],
+                metadata={
+                    'error': str(e),
+                    'is_final': True,
+                    'timestamp': start_time.isoformat()
+                }
+            )
+    
+    async def _recognize_stream_segment(self, audio_data: bytes, language_code: str, segments: List[str]):
+        """Recognize one enhanced frame and append its text to the running transcript"""
+        segment_text = await self._perform_recognition(audio_data, language_code)
+        if segment_text:
+            segments.append(segment_text)
+    
+    async def _build_stream_result(self, processor: StreamingAudioProcessor, segments: List[str],
+                                   language_code: str, start_time: datetime, user_id: Optional[str],
+                                   context: Optional[Dict[str, Any]], is_final: bool) -> RecognitionResult:
+        """Build a partial or final result from the transcript recognized so far"""
+        transcript = " ".join(segments)
+        # Partial results only look at the tail so each frame costs the same;
+        # the final result scores the whole transcript once
+        detection_text = transcript if is_final else self._transcript_tail(segments)
+        detected_lang, lang_confidence = self.language_detector.detect_language(detection_text)
+        lang_info = AfricanLanguageConfig.LANGUAGES.get(detected_lang, {})
+        
+        return RecognitionResult(
+            text=transcript,
+            confidence=lang_confidence,
+            language_detected=detected_lang,
+            language_family=lang_info.get('family', LanguageFamily.NIGER_CONGO),
+            processing_time=(datetime.now() - start_time).total_seconds(),
+            quality_score=self._calculate_quality_score(processor.quality, lang_confidence),
+            alternatives=await self._get_alternatives(b"", detected_lang) if is_final else [],
+            metadata={
+                'original_language': language_code,
+                'audio_quality': processor.quality.value,
+                'enhancement_applied': processor.frames_enhanced > 0,
+                'is_final': is_final,
+                'segment_index': processor.frames_processed - 1,
+                'audio_seconds': processor.samples_processed / AudioProcessor.SAMPLE_RATE,
+                'timestamp': start_time.isoformat(),
+                'user_id': user_id,
+                'context': context
+            }
+        )
+    
+    def _transcript_tail(self, segments: List[str]) -> str:
+        """The last STREAM_DETECTION_WORDS words of the transcript"""
+        words: List[str] = []
+        for segment in reversed(segments):
+            words = segment.split() + words
+            if len(words) >= self.STREAM_DETECTION_WORDS:
+                break
+        return " ".join(words[-self.STREAM_DETECTION_WORDS:])
+    
     async def _perform_recognition(self, audio_data: bytes, language_code: str) -> str:
         """Perform actual speech recognition using AI providers"""
         try:
@@ -5,7 +5,9 @@ Coordinates between Eden AI, Hugging Face, and OpenRouter for optimal performanc
 
 import os
 import asyncio
+import functools
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -18,6 +20,11 @@ from .openrouter_client import OpenRouterClient, OpenRouterResponse
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait on the first provider before hedging with the next one
+HEDGE_DELAY_SECONDS = float(os.getenv('AI_HEDGE_DELAY_SECONDS', '2.0'))
+# Threads available for blocking provider calls made from the async mode
+PROVIDER_CALL_WORKERS = int(os.getenv('AI_PROVIDER_CALL_WORKERS', '32'))
+
 class AIProvider(Enum):
     EDEN_AI = "eden_ai"
     HUGGINGFACE = "huggingface"
@@ -71,6 +78,11 @@ class AIOrchestrator:
         self.huggingface = HuggingFaceClient()
         self.openrouter = OpenRouterClient()
         
+        # Async mode runs the blocking provider clients on a bounded pool
+        self.hedge_delay = HEDGE_DELAY_SECONDS
+        self._executor = ThreadPoolExecutor(max_workers=PROVIDER_CALL_WORKERS,
+                                            thread_name_prefix="ai-provider")
+        
         # Provider configurations
         self.provider_configs = {
             AIProvider.EDEN_AI: ProviderConfig(enabled=True, priority=1),
@@ -105,6 +117,9 @@ class AIOrchestrator:
             "successful_requests": 0,
             "failed_requests": 0,
             "average_response_time": 0.0,
+            "hedged_requests": 0,
+            "cancelled_requests": 0,
+            "abandoned_requests": 0,
             "provider_performance": {provider.value: {"requests": 0, "successes": 0, "avg_time": 0.0} 
                                    for provider in AIProvider}
         }
@@ -127,48 +142,14 @@ class AIOrchestrator:
             
             for provider in providers:
                 try:
-                    if provider == AIProvider.OPENROUTER:
-                        response = self.openrouter.chat_completion(
-                            messages=messages,
-                            model=model,
-                            max_tokens=max_tokens,
-                            temperature=temperature,
-                            use_free_model=cost_optimize,
-                            african_context=african_context
-                        )
-                        
-                        if response.success:
-                            return self._create_unified_response(
-                                response, provider, start_time, fallback_used=provider != providers[0]
-                            )
-                    
-                    elif provider == AIProvider.EDEN_AI:
-                        response = self.eden_ai.chat_completion(
-                            messages=messages,
-                            model=model or "openai/gpt-3.5-turbo",
-                            max_tokens=max_tokens,
-                            temperature=temperature,
-                            optimize_cost=cost_optimize
-                        )
-                        
-                        if response.success:
-                            return self._create_unified_response(
-                                response, provider, start_time, fallback_used=provider != providers[0]
-                            )
+                    response = self._call_chat_provider(
+                        provider, messages, model, max_tokens, temperature, african_context, cost_optimize
+                    )
                     
-                    elif provider == AIProvider.HUGGINGFACE:
-                        response = self.huggingface.chat_completion(
-                            messages=messages,
-                            model=model or "microsoft/DialoGPT-medium",
-                            max_tokens=max_tokens,
-                            temperature=temperature,
-                            african_context=african_context
+                    if response.success:
+                        return self._create_unified_response(
+                            response, provider, start_time, fallback_used=provider != providers[0]
                         )
-                        
-                        if response.success:
-                            return self._create_unified_response(
-                                response, provider, start_time, fallback_used=provider != providers[0]
-                            )
                 
                 except Exception as e:
                     logger.warning(f"Provider {provider.value} failed: {str(e)}")
@@ -197,6 +178,156 @@ class AIOrchestrator:
                 error=str(e)
             )
     
+    async def chat_completion_async(self, 
+                                    messages: List[Dict[str, str]], 
+                                    model: Optional[str] = None,
+                                    max_tokens: int = 1000,
+                                    temperature: float = 0.7,
+                                    african_context: bool = True,
+                                    cost_optimize: bool = True,
+                                    hedge_delay: Optional[float] = None) -> UnifiedResponse:
+        """
+        Non-blocking chat completion with hedged fallback
+        
+        The top-ranked provider is called first. If it has not answered within
+        the hedge delay, the next provider is started alongside it; a failed
+        attempt starts the next provider straight away. The first successful
+        response wins.
+        
+        Provider clients are blocking, so each attempt runs on the provider
+        thread pool. Losers still queued for a thread are cancelled, but a call
+        already running can't be interrupted: it keeps its pool thread and is
+        billed by the provider until it returns, and its result is discarded
+        (counted as abandoned_requests). This cuts the caller's tail latency,
+        not the provider calls made.
+        """
+        start_time = time.time()
+        hedge_delay = self.hedge_delay if hedge_delay is None else hedge_delay
+        pending: Dict[asyncio.Future, AIProvider] = {}
+        calls: Dict[asyncio.Future, Future] = {}  # pool future behind each pending attempt
+        
+        try:
+            providers = self._select_providers(TaskType.CHAT, cost_optimize)
+            remaining = list(providers)
+            loop = asyncio.get_running_loop()
+            
+            def launch_next():
+                provider = remaining.pop(0)
+                call = functools.partial(
+                    self._call_chat_provider,
+                    provider, messages, model, max_tokens, temperature, african_context, cost_optimize
+                )
+                call_future = self._executor.submit(call)
+                attempt = asyncio.wrap_future(call_future, loop=loop)
+                pending[attempt] = provider
+                calls[attempt] = call_future
+            
+            while remaining or pending:
+                if not pending:
+                    launch_next()
+                
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                if not done:
+                    # Latency budget spent - hedge with the next provider
+                    self.performance_tracker["hedged_requests"] += 1
+                    launch_next()
+                    continue
+                
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logger.warning(f"Provider {provider.value} failed: {str(e)}")
+                        continue
+                    
+                    if response.success:
+                        return self._create_unified_response(
+                            response, provider, start_time, fallback_used=provider != providers[0]
+                        )
+                
+                if remaining:
+                    launch_next()
+            
+            # All providers failed
+            return UnifiedResponse(
+                success=False,
+                data=None,
+                provider="none",
+                model=model or "unknown",
+                cost=0.0,
+                response_time=time.time() - start_time,
+                error="All AI providers failed"
+            )
+            
+        except Exception as e:
+            logger.error(f"AI Orchestrator async chat completion error: {str(e)}")
+            return UnifiedResponse(
+                success=False,
+                data=None,
+                provider="orchestrator",
+                model=model or "unknown",
+                cost=0.0,
+                response_time=time.time() - start_time,
+                error=str(e)
+            )
+        
+        finally:
+            # Losers still waiting for a thread are cancelled; calls already
+            # running can't be stopped, so they finish in the pool and are discarded
+            for attempt in pending:
+                if calls[attempt].cancel():
+                    self.performance_tracker["cancelled_requests"] += 1
+                else:
+                    self.performance_tracker["abandoned_requests"] += 1
+                attempt.cancel()
+    
+    def _call_chat_provider(self, 
+                            provider: AIProvider, 
+                            messages: List[Dict[str, str]], 
+                            model: Optional[str],
+                            max_tokens: int,
+                            temperature: float,
+                            african_context: bool,
+                            cost_optimize: bool) -> Union[AIResponse, HFResponse, OpenRouterResponse]:
+        """
+        Make one blocking chat call to a provider
+        """
+        if provider == AIProvider.OPENROUTER:
+            return self.openrouter.chat_completion(
+                messages=messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                use_free_model=cost_optimize,
+                african_context=african_context
+            )
+        
+        if provider == AIProvider.EDEN_AI:
+            return self.eden_ai.chat_completion(
+                messages=messages,
+                model=model or "openai/gpt-3.5-turbo",
+                max_tokens=max_tokens,
+                temperature=temperature,
+                optimize_cost=cost_optimize
+            )
+        
+        if provider == AIProvider.HUGGINGFACE:
+            return self.huggingface.chat_completion(
+                messages=messages,
+                model=model or "microsoft/DialoGPT-medium",
+                max_tokens=max_tokens,
+                temperature=temperature,
+                african_context=african_context
+            )
+        
+        raise ValueError(f"Unsupported chat provider: {provider.value}")
+    
     def african_voice_processing(self, 
                                audio_data: bytes, 
                                language: str = "en",
@@ -7,13 +7,19 @@ import json
 import logging
 import asyncio
 import aiohttp
+import time
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime, timedelta
 import os
+import sys
 from abc import ABC, abstractmethod
 
+# ProviderHealth lives with the backend AI ecosystem integration, which uses it too
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'backend'))
+from provider_health import ProviderHealth
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -703,6 +709,7 @@ class AIProviderManager:
         self.provider_configs: Dict[str, AIProviderConfig] = {}
         self.load_balancer_weights: Dict[str, float] = {}
         self.cost_tracker: Dict[str, float] = {}
+        self.provider_health: Dict[str, ProviderHealth] = {}
         
     def register_provider(self, config: AIProviderConfig, provider_class: type):
         """Register a new AI provider"""
@@ -712,6 +719,7 @@ class AIProviderManager:
             self.provider_configs[config.provider_id] = config
             self.load_balancer_weights[config.provider_id] = 1.0
             self.cost_tracker[config.provider_id] = 0.0
+            self.provider_health[config.provider_id] = ProviderHealth(prior_cost=config.cost_per_request)
             
             logger.info(f"Registered AI provider: {config.provider_id}")
             return True
@@ -769,23 +777,18 @@ class AIProviderManager:
                         if max_cost and config.cost_per_request > max_cost:
                             continue
                     
-                    # Calculate score based on performance and cost
-                    performance_score = (
-                        provider.metrics.uptime_percentage * 0.4 +
-                        (100 - provider.metrics.average_response_time) * 0.3 +
-                        (provider.metrics.successful_requests / max(provider.metrics.total_requests, 1)) * 100 * 0.3
-                    )
-                    
-                    cost_score = 100 - (config.cost_per_request * 1000)  # Lower cost = higher score
-                    
-                    total_score = (performance_score * 0.7 + cost_score * 0.3) * self.load_balancer_weights[provider_id]
+                    # Skip providers whose circuit breaker is open
+                    if not self.provider_health[provider_id].is_available():
+                        continue
                     
-                    suitable_providers.append((provider_id, total_score))
+                    suitable_providers.append((provider_id, self._score_provider(provider_id)))
             
             if suitable_providers:
                 # Sort by score and return the best
                 suitable_providers.sort(key=lambda x: x[1], reverse=True)
-                return suitable_providers[0][0]
+                best_provider = suitable_providers[0][0]
+                self.provider_health[best_provider].begin_request()
+                return best_provider
             
             return None
             
@@ -793,6 +796,22 @@ class AIProviderManager:
             logger.error(f"Error selecting best provider: {e}")
             return None
     
+    def record_provider_result(self, provider_id: str, latency: float, success: bool, cost: float = 0.0):
+        """Feed the outcome of a request made outside process_with_fallback into provider scoring"""
+        health = self.provider_health.get(provider_id)
+        if health is None:
+            return
+        if success:
+            health.record_success(latency, cost)
+        else:
+            health.record_failure(latency)
+    
+    def _score_provider(self, provider_id: str) -> float:
+        """Blend live reliability, latency and cost into a selection score (higher is better)"""
+        health = self.provider_health[provider_id]
+        cost_score = 1.0 / (1.0 + health.cost_ewma * 100)  # Lower cost = higher score
+        return (health.score() * 0.7 + cost_score * 0.3) * self.load_balancer_weights[provider_id]
+    
     async def process_with_fallback(self, provider_type: AIProviderType, 
                                    request_data: Dict[str, Any],
                                    requirements: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -805,39 +824,43 @@ class AIProviderManager:
                 if config.provider_type == provider_type:
                     provider = self.providers[provider_id]
                     
-                    if provider.status == AIProviderStatus.ACTIVE:
-                        # Calculate score
-                        performance_score = (
-                            provider.metrics.uptime_percentage * 0.4 +
-                            (100 - provider.metrics.average_response_time) * 0.3 +
-                            (provider.metrics.successful_requests / max(provider.metrics.total_requests, 1)) * 100 * 0.3
-                        )
-                        
-                        cost_score = 100 - (config.cost_per_request * 1000)
-                        total_score = (performance_score * 0.7 + cost_score * 0.3) * self.load_balancer_weights[provider_id]
-                        
-                        suitable_providers.append((provider_id, total_score))
+                    if provider.status == AIProviderStatus.ACTIVE and self.provider_health[provider_id].is_available():
+                        suitable_providers.append((provider_id, self._score_provider(provider_id)))
             
             # Sort by score
             suitable_providers.sort(key=lambda x: x[1], reverse=True)
             
             # Try each provider in order
             for provider_id, _ in suitable_providers:
+                health = self.provider_health[provider_id]
+                if not health.is_available():
+                    continue  # another request is already probing it
+                health.begin_request()
+                started = time.monotonic()
+                
                 try:
                     provider = self.providers[provider_id]
                     result = await provider.process_request(request_data)
                     
                     if result.get('success'):
                         # Update cost tracking
-                        self.cost_tracker[provider_id] += self.provider_configs[provider_id].cost_per_request
+                        cost = self.provider_configs[provider_id].cost_per_request
+                        self.cost_tracker[provider_id] += cost
+                        health.record_success(time.monotonic() - started, cost)
                         return result
                     else:
+                        health.record_failure(time.monotonic() - started)
                         logger.warning(f"Provider {provider_id} failed: {result.get('error')}")
                         continue
                         
                 except Exception as e:
+                    health.record_failure(time.monotonic() - started)
                     logger.error(f"Error with provider {provider_id}: {e}")
                     continue
+                except BaseException:
+                    # Cancelled: no outcome to record, but don't hold the half-open probe
+                    health.release_probe()
+                    raise
             
             return {
                 'success': False,
@@ -876,7 +899,8 @@ class AIProviderManager:
                         'african_language_support': provider.config.african_language_support,
                         'cultural_adaptation': provider.config.cultural_adaptation
                     },
-                    'total_cost': self.cost_tracker[provider_id]
+                    'total_cost': self.cost_tracker[provider_id],
+                    'health': self.provider_health[provider_id].snapshot()
                 }
                 
                 metrics['providers'][provider_id] = provider_metrics
@@ -919,6 +943,7 @@ __all__ = [
     'ElevenLabsProvider',
     'AssemblyAIProvider',
     'AIProviderManager',
+    'ProviderHealth',
     'ai_provider_manager'
 ]
 
@@ -170,6 +170,49 @@ class LanguageProfile:
     traditional_greetings: List[str]
     common_phrases: Dict[str, str]
 
+class StageLatencyHistogram:
+    """Bucketed latency histogram for one voice pipeline stage"""
+    
+    BUCKET_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)  # last bucket is overflow
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, latency_ms: float):
+        index = 0
+        while index < len(self.BUCKET_BOUNDS_MS) and latency_ms > self.BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+    
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return None
+        threshold = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= threshold:
+                return float(self.BUCKET_BOUNDS_MS[index]) if index < len(self.BUCKET_BOUNDS_MS) else self.max_ms
+        return self.max_ms
+    
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts))
+        }
+
 class ComprehensiveAIIntegration:
     """Comprehensive AI integration and voice interface system"""
     
@@ -180,6 +223,7 @@ class ComprehensiveAIIntegration:
         self.cultural_intelligence = {}
         self.ubuntu_wisdom_base = {}
         self.traditional_knowledge = {}
+        self.stage_latencies: Dict[str, StageLatencyHistogram] = {}
         
         # Initialize AI providers
         self._initialize_ai_providers()
@@ -579,24 +623,36 @@ class ComprehensiveAIIntegration:
         logger.info(f"Initialized {len(self.ml_models)} machine learning models")
     
     async def process_voice_command(self, audio_data: bytes, language: AfricanLanguage, user_id: str) -> AIResponse:
-        """Process voice command in specified African language"""
+        """Process voice command in specified African language
+        
+        Runs as a staged pipeline: speech recognition, then intent, entities,
+        sentiment and cultural analysis concurrently on the transcript, then
+        response generation alongside the wisdom and knowledge lookups.
+        """
+        pipeline_start = time.perf_counter()
         
         try:
             # Speech recognition
             voice_interface = self.voice_interfaces[language]
-            recognized_text = await voice_interface.recognize_speech(audio_data)
+            recognized_text = await self._timed_stage(
+                "speech_recognition", voice_interface.recognize_speech(audio_data)
+            )
             
             if not recognized_text:
                 return self._create_error_response("Speech recognition failed", language)
             
-            # Intent recognition
-            intent_result = await self.ml_models["intent_recognition"].predict(recognized_text, language)
-            
-            # Entity extraction
-            entities = await self.ml_models["entity_extraction"].extract(recognized_text, language)
-            
-            # Cultural context analysis
-            cultural_context = await self.ml_models["cultural_context"].analyze(recognized_text, language)
+            # Text analysis stages only depend on the transcript
+            intent_result, entities, sentiment, cultural_context = await asyncio.gather(
+                self._timed_stage("intent_recognition",
+                                  self.ml_models["intent_recognition"].predict(recognized_text, language)),
+                self._timed_stage("entity_extraction",
+                                  self.ml_models["entity_extraction"].extract(recognized_text, language)),
+                self._timed_stage("sentiment_analysis",
+                                  self.ml_models["sentiment_analysis"].analyze(recognized_text, language)),
+                self._timed_stage("cultural_context",
+                                  self.ml_models["cultural_context"].analyze(recognized_text, language))
+            )
+            cultural_context = {**cultural_context, "sentiment": sentiment}
             
             # Create voice command object
             voice_command = VoiceCommand(
@@ -618,6 +674,9 @@ class ComprehensiveAIIntegration:
         except Exception as e:
             logger.error(f"Error processing voice command: {e}")
             return self._create_error_response(f"Error processing command: {str(e)}", language)
+        
+        finally:
+            self._record_stage_latency("total", (time.perf_counter() - pipeline_start) * 1000)
     
     async def _process_command_with_ai(self, command: VoiceCommand, cultural_context: Dict[str, Any]) -> AIResponse:
         """Process command using AI providers with cultural intelligence"""
@@ -626,20 +685,21 @@ class ComprehensiveAIIntegration:
         ai_provider = self._select_ai_provider(command.intent)
         
         # Prepare context with Ubuntu wisdom and traditional knowledge
-        enhanced_context = await self._enhance_with_cultural_intelligence(command, cultural_context)
-        
-        # Generate AI response
-        ai_response_text = await ai_provider.generate_response(
-            command.command_text,
-            command.language,
-            enhanced_context
+        enhanced_context = await self._timed_stage(
+            "context_enhancement", self._enhance_with_cultural_intelligence(command, cultural_context)
         )
         
-        # Add Ubuntu wisdom if appropriate
-        ubuntu_wisdom = await self._get_relevant_ubuntu_wisdom(command, cultural_context)
-        
-        # Add traditional knowledge if relevant
-        traditional_knowledge = await self._get_relevant_traditional_knowledge(command, cultural_context)
+        # Generate the AI response while the Ubuntu wisdom and traditional knowledge are looked up
+        ai_response_text, ubuntu_wisdom, traditional_knowledge = await asyncio.gather(
+            self._timed_stage("response_generation", ai_provider.generate_response(
+                command.command_text,
+                command.language,
+                enhanced_context
+            )),
+            self._timed_stage("ubuntu_wisdom", self._get_relevant_ubuntu_wisdom(command, cultural_context)),
+            self._timed_stage("traditional_knowledge",
+                              self._get_relevant_traditional_knowledge(command, cultural_context))
+        )
         
         # Create AI response
         response = AIResponse(
@@ -655,6 +715,24 @@ class ComprehensiveAIIntegration:
         
         return response
     
+    async def _timed_stage(self, stage: str, awaitable) -> Any:
+        """Await one pipeline stage and record how long it took"""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record_stage_latency(stage, (time.perf_counter() - start) * 1000)
+    
+    def _record_stage_latency(self, stage: str, latency_ms: float):
+        histogram = self.stage_latencies.get(stage)
+        if histogram is None:
+            histogram = self.stage_latencies[stage] = StageLatencyHistogram()
+        histogram.record(latency_ms)
+    
+    def get_pipeline_metrics(self) -> Dict[str, Any]:
+        """Per-stage latency histograms for the voice command pipeline"""
+        return {stage: histogram.snapshot() for stage, histogram in self.stage_latencies.items()}
+    
     def _select_ai_provider(self, intent: str) -> Any:
         """Select appropriate AI provider based on intent"""
         